@@ -0,0 +1,104 @@
+"""Memory held by a large task collection as models.Task instances and as CompactTasks.
+
+Generates synthetic tasks shaped like a ``get_team_tasks`` response, with statuses,
+assignees, lists and custom field definitions drawn from small shared sets as in a
+real workspace, and measures the memory still allocated (``tracemalloc``) after
+holding all of them as ``models.Task`` instances and as a ``CompactTasks``
+collection. Tasks are built with ``models.construct`` and handed over one at a
+time, so the raw payloads are not counted.
+
+Usage:
+    python benchmarks/bench_compact.py [tasks]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from clickupython import models
+from clickupython.compact import CompactTasks
+
+STATUSES = [
+    {"status": name, "color": color, "type": kind, "orderindex": index}
+    for index, (name, color, kind) in enumerate(
+        [
+            ("to do", "#d3d3d3", "open"),
+            ("in progress", "#4194f6", "custom"),
+            ("review", "#a875ff", "custom"),
+            ("complete", "#6bc950", "closed"),
+        ]
+    )
+]
+USERS = [
+    {"id": str(1000 + n), "username": f"User {n}", "color": "#827718", "initials": f"U{n}"}
+    for n in range(25)
+]
+
+
+def synthetic_task(n: int) -> dict:
+    return {
+        "id": f"t{n:07d}",
+        "name": f"Task {n}",
+        "text_content": "Follow up with the customer",
+        "description": "Follow up with the customer",
+        "status": STATUSES[n % len(STATUSES)],
+        "orderindex": f"{n % 50}.0000",
+        "date_created": str(1650000000000 + n * 1000),
+        "date_updated": str(1650000500000 + n * 1000),
+        "creator": {"id": 183, "username": "Jane", "color": "#827718"},
+        "assignees": [USERS[n % 25], USERS[(n * 7) % 25]],
+        "tags": [{"name": "bug", "tag_fg": "#fff", "tag_bg": "#000"}],
+        "checklists": [],
+        "priority": {"id": "2", "priority": "high", "color": "#ffcc00", "orderindex": "2"},
+        "due_date": str(1660000000000 + (n % 90) * 86400000),
+        "custom_fields": [
+            {
+                "id": f"field{f}",
+                "name": f"Field {f}",
+                "type": "number",
+                "date_created": "1650000000000",
+                "hide_from_guests": False,
+                "value": str(n % 10),
+                "required": False,
+            }
+            for f in range(4)
+        ],
+        "list": {"id": str(124 + n % 20)},
+        "folder": {"id": str(457 + n % 5), "name": f"Folder {n % 5}"},
+        "space": {"id": "789"},
+        "url": f"https://app.clickup.com/t/t{n:07d}",
+    }
+
+
+def generate(count: int):
+    for n in range(count):
+        yield models.construct(models.Task, synthetic_task(n))
+
+
+def measure(hold, count: int):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    held = hold(generate(count))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held, current, elapsed
+
+
+def main(count: int = 100_000):
+    tasks, task_bytes, task_seconds = measure(list, count)
+    del tasks
+    compact, compact_bytes, compact_seconds = measure(CompactTasks, count)
+
+    print(f"tasks:                   {count}")
+    print(f"models.Task:             {task_bytes / 2**20:.1f} MiB, {task_bytes / count:.0f} B/task, {task_seconds:.1f} s")
+    print(f"CompactTasks:            {compact_bytes / 2**20:.1f} MiB, {compact_bytes / count:.0f} B/task, {compact_seconds:.1f} s")
+    print(f"pooled objects:          {len(compact.pool)}")
+    print(f"reduction:               {task_bytes / compact_bytes:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,68 @@
+"""Import time of clickupython.client, measured with ``python -X importtime``.
+
+Imports the module in fresh interpreters, reports the median total import time
+and the slowest modules it pulls in, and lists any of the deferred optional
+dependencies that were loaded eagerly. With ``--max-ms`` it exits with status 1
+when the median exceeds the budget, so it can guard CI against regressions.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N] [--max-ms MS] [--module NAME]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Dependencies that must only be imported when the features needing them are used.
+DEFERRED = ("timefhuman", "pendulum", "word2number", "aiohttp", "pyarrow", "numpy", "sqlite3")
+
+
+def import_times(module: str) -> dict:
+    """Imports a module in a fresh interpreter and returns the cumulative microseconds of every module it loaded."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, default=None)
+    parser.add_argument("--module", default="clickupython.client")
+    args = parser.parse_args()
+
+    startup = import_times("sys")
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    totals = [times[args.module] / 1000 for times in runs]
+    median = statistics.median(totals)
+    slowest = sorted(
+        ((name, micros) for name, micros in runs[-1].items() if name not in startup),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    eager = sorted({name.split(".")[0] for name in runs[-1]} & set(DEFERRED))
+
+    print(f"module:                  {args.module}")
+    print(f"median import time:      {median:.1f} ms over {args.runs} runs")
+    print("slowest modules (cumulative):")
+    for name, micros in slowest[1:11]:
+        print(f"  {micros / 1000:8.1f} ms  {name}")
+    print(f"eager deferred imports:  {', '.join(eager) or 'none'}")
+
+    if eager or (args.max_ms is not None and median > args.max_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
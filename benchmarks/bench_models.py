@@ -0,0 +1,100 @@
+"""Parse time and allocations of validated, trusted and lazy model construction.
+
+Builds a synthetic page of tasks shaped like a ``get_tasks`` response, with
+assignees, tags and several custom fields per task, and parses it repeatedly
+with ``models.Tasks(**page)`` (the default, fully validated path), with
+``models.construct`` (the path used by ``trusted_models=True``) and with
+``models.LazyTask`` (``lazy_tasks=True``), reading only ``id``, ``name``,
+``status`` and ``date_updated`` of each lazy task. Allocations are the peak
+traced by ``tracemalloc`` while building one page.
+
+Usage:
+    python benchmarks/bench_models.py [pages] [tasks_per_page]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from clickupython import models
+
+
+def synthetic_page(size: int) -> dict:
+    return {
+        "tasks": [
+            {
+                "id": f"task{n}",
+                "name": f"Task {n}",
+                "text_content": "Some description",
+                "status": {"status": "in progress", "color": "#4194f6", "type": "custom"},
+                "orderindex": "1.0000",
+                "date_created": "1650000000000",
+                "date_updated": "1650000500000",
+                "creator": {"id": 183, "username": "Jane", "color": "#827718"},
+                "assignees": [
+                    {"id": str(183 + a), "username": f"User {a}", "color": "#827718", "initials": "U"}
+                    for a in range(2)
+                ],
+                "tags": [{"name": "bug", "tag_fg": "#fff", "tag_bg": "#000"}],
+                "checklists": [],
+                "priority": {"id": "2", "priority": "high", "color": "#ffcc00"},
+                "custom_fields": [
+                    {
+                        "id": f"field{f}",
+                        "name": f"Field {f}",
+                        "type": "drop_down",
+                        "type_config": {"default": 0, "options": [{"id": "o1", "name": "One", "orderindex": 0}]},
+                        "date_created": "1650000000000",
+                        "hide_from_guests": False,
+                        "value": 0,
+                        "required": False,
+                    }
+                    for f in range(6)
+                ],
+                "list": {"id": "124"},
+                "folder": {"id": "457", "name": "Folder"},
+                "space": {"id": "789"},
+                "url": f"https://app.clickup.com/t/task{n}",
+            }
+            for n in range(size)
+        ]
+    }
+
+
+def measure(build, page: dict, pages: int):
+    build(page)
+    start = time.perf_counter()
+    for _ in range(pages):
+        build(page)
+    elapsed = (time.perf_counter() - start) / pages
+
+    tracemalloc.start()
+    build(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def lazy_read(data: dict) -> list:
+    tasks = [models.LazyTask.from_raw(task) for task in data["tasks"]]
+    for task in tasks:
+        task.id, task.name, task.status, task.date_updated
+    return tasks
+
+
+def main(pages: int = 50, size: int = 100):
+    page = synthetic_page(size)
+    validated = measure(lambda data: models.Tasks(**data), page, pages)
+    trusted = measure(lambda data: models.construct(models.Tasks, data), page, pages)
+    lazy = measure(lazy_read, page, pages)
+
+    print(f"tasks per page:          {size}")
+    print(f"validated parse:         {validated[0] * 1000:.2f} ms/page, peak {validated[1] / 1024:.0f} KiB")
+    print(f"trusted parse:           {trusted[0] * 1000:.2f} ms/page, peak {trusted[1] / 1024:.0f} KiB")
+    print(f"lazy parse, 4 fields:    {lazy[0] * 1000:.2f} ms/page, peak {lazy[1] / 1024:.0f} KiB")
+    print(f"trusted speedup:         {validated[0] / trusted[0]:.2f}x")
+    print(f"lazy speedup:            {validated[0] / lazy[0]:.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,70 @@
+"""Per-request latency of a pooled keep-alive session versus a new connection per request.
+
+Runs a local stub of the ClickUp API and times ``get_list`` calls with the
+default pooled client and with ``keep_alive=False``, which forces a fresh
+TCP connection for every request. The stub speaks plain HTTP on localhost,
+so the measured saving excludes the TLS handshake and network round trips
+that dominate against api.clickup.com.
+
+Usage:
+    python benchmarks/bench_session.py [requests]
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from clickupython import client
+
+BODY = json.dumps({"id": "124", "name": "Benchmark list"}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.send_header("x-ratelimit-remaining", "100")
+        self.send_header("x-ratelimit-reset", "0")
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+def run(c: client.ClickUpClient, count: int) -> float:
+    c.get_list("124")
+    start = time.perf_counter()
+    for _ in range(count):
+        c.get_list("124")
+    return (time.perf_counter() - start) / count
+
+
+def main(count: int = 500):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+
+    with mock.patch("clickupython.client.API_URL", f"http://{host}:{port}/api/v2/"):
+        with client.ClickUpClient("pk_benchmark", keep_alive=False) as c:
+            fresh = run(c, count)
+        with client.ClickUpClient("pk_benchmark") as c:
+            pooled = run(c, count)
+
+    server.shutdown()
+    print(f"requests per run:        {count}")
+    print(f"new connection/request:  {fresh * 1000:.3f} ms")
+    print(f"pooled keep-alive:       {pooled * 1000:.3f} ms")
+    print(f"speedup:                 {fresh / pooled:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,77 @@
+"""Per-user, per-day and per-tag duration totals: Python loops vs TimeEntryTable rollups.
+
+Generates synthetic raw time entries shaped like a ``get_time_entries_in_range``
+response and computes the same totals with dict-based Python loops over the
+entries and with vectorized ``TimeEntryTable.rollup`` calls. Building the table
+is timed separately, since it is a one-off cost per fetch.
+
+Usage:
+    python benchmarks/bench_timetable.py [entries]
+"""
+
+import sys
+import time
+from collections import defaultdict
+
+from clickupython.timetable import DAY_MS, TimeEntryTable
+
+START = 1640995200000
+
+
+def synthetic_entries(count: int) -> list:
+    return [
+        {
+            "id": str(n),
+            "task": {"id": f"task{n % 5000}"},
+            "user": {"id": 1000 + n % 200, "username": f"User {n % 200}"},
+            "billable": n % 3 == 0,
+            "start": str(START + n * 30000),
+            "end": str(START + n * 30000 + 600000 + n % 7 * 60000),
+            "duration": str(600000 + n % 7 * 60000),
+            "tags": [{"name": f"tag{n % 12}"}],
+        }
+        for n in range(count)
+    ]
+
+
+def python_totals(entries: list):
+    by_user, by_day, by_tag = defaultdict(int), defaultdict(int), defaultdict(int)
+    for entry in entries:
+        duration = int(entry["duration"])
+        by_user[str(entry["user"]["id"])] += duration
+        by_day[int(entry["start"]) // DAY_MS] += duration
+        for tag in entry["tags"]:
+            by_tag[tag["name"]] += duration
+    return by_user, by_day, by_tag
+
+
+def table_totals(table: TimeEntryTable):
+    return (
+        table.rollup("user", statistics=("sum",)),
+        table.rollup("day", statistics=("sum",)),
+        table.rollup("tag", statistics=("sum",)),
+    )
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main(count: int = 1_000_000):
+    entries = synthetic_entries(count)
+    expected, loop_seconds = timed(python_totals, entries)
+    table, build_seconds = timed(TimeEntryTable.from_entries, entries)
+    totals, rollup_seconds = timed(table_totals, table)
+    assert dict(zip(totals[0]["user"], totals[0]["sum"])) == expected[0]
+
+    print(f"entries:                 {count}")
+    print(f"python loops:            {loop_seconds * 1000:.0f} ms")
+    print(f"table build (once):      {build_seconds * 1000:.0f} ms")
+    print(f"table rollups:           {rollup_seconds * 1000:.0f} ms")
+    print(f"rollup speedup:          {loop_seconds / rollup_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
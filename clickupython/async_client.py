@@ -0,0 +1,1104 @@
+import asyncio
+import json
+import ntpath
+import os
+import time
+from datetime import datetime
+from typing import List, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from clickupython.helpers.timefuncs import fuzzy_time_to_unix
+from clickupython.helpers import formatting
+from clickupython import client
+from clickupython import models
+from clickupython import exceptions
+from clickupython.concurrency import AdaptiveConcurrencyLimiter
+from clickupython.retry import DEFAULT_RETRY_STATUSES, RetryPolicy
+
+
+class AsyncClickUpClient:
+    """An asyncio counterpart of :class:`clickupython.client.ClickUpClient`.
+
+    Every public method of ``ClickUpClient`` is available as a coroutine with the
+    same arguments and return types. Requests share one pooled ``aiohttp`` session
+    and at most ``max_concurrency`` of them are in flight at any time. Passing an
+    ``AdaptiveConcurrencyLimiter`` further caps in-flight requests at its current limit.
+
+    Failed requests are retried according to ``retry_policy``, as in the synchronous
+    client. Rate limiting follows the server's rate limit headers: requests still in
+    flight count against the reported remaining budget, and once it is spent new
+    requests wait for the window to reset. The async client does not use the
+    synchronous client's ``RateLimiter`` or ``TokenPool``.
+
+    Requires the optional ``aiohttp`` dependency (``pip install clickupython[async]``).
+    """
+
+    def __init__(
+        self,
+        accesstoken: str,
+        retry_rate_limited_requests: bool = False,
+        rate_limit_buffer_wait_time: int = 5,
+        start_rate_limit_remaining: int = 100,
+        start_rate_limit_reset: float = None,
+        max_concurrency: int = 50,
+        pool_maxsize: int = 100,
+        keepalive_timeout: float = 15,
+        concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+        trusted_models: bool = False,
+        lazy_tasks: bool = False,
+        retry_policy: RetryPolicy = None,
+    ):
+        if aiohttp is None:
+            raise exceptions.ClickupClientError(
+                "AsyncClickUpClient requires aiohttp. Install it with: pip install clickupython[async]",
+                "Missing dependency",
+            )
+        self.accesstoken = accesstoken
+        self.request_count = 0
+        self.rate_limit_remaining = start_rate_limit_remaining
+        self.rate_limit_reset = (
+            start_rate_limit_reset
+            if start_rate_limit_reset is not None
+            else datetime.now().timestamp()
+        )
+        self.rate_limit_buffer_wait_time = rate_limit_buffer_wait_time
+        self.retry_rate_limited_requests = retry_rate_limited_requests
+        self.retry_policy = retry_policy or RetryPolicy(
+            retry_statuses=DEFAULT_RETRY_STATUSES | {429}
+            if retry_rate_limited_requests
+            else DEFAULT_RETRY_STATUSES
+        )
+        self.max_concurrency = max_concurrency
+        self.pool_maxsize = pool_maxsize
+        self.keepalive_timeout = keepalive_timeout
+        self.concurrency_limiter = concurrency_limiter
+        self.trusted_models = trusted_models
+        self.lazy_tasks = lazy_tasks
+        self._session = None
+        self._semaphore = None
+        self._slots = None
+        self._in_flight = 0
+        self._unreported = 0
+
+    def __build(self, model, data: dict):
+        """Internal method that builds a response model. With trusted_models, pydantic validation is skipped, and
+        with lazy_tasks, tasks defer building their nested fields until they are read."""
+        return models.build(model, data, self.trusted_models, self.lazy_tasks)
+
+    def __get_session(self) -> "aiohttp.ClientSession":
+        """Internal method that lazily opens the pooled session inside the running event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize,
+                limit_per_host=self.pool_maxsize,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._slots = asyncio.Condition()
+        return self._session
+
+    async def __acquire_slot(self):
+        """Internal method that waits until the adaptive concurrency limit allows another request."""
+        async with self._slots:
+            await self._slots.wait_for(
+                lambda: self._in_flight < self.concurrency_limiter.limit
+            )
+            self._in_flight += 1
+
+    async def __release_slot(self):
+        async with self._slots:
+            self._in_flight -= 1
+            self._slots.notify_all()
+
+    async def close(self):
+        """Closes the pooled session and releases its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def __parse_response_rate_limit_headers(self, response: "aiohttp.ClientResponse"):
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        if self.concurrency_limiter:
+            self.concurrency_limiter.observe(
+                self.rate_limit_remaining if remaining is None else int(remaining),
+                response.status,
+            )
+        if remaining is not None and reset is not None:
+            self.rate_limit_remaining = int(remaining)
+            self.rate_limit_reset = float(reset)
+
+    async def __check_rate_limit(self):
+        """Internal method that waits until the reported budget, less the requests already in flight, allows
+        another request. The request is counted as in flight until its response headers have been read."""
+        while True:
+            now = time.time()
+            resume_time = self.rate_limit_reset + self.rate_limit_buffer_wait_time
+            if self.rate_limit_remaining - self._unreported > 1 or now >= resume_time:
+                self._unreported += 1
+                return
+            await asyncio.sleep(resume_time - now)
+
+    def __headers(self, file_upload: bool = False):
+        """Internal method to generate headers for HTTP requests.
+
+        Returns:
+            :dict: Returns headers for HTTP requests
+        """
+        return client.request_headers(self.accesstoken, file_upload)
+
+    async def __request(
+        self, method: str, path: str, headers: dict, data=None, idempotent: bool = None
+    ):
+        """Internal method that sends a request through the pooled session, retrying failed attempts according
+        to the client's retry policy.
+
+        Args:
+            :data (optional): The request body, or a function returning a fresh body for every attempt.
+            :idempotent (bool, optional): Whether the request can safely be sent twice. Defaults to True for every verb except POST.
+
+        Returns:
+            :tuple: The response status code and the decoded JSON body, or None when the body is not JSON.
+        """
+        session = self.__get_session()
+        if idempotent is None:
+            idempotent = method != "POST"
+        attempt = 0
+        while True:
+            attempt += 1
+            async with self._semaphore:
+                if self.concurrency_limiter:
+                    await self.__acquire_slot()
+                try:
+                    await self.__check_rate_limit()
+                    try:
+                        status, response_json, delay = await self.__attempt(
+                            session, method, path, headers, data, attempt, idempotent
+                        )
+                    finally:
+                        self._unreported -= 1
+                finally:
+                    if self.concurrency_limiter:
+                        await self.__release_slot()
+            if delay is None:
+                return status, response_json
+            await asyncio.sleep(delay)
+
+    async def __attempt(self, session, method, path, headers, data, attempt, idempotent):
+        """Internal method that sends one attempt of a request.
+
+        Returns:
+            :tuple: The status code, the decoded JSON body and the seconds to wait before retrying, or None when done.
+        """
+        try:
+            async with session.request(
+                method, path, headers=headers, data=data() if callable(data) else data
+            ) as response:
+                self.request_count += 1
+                self.__parse_response_rate_limit_headers(response)
+                delay = self.retry_policy.retry_delay(attempt, idempotent, response=response)
+                if delay is not None:
+                    return response.status, None, delay
+                try:
+                    response_json = await response.json(content_type=None)
+                except ValueError:
+                    response_json = None
+                if response.status in self.retry_policy.retry_statuses:
+                    raise exceptions.ClickupClientError(
+                        client.error_text(response_json, attempt), response.status
+                    )
+                return response.status, response_json, None
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+            delay = self.retry_policy.retry_delay(
+                attempt,
+                idempotent,
+                error=error,
+                sent=not isinstance(error, aiohttp.ClientConnectorError),
+            )
+            if delay is None:
+                raise
+            return None, None, delay
+
+    async def __get_request(self, model, *additionalpath) -> json:
+        """Performs a Get request to the ClickUp API"""
+        path = formatting.url_join(client.API_URL, model, *additionalpath)
+        status, response_json = await self.__request("GET", path, self.__headers())
+
+        if status == 429:
+            raise exceptions.ClickupClientError("Rate limit exceeded", status)
+        if status in [401, 400, 404]:
+            raise exceptions.ClickupClientError(response_json["err"], status)
+        if status < 400:
+            return response_json
+
+    # Performs a Post request to the ClickUp API
+    async def __post_request(
+        self,
+        model,
+        data,
+        upload_files=None,
+        file_upload=False,
+        *additionalpath,
+        idempotent=False,
+    ):
+        path = formatting.url_join(client.API_URL, model, *additionalpath)
+        if upload_files:
+            # A form is consumed when sent, so every attempt gets a new one.
+            def form():
+                body = aiohttp.FormData()
+                for key, value in data.items():
+                    body.add_field(key, value)
+                for field, (filename, content) in upload_files:
+                    body.add_field(field, content, filename=filename)
+                return body
+
+            status, response_json = await self.__request(
+                "POST", path, self.__headers(True), form, idempotent
+            )
+        else:
+            status, response_json = await self.__request(
+                "POST", path, self.__headers(), data or None, idempotent
+            )
+
+        if status in [401, 400, 500, 404]:
+            raise exceptions.ClickupClientError(response_json["err"], status)
+        if status < 400:
+            return response_json
+
+    # Performs a Put request to the ClickUp API
+    async def __put_request(self, model, data, *additionalpath):
+        path = formatting.url_join(client.API_URL, model, *additionalpath)
+        status, response_json = await self.__request(
+            "PUT", path, self.__headers(), data
+        )
+        if status in [401, 400]:
+            raise exceptions.ClickupClientError(response_json["err"], status)
+        if status < 400:
+            return response_json
+
+    # Performs a Delete request to the ClickUp API
+    async def __delete_request(self, model, *additionalpath):
+        path = formatting.url_join(client.API_URL, model, *additionalpath)
+        status, response_json = await self.__request(
+            "DELETE", path, self.__headers()
+        )
+        if response_json is None:
+            raise exceptions.ClickupClientError("Invalid Json response", status)
+        if status < 400:
+            return status
+        raise exceptions.ClickupClientError(response_json["err"], status)
+
+    # Lists
+    async def get_list(self, list_id: str) -> models.SingleList:
+        """Async version of :meth:`ClickUpClient.get_list`."""
+        model = "list/"
+        fetched_list = await self.__get_request(model, list_id)
+        return self.__build(models.SingleList, fetched_list)
+
+    async def get_folderless_lists(self, space_id: str) -> models.AllLists:
+        """Async version of :meth:`ClickUpClient.get_folderless_lists`."""
+        model = "space/"
+        fetched_lists = await self.__get_request(model, space_id, "list")
+        return self.__build(models.AllLists, fetched_lists)
+
+    async def get_lists(self, folder_id: str) -> models.AllLists:
+        """Async version of :meth:`ClickUpClient.get_lists`."""
+        model = "folder/"
+        fetched_lists = await self.__get_request(model, folder_id)
+        return self.__build(models.AllLists, fetched_lists)
+
+    async def create_list(
+        self,
+        folder_id: str,
+        name: str,
+        content: str,
+        due_date: str,
+        priority: int,
+        status: str,
+    ) -> models.SingleList:
+        """Async version of :meth:`ClickUpClient.create_list`."""
+        data = {
+            "name": name,
+            "content": content,
+            "due_date": due_date,
+            "status": status,
+        }
+        model = "folder/"
+        created_list = await self.__post_request(
+            model, json.dumps(data), None, False, folder_id, "list"
+        )
+        if created_list:
+            return self.__build(models.SingleList, created_list)
+
+    async def create_folderless_list(
+        self,
+        space_id: str,
+        name: str,
+        content: str = None,
+        due_date: str = None,
+        priority: int = None,
+        assignee: str = None,
+        status: str = None,
+    ) -> models.SingleList:
+        """Async version of :meth:`ClickUpClient.create_folderless_list`."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("space_id", None)
+
+        final_dict = json.dumps({k: v for k, v in arguments.items() if v is not None})
+
+        model = "space/"
+        created_list = await self.__post_request(
+            model, final_dict, None, False, space_id, "list"
+        )
+        if created_list:
+            return self.__build(models.SingleList, created_list)
+
+    async def update_list(
+        self,
+        list_id: str,
+        name: str = None,
+        content: str = None,
+        due_date: str = None,
+        due_date_time: bool = None,
+        priority: int = None,
+        assignee: str = None,
+        unset_status: bool = None,
+    ) -> models.SingleList:
+        """Async version of :meth:`ClickUpClient.update_list`."""
+        if priority and priority not in range(1, 4):
+            raise exceptions.ClickupClientError(
+                "Priority must be in range of 0-4.", "Priority out of range"
+            )
+
+        if due_date:
+            due_date = fuzzy_time_to_unix(due_date)
+
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("list_id", None)
+
+        final_dict = json.dumps({k: v for k, v in arguments.items() if v is not None})
+        model = "list/"
+        updated_list = await self.__put_request(model, final_dict, list_id)
+        if updated_list:
+            return self.__build(models.SingleList, updated_list)
+
+    async def delete_list(self, list_id: str) -> bool:
+        """Async version of :meth:`ClickUpClient.delete_list`."""
+        model = "list/"
+        await self.__delete_request(model, list_id)
+        return True
+
+    async def add_task_to_list(self, task_id: str, list_id: str) -> bool:
+        """Async version of :meth:`ClickUpClient.add_task_to_list`."""
+        model = "list/"
+        await self.__post_request(
+            model, None, None, False, list_id, "task", task_id, idempotent=True
+        )
+        return True
+
+    async def remove_task_from_list(self, task_id: str, list_id: str) -> bool:
+        """Async version of :meth:`ClickUpClient.remove_task_from_list`."""
+        model = "list/"
+        await self.__delete_request(model, list_id, "task", task_id)
+        return True
+
+    # Folders
+    async def get_folder(self, folder_id: str) -> models.Folder:
+        """Async version of :meth:`ClickUpClient.get_folder`."""
+        model = "folder/"
+        fetched_folder = await self.__get_request(model, folder_id)
+        if fetched_folder:
+            return self.__build(models.Folder, fetched_folder)
+
+    async def get_folders(self, space_id: str) -> models.Folders:
+        """Async version of :meth:`ClickUpClient.get_folders`."""
+        model = "space/"
+        fetched_folders = await self.__get_request(model, space_id, "folder")
+        if fetched_folders:
+            return self.__build(models.Folders, fetched_folders)
+
+    async def create_folder(self, space_id: str, name: str) -> models.Folder:
+        """Async version of :meth:`ClickUpClient.create_folder`."""
+        data = {
+            "name": name,
+        }
+        model = "space/"
+        created_folder = await self.__post_request(
+            model, json.dumps(data), None, False, space_id, "folder"
+        )
+        if created_folder:
+            return self.__build(models.Folder, created_folder)
+
+    async def update_folder(self, folder_id: str, name: str) -> models.Folder:
+        """Async version of :meth:`ClickUpClient.update_folder`."""
+        data = {
+            "name": name,
+        }
+        model = "folder/"
+        updated_folder = await self.__put_request(model, json.dumps(data), folder_id)
+        if updated_folder:
+            return self.__build(models.Folder, updated_folder)
+
+    async def delete_folder(self, folder_id: str) -> bool:
+        """Async version of :meth:`ClickUpClient.delete_folder`."""
+        model = "folder/"
+        await self.__delete_request(model, folder_id)
+        return True
+
+    # Tasks
+    async def upload_attachment(
+        self, task_id: str, file_path: str
+    ) -> models.Attachment:
+        """Async version of :meth:`ClickUpClient.upload_attachment`."""
+        if os.path.exists(file_path):
+            with open(file_path, "rb") as f:
+                files = [("attachment", (f.name, f.read()))]
+                data = {"filename": ntpath.basename(f.name)}
+            model = "task/" + task_id
+            uploaded_attachment = await self.__post_request(
+                model, data, files, True, "attachment"
+            )
+            if uploaded_attachment:
+                return self.__build(models.Attachment, uploaded_attachment)
+
+    async def get_task(self, task_id: str) -> models.Task:
+        """Async version of :meth:`ClickUpClient.get_task`."""
+        model = "task/"
+        fetched_task = await self.__get_request(model, task_id)
+        final_task = self.__build(models.Task, fetched_task)
+        if final_task:
+            return final_task
+
+    async def get_team_tasks(
+        self,
+        team_Id: str,
+        page: int = 0,
+        order_by: str = "created",
+        reverse: bool = False,
+        subtasks: bool = False,
+        space_ids: List[str] = None,
+        project_ids: List[str] = None,
+        list_ids: List[str] = None,
+        statuses: List[str] = None,
+        include_closed: bool = False,
+        assignees: List[str] = None,
+        tags: List[str] = None,
+        due_date_gt: str = None,
+        due_date_lt: str = None,
+        date_created_gt: str = None,
+        date_created_lt: str = None,
+        date_updated_gt: str = None,
+        date_updated_lt: str = None,
+        raw: bool = False,
+        fields: List[str] = None,
+    ) -> Union[models.Tasks, List[dict]]:
+        """Async version of :meth:`ClickUpClient.get_team_tasks`."""
+        joined_url = client._team_tasks_query(
+            page,
+            order_by,
+            reverse,
+            subtasks,
+            space_ids,
+            project_ids,
+            list_ids,
+            statuses,
+            include_closed,
+            assignees,
+            tags,
+            due_date_gt,
+            due_date_lt,
+            date_created_gt,
+            date_created_lt,
+            date_updated_gt,
+            date_updated_lt,
+        )
+
+        model = "team/"
+        fetched_tasks = await self.__get_request(model, team_Id, joined_url)
+        if fetched_tasks:
+            if raw or fields:
+                return client._project(fetched_tasks["tasks"], fields)
+            return self.__build(models.Tasks, fetched_tasks)
+
+    async def get_tasks(
+        self,
+        list_id: str,
+        archived: bool = False,
+        page: int = 0,
+        order_by: str = "created",
+        reverse: bool = False,
+        subtasks: bool = False,
+        statuses: List[str] = None,
+        include_closed: bool = False,
+        assignees: List[str] = None,
+        due_date_gt: str = None,
+        due_date_lt: str = None,
+        date_created_gt: str = None,
+        date_created_lt: str = None,
+        date_updated_gt: str = None,
+        date_updated_lt: str = None,
+        raw: bool = False,
+        fields: List[str] = None,
+    ) -> Union[models.Tasks, List[dict]]:
+        """Async version of :meth:`ClickUpClient.get_tasks`."""
+        joined_url = client._tasks_query(
+            archived,
+            page,
+            order_by,
+            reverse,
+            subtasks,
+            statuses,
+            include_closed,
+            assignees,
+            due_date_gt,
+            due_date_lt,
+            date_created_gt,
+            date_created_lt,
+            date_updated_gt,
+            date_updated_lt,
+        )
+
+        model = "list/"
+        fetched_tasks = await self.__get_request(model, list_id, joined_url)
+        if fetched_tasks:
+            if raw or fields:
+                return client._project(fetched_tasks["tasks"], fields)
+            return self.__build(models.Tasks, fetched_tasks)
+
+    async def create_task(
+        self,
+        list_id: str,
+        name: str,
+        description: str = None,
+        priority: int = None,
+        assignees: [] = None,
+        tags: [] = None,
+        status: str = None,
+        due_date: str = None,
+        start_date: str = None,
+        notify_all: bool = True,
+    ) -> models.Task:
+        """Async version of :meth:`ClickUpClient.create_task`."""
+        final_dict = client._task_payload(
+            name,
+            description,
+            priority,
+            assignees,
+            tags,
+            status,
+            due_date,
+            start_date,
+            notify_all,
+        )
+
+        model = "list/"
+        created_task = await self.__post_request(
+            model, final_dict, None, False, list_id, "task"
+        )
+
+        if created_task:
+            return self.__build(models.Task, created_task)
+
+    async def update_task(
+        self,
+        task_id,
+        name: str = None,
+        description: str = None,
+        status: str = None,
+        priority: int = None,
+        time_estimate: int = None,
+        archived: bool = None,
+        add_assignees: List[str] = None,
+        remove_assignees: List[int] = None,
+    ) -> models.Task:
+        """Async version of :meth:`ClickUpClient.update_task`."""
+        final_dict = client._update_task_payload(
+            name,
+            description,
+            status,
+            priority,
+            time_estimate,
+            archived,
+            add_assignees,
+            remove_assignees,
+        )
+
+        model = "task/"
+        updated_task = await self.__put_request(model, final_dict, task_id)
+        if updated_task:
+            return self.__build(models.Task, updated_task)
+
+    async def delete_task(self, task_id: str) -> bool:
+        """Async version of :meth:`ClickUpClient.delete_task`."""
+        model = "task/"
+        await self.__delete_request(model, task_id)
+        return True
+
+    # Comments
+    async def get_task_comments(
+        self, task_id: str, raw: bool = False, fields: List[str] = None
+    ) -> Union[models.Comments, List[dict]]:
+        """Async version of :meth:`ClickUpClient.get_task_comments`."""
+        model = "task/"
+        fetched_comments = await self.__get_request(model, task_id, "comment")
+        if raw or fields:
+            return client._project(fetched_comments["comments"], fields)
+        final_comments = self.__build(models.Comments, fetched_comments)
+        if final_comments:
+            return final_comments
+
+    async def get_list_comments(
+        self, list_id: str, raw: bool = False, fields: List[str] = None
+    ) -> Union[models.Comments, List[dict]]:
+        """Async version of :meth:`ClickUpClient.get_list_comments`."""
+        model = "list/"
+        fetched_comments = await self.__get_request(model, list_id, "comment/")
+        if raw or fields:
+            return client._project(fetched_comments["comments"], fields)
+        final_comments = self.__build(models.Comments, fetched_comments)
+        if final_comments:
+            return final_comments
+
+    async def get_chat_comments(
+        self, view_id: str, raw: bool = False, fields: List[str] = None
+    ) -> Union[models.Comments, List[dict]]:
+        """Async version of :meth:`ClickUpClient.get_chat_comments`."""
+        model = "view/"
+        fetched_comments = await self.__get_request(model, view_id, "comment/")
+        if raw or fields:
+            return client._project(fetched_comments["comments"], fields)
+        final_comments = self.__build(models.Comments, fetched_comments)
+        if final_comments:
+            return final_comments
+
+    async def update_comment(
+        self,
+        comment_id: str,
+        comment_text: str = None,
+        assignee: str = None,
+        resolved: bool = None,
+    ) -> bool:
+        """Async version of :meth:`ClickUpClient.update_comment`."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("comment_id", None)
+
+        model = "comment/"
+
+        final_dict = json.dumps({k: v for k, v in arguments.items() if v is not None})
+
+        await self.__put_request(model, final_dict, comment_id)
+
+        return True
+
+    async def delete_comment(self, comment_id: str) -> bool:
+        """Async version of :meth:`ClickUpClient.delete_comment`."""
+        model = "comment/"
+        await self.__delete_request(model, comment_id)
+        return True
+
+    async def create_task_comment(
+        self,
+        task_id: str,
+        comment_text: str,
+        assignee: str = None,
+        notify_all: bool = True,
+    ) -> models.Comment:
+        """Async version of :meth:`ClickUpClient.create_task_comment`."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("task_id", None)
+
+        model = "task/"
+
+        final_dict = json.dumps({k: v for k, v in arguments.items() if v is not None})
+
+        created_comment = await self.__post_request(
+            model, final_dict, None, False, task_id, "comment"
+        )
+
+        final_comment = self.__build(models.Comment, created_comment)
+        if final_comment:
+            return final_comment
+
+    async def create_chat_comment(
+        self,
+        view_id: str,
+        comment_text: str,
+        notify_all: bool = True,
+    ) -> models.Comment:
+        """Async version of :meth:`ClickUpClient.create_chat_comment`."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("view_id", None)
+
+        model = "view/"
+
+        final_dict = json.dumps({k: v for k, v in arguments.items() if v is not None})
+
+        created_comment = await self.__post_request(
+            model, final_dict, None, False, view_id, "comment"
+        )
+
+        final_comment = self.__build(models.Comment, created_comment)
+        if final_comment:
+            return final_comment
+
+    # Teams
+    async def get_teams(self) -> models.Teams:
+        """Async version of :meth:`ClickUpClient.get_teams`."""
+        model = "team"
+        fetched_teams = await self.__get_request(model)
+        final_teams = self.__build(models.Teams, fetched_teams)
+        if final_teams:
+            return final_teams
+
+    # Checklists
+    async def create_checklist(self, task_id: str, name: str) -> models.Checklist:
+        """Async version of :meth:`ClickUpClient.create_checklist`."""
+        data = {
+            "name": name,
+        }
+
+        model = "task/"
+        created_checklist = await self.__post_request(
+            model, json.dumps(data), None, False, task_id, "checklist"
+        )
+        return models.Checklists.build_checklist(created_checklist)
+
+    async def create_checklist_item(
+        self, checklist_id: str, name: str, assignee: str = None
+    ) -> models.Checklist:
+        """Async version of :meth:`ClickUpClient.create_checklist_item`."""
+        data = {"name": name, "assignee": assignee} if assignee else {"name": name}
+        model = "checklist/"
+        created_checklist = await self.__post_request(
+            model, json.dumps(data), None, False, checklist_id, "checklist_item"
+        )
+        return models.Checklists.build_checklist(created_checklist)
+
+    async def update_checklist(
+        self, checklist_id: str, name: str = None, postion: int = None
+    ) -> models.Checklist:
+        """Async version of :meth:`ClickUpClient.update_checklist`."""
+        if not name and not postion:
+            return
+
+        data = {}
+
+        if name:
+            data.update({"name": name})
+        if postion:
+            data.update({"position": postion})
+
+        model = "checklist/"
+        updated_checklist = await self.__put_request(
+            model, json.dumps(data), checklist_id
+        )
+        if updated_checklist:
+            return models.Checklists.build_checklist(updated_checklist)
+
+    async def delete_checklist(self, checklist_id: str) -> bool:
+        """Async version of :meth:`ClickUpClient.delete_checklist`."""
+        model = "checklist/"
+        await self.__delete_request(model, checklist_id)
+        return True
+
+    async def delete_checklist_item(
+        self, checklist_id: str, checklist_item_id: str
+    ) -> bool:
+        """Async version of :meth:`ClickUpClient.delete_checklist_item`."""
+        model = "checklist/"
+        await self.__delete_request(
+            model, checklist_id, "checklist_item", checklist_item_id
+        )
+        return True
+
+    async def update_checklist_item(
+        self,
+        checklist_id: str,
+        checklist_item_id: str,
+        name: str = None,
+        resolved: bool = None,
+        parent: str = None,
+    ) -> models.Checklist:
+        """Async version of :meth:`ClickUpClient.update_checklist_item`."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("checklist_id", None)
+        arguments.pop("checklist_item_id", None)
+
+        model = "checklist/"
+
+        final_dict = json.dumps({k: v for k, v in arguments.items() if v is not None})
+
+        item_update = await self.__put_request(
+            model, final_dict, checklist_id, "checklist_item", checklist_item_id
+        )
+
+        final_update = models.Checklists.build_checklist(item_update)
+        if final_update:
+            return final_update
+
+    # Members
+    async def get_task_members(
+        self, task_id: str, raw: bool = False, fields: List[str] = None
+    ) -> Union[models.Members, List[dict]]:
+        """Async version of :meth:`ClickUpClient.get_task_members`."""
+        model = "task/"
+        task_members = await self.__get_request(model, task_id, "member")
+        if raw or fields:
+            return client._project(task_members["members"], fields)
+        return self.__build(models.Members, task_members)
+
+    async def get_list_members(
+        self, list_id: str, raw: bool = False, fields: List[str] = None
+    ) -> Union[models.Members, List[dict]]:
+        """Async version of :meth:`ClickUpClient.get_list_members`."""
+        model = "list/"
+        task_members = await self.__get_request(model, list_id, "member")
+        if raw or fields:
+            return client._project(task_members["members"], fields)
+        return self.__build(models.Members, task_members)
+
+    # Goals
+    async def create_goal(
+        self,
+        team_id,
+        name: str,
+        due_date: str = None,
+        description: str = None,
+        multiple_owners: bool = True,
+        owners: List[int] = None,
+        color: str = None,
+    ) -> models.Goal:
+        """Async version of :meth:`ClickUpClient.create_goal`."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("team_id", None)
+        arguments.pop("owners", None)
+
+        if multiple_owners and owners:
+            arguments.update({"owners": owners})
+
+        final_dict = json.dumps({k: v for k, v in arguments.items() if v is not None})
+
+        model = "team/"
+        created_goal = await self.__post_request(
+            model, final_dict, None, False, team_id, "goal"
+        )
+        if created_goal:
+            return models.Goals.build_goals(created_goal)
+
+    async def update_goal(
+        self,
+        goal_id: str,
+        name: str = None,
+        due_date: str = None,
+        description: str = None,
+        rem_owners: List[str] = None,
+        add_owners: List[str] = None,
+        color: str = None,
+    ) -> models.Goal:
+        """Async version of :meth:`ClickUpClient.update_goal`."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("goal_id", None)
+
+        final_dict = json.dumps({k: v for k, v in arguments.items() if v is not None})
+
+        model = "goal/"
+        updated_goal = await self.__put_request(model, final_dict, goal_id)
+        if updated_goal:
+            return models.Goals.build_goals(updated_goal)
+
+    async def delete_goal(self, goal_id: str) -> bool:
+        """Async version of :meth:`ClickUpClient.delete_goal`."""
+        model = "goal/"
+        await self.__delete_request(model, goal_id)
+        return True
+
+    async def get_goal(self, goal_id: str) -> models.Goal:
+        """Async version of :meth:`ClickUpClient.get_goal`."""
+        model = "goal/"
+        fetched_goal = await self.__get_request(model, goal_id)
+        final_goal = models.Goals.build_goals(fetched_goal)
+        if final_goal:
+            return final_goal
+
+    async def get_goals(
+        self, team_id: str, include_completed: bool = False
+    ) -> models.GoalsList:
+        """Async version of :meth:`ClickUpClient.get_goals`."""
+        model = "team/"
+        path = f"goal?include_completed={str(include_completed).lower()}"
+        fetched_goals = await self.__get_request(model, team_id, path)
+
+        final_goals = self.__build(models.GoalsList, fetched_goals)
+        if final_goals:
+            return final_goals
+
+    # Tags
+    async def get_space_tags(self, space_id: str) -> models.Tags:
+        """Async version of :meth:`ClickUpClient.get_space_tags`."""
+        model = "space/"
+        fetched_tags = await self.__get_request(model, space_id, "tag")
+        final_tags = self.__build(models.Tags, fetched_tags)
+        if final_tags:
+            return final_tags
+
+    async def create_space_tag(self, space_id, name: str) -> bool:
+        """Async version of :meth:`ClickUpClient.create_space_tag`."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("space_id", None)
+
+        final_dict = {k: v for k, v in arguments.items() if v is not None}
+        final_tag = json.dumps({"tag": final_dict})
+
+        model = "space/"
+        await self.__post_request(model, final_tag, None, False, space_id, "tag")
+        return True
+
+    async def tag_task(self, task_id: str, tag_name: str) -> bool:
+        """Async version of :meth:`ClickUpClient.tag_task`."""
+        model = "task/"
+        await self.__post_request(
+            model, None, None, False, task_id, "tag", tag_name, idempotent=True
+        )
+        return True
+
+    async def untag_task(self, task_id: str, tag_name: str) -> bool:
+        """Async version of :meth:`ClickUpClient.untag_task`."""
+        model = "task/"
+        await self.__delete_request(model, task_id, "tag", tag_name)
+        return True
+
+    # Spaces
+    async def create_space(
+        self, team_id: str, name: str, features: models.Features
+    ) -> models.Space:
+        """Async version of :meth:`ClickUpClient.create_space`."""
+        final_dict = json.dumps(
+            {
+                "name": name,
+                "multiple_assignees": features.multiple_assignees,
+                "features": features.all_features,
+            }
+        )
+
+        model = "team/"
+        created_space = await self.__post_request(
+            model, final_dict, None, False, team_id, "space"
+        )
+        if created_space:
+            return self.__build(models.Space, created_space)
+
+    async def delete_space(self, space_id: str) -> bool:
+        """Async version of :meth:`ClickUpClient.delete_space`."""
+        model = "space/"
+        await self.__delete_request(model, space_id)
+        return True
+
+    async def get_space(self, space_id: str) -> models.Space:
+        """Async version of :meth:`ClickUpClient.get_space`."""
+        model = "space/"
+        fetched_space = await self.__get_request(model, space_id)
+        if fetched_space:
+            return self.__build(models.Space, fetched_space)
+
+    async def get_spaces(self, team_id: str, archived: bool = False) -> models.Spaces:
+        """Async version of :meth:`ClickUpClient.get_spaces`."""
+        path = f"space?archived={str(archived).lower()}"
+        model = "team/"
+        fetched_spaces = await self.__get_request(model, team_id, path)
+        if fetched_spaces:
+            return self.__build(models.Spaces, fetched_spaces)
+
+    # Shared Hierarchy
+    async def get_shared_hierarchy(self, team_id: str) -> models.SharedHierarchy:
+        """Async version of :meth:`ClickUpClient.get_shared_hierarchy`."""
+        model = "team/"
+        fetched_hierarchy = await self.__get_request(model, team_id, "shared")
+        if fetched_hierarchy:
+            return self.__build(models.SharedHierarchy, fetched_hierarchy)
+
+    # Time Tracking
+    async def get_time_entries_in_range(
+        self,
+        team_id: str,
+        start_date: str = None,
+        end_date: str = None,
+        assignees: List[str] = None,
+        raw: bool = False,
+        fields: List[str] = None,
+    ) -> Union[models.TimeTrackingDataList, List[dict]]:
+        """Async version of :meth:`ClickUpClient.get_time_entries_in_range`."""
+        joined_url = client._time_entries_query(start_date, end_date, assignees)
+        model = "team/"
+        fetched_time_data = await self.__get_request(model, team_id, joined_url)
+        if fetched_time_data:
+            if raw or fields:
+                return client._project(fetched_time_data["data"], fields)
+            return self.__build(models.TimeTrackingDataList, fetched_time_data)
+
+    async def get_single_time_entry(
+        self, team_id: str, timer_id: str
+    ) -> models.TimeTrackingDataSingle:
+        """Async version of :meth:`ClickUpClient.get_single_time_entry`."""
+        model = "team/"
+        fetched_time_data = await self.__get_request(
+            model, team_id, "time_entries", timer_id
+        )
+        if fetched_time_data:
+            return self.__build(models.TimeTrackingDataSingle, fetched_time_data)
+
+    async def start_timer(
+        self, team_id: str, timer_id: str
+    ) -> models.TimeTrackingDataSingle:
+        """Async version of :meth:`ClickUpClient.start_timer`."""
+        model = "team/"
+        fetched_time_data = await self.__post_request(
+            model, None, None, False, team_id, "time_entries/start", timer_id
+        )
+        if fetched_time_data:
+            return self.__build(models.TimeTrackingDataSingle, fetched_time_data)
+
+    async def stop_timer(self, team_id: str) -> models.TimeTrackingDataSingle:
+        """Async version of :meth:`ClickUpClient.stop_timer`."""
+        model = "team/"
+        fetched_time_data = await self.__post_request(
+            model, None, None, False, team_id, "time_entries/stop"
+        )
+        if fetched_time_data:
+            return self.__build(models.TimeTrackingDataSingle, fetched_time_data)
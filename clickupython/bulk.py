@@ -0,0 +1,138 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, List, Tuple
+
+
+class BulkFailure:
+    """An input of a bulk job that failed, either while it was validated or when its request was sent.
+
+    Args:
+        :index (int): The position of the input in the iterable passed to the job.
+        :item (Any): The input itself, so it can be corrected and retried.
+        :error (Exception): The error raised for it.
+    """
+
+    def __init__(self, index: int, item: Any, error: Exception):
+        self.index = index
+        self.item = item
+        self.error = error
+
+    def __repr__(self):
+        return f"BulkFailure(index={self.index!r}, item={self.item!r}, error={self.error!r})"
+
+
+class Checkpoint:
+    """An append-only file of the inputs a bulk job has completed, so an interrupted job can resume.
+
+    Each completed input is written on its own line and flushed as soon as its request
+    succeeds. Opening a checkpoint that already exists loads those inputs, and a job
+    using it skips them. Failed inputs are never recorded, so they are retried.
+
+    Args:
+        :path (str): The checkpoint file. Created if it does not exist.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.completed = set()
+        if os.path.exists(path):
+            with open(path) as checkpoint_file:
+                self.completed.update(line.rstrip("\n") for line in checkpoint_file if line.strip())
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.completed
+
+    def __len__(self):
+        return len(self.completed)
+
+    def record(self, item: str):
+        """Marks an input as completed."""
+        with self._lock:
+            if item in self.completed:
+                return
+            self.completed.add(item)
+            with open(self.path, "a") as checkpoint_file:
+                checkpoint_file.write(f"{item}\n")
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+
+
+class BulkJob:
+    """Sends one request per input on a thread pool and streams back the results.
+
+    Nothing is sent until the job is iterated. Results are yielded as their requests
+    complete, or in input order when ``ordered`` is set, and at most ``max_workers``
+    requests are in flight at once. Inputs are pulled from ``work`` lazily, so it may
+    be a generator of any length. An input whose request raises is recorded in
+    ``failures`` instead of stopping the job. With a checkpoint, inputs it already
+    holds are skipped and every successful input is recorded in it.
+
+    Args:
+        :send (Callable[[Any], Any]): Sends the request for one payload and returns its result.
+        :work (Iterable[Tuple[int, Any, Any]]): (index, input, payload) tuples to send.
+        :failures (List[BulkFailure], optional): Failures already found before sending, such as invalid inputs. Defaults to None.
+        :max_workers (int, optional): The number of requests in flight at once. Defaults to 8.
+        :ordered (bool, optional): Yield results in input order instead of completion order. Defaults to False.
+        :checkpoint (Checkpoint, optional): Records completed inputs, which must be strings, and skips them on resume. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Any], Any],
+        work: Iterable[Tuple[int, Any, Any]],
+        failures: List[BulkFailure] = None,
+        max_workers: int = 8,
+        ordered: bool = False,
+        checkpoint: Checkpoint = None,
+    ):
+        self.send = send
+        self.work = work
+        self.failures = list(failures or [])
+        self.max_workers = max_workers
+        self.ordered = ordered
+        self.checkpoint = checkpoint
+        self.succeeded = 0
+        self.skipped = 0
+
+    def __iter__(self):
+        work = iter(self.work)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while True:
+                while len(pending) < self.max_workers:
+                    entry = next(work, None)
+                    if entry is None:
+                        break
+                    index, item, payload = entry
+                    if self.checkpoint is not None and item in self.checkpoint:
+                        self.skipped += 1
+                        continue
+                    pending.append((pool.submit(self.send, payload), index, item))
+                if not pending:
+                    return
+
+                if self.ordered:
+                    done = [pending.popleft()]
+                else:
+                    wait([future for future, _, _ in pending], return_when=FIRST_COMPLETED)
+                    done = [entry for entry in pending if entry[0].done()]
+                    for entry in done:
+                        pending.remove(entry)
+
+                for future, index, item in done:
+                    try:
+                        result = future.result()
+                    except Exception as error:
+                        self.failures.append(BulkFailure(index, item, error))
+                        continue
+                    self.succeeded += 1
+                    if self.checkpoint is not None:
+                        self.checkpoint.record(item)
+                    yield result
+
+    def run(self) -> List[Any]:
+        """Runs the whole job and returns every result."""
+        return list(self)
@@ -0,0 +1,268 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+# Hierarchy metadata rarely changes, so it is kept for five minutes unless configured otherwise.
+DEFAULT_TTL = 300
+
+
+def copy_json(value: Any) -> Any:
+    """Copies decoded JSON, so a caller can change what it was handed without touching a cached or shared copy."""
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
+
+
+class ResponseCache:
+    """A bounded, thread-safe cache of decoded GET responses with a TTL per category.
+
+    Values are returned as stored; callers that hand them on should copy them with
+    :func:`copy_json` first, as ``ClickUpClient`` does.
+
+    Entries are grouped by category ("list", "folder", "space") so each kind of
+    endpoint can have its own time to live and so a write to one kind of object can
+    invalidate everything of that kind at once. When the cache is full, the least
+    recently used entry is evicted.
+
+    Args:
+        :maxsize (int, optional): The maximum number of cached responses. Defaults to 1024.
+        :ttl (float, optional): Seconds an entry stays fresh when its category has no TTL of its own. Defaults to 300.
+        :ttls (Dict[str, float], optional): Seconds an entry stays fresh, per category. Defaults to None.
+    """
+
+    def __init__(
+        self, maxsize: int = 1024, ttl: float = DEFAULT_TTL, ttls: Dict[str, float] = None
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict:
+        """Hit, miss, eviction and invalidation counts plus the current size and hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def get(self, category: str, key: str) -> Optional[Any]:
+        """Returns a fresh cached response, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get((category, key))
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[(category, key)]
+                self.misses += 1
+                return None
+            self._entries.move_to_end((category, key))
+            self.hits += 1
+            return entry[1]
+
+    def set(self, category: str, key: str, value: Any):
+        """Stores a response, evicting the least recently used entries when full."""
+        expires = time.monotonic() + self.ttls.get(category, self.ttl)
+        with self._lock:
+            self._entries[(category, key)] = (expires, value)
+            self._entries.move_to_end((category, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *categories: str):
+        """Drops every cached response in the given categories."""
+        with self._lock:
+            for cache_key in [k for k in self._entries if k[0] in categories]:
+                del self._entries[cache_key]
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class CachedResponse:
+    """A response read back from a SQLiteResponseCache."""
+
+    def __init__(self, body: str, fetched_at: float, etag: str, last_modified: str, fresh: bool):
+        self.body = body
+        self.fetched_at = fetched_at
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fresh = fresh
+
+    def json(self):
+        return json.loads(self.body)
+
+    @property
+    def revalidation_headers(self) -> dict:
+        """Conditional request headers built from the stored validators."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class SQLiteResponseCache:
+    """A persistent cache of raw GET responses in a SQLite database, shared across runs and processes.
+
+    Responses are keyed by the normalized request URL and a hash of the access token,
+    and stored as raw JSON with their fetch time and any ETag or Last-Modified
+    validators. A fresh entry is served without a request. A stale entry with
+    validators is revalidated with a conditional request, and a 304 answer refreshes
+    it without downloading the body again. Least recently used rows are pruned once
+    the database exceeds ``max_entries`` rows or ``max_bytes`` of stored bodies.
+
+    Args:
+        :path (str): The SQLite database file. Created if it does not exist.
+        :ttl (float, optional): Seconds a stored response is served without revalidation. Defaults to 300.
+        :max_entries (int, optional): The maximum number of stored responses. Defaults to 10000.
+        :max_bytes (int, optional): The maximum total size of stored bodies. Defaults to None, meaning unbounded.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = 10000,
+        max_bytes: int = None,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        # Imported here so clients that never use a disk cache do not pay for loading sqlite3.
+        import sqlite3
+
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT
+                )"""
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+            )
+
+    @property
+    def stats(self) -> dict:
+        """Hit, miss and revalidation counts for this process plus the number of stored responses."""
+        with self._lock:
+            size = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "size": size,
+        }
+
+    @staticmethod
+    def key(url: str, token: str) -> str:
+        """Builds the cache key for a request: a token hash plus the URL with its query parameters sorted."""
+        parsed = urlparse(url)
+        query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+        normalized = urlunparse(parsed._replace(query=query, fragment=""))
+        return f"{hashlib.sha256(token.encode()).hexdigest()[:16]} {normalized}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Returns the stored response for a key, fresh or stale, or None if nothing is stored."""
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT body, fetched_at, etag, last_modified FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        body, fetched_at, etag, last_modified = row
+        fresh = now - fetched_at < self.ttl
+        if fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return CachedResponse(body, fetched_at, etag, last_modified, fresh)
+
+    def set(self, key: str, body: str, etag: str = None, last_modified: str = None):
+        """Stores a raw response body and its validators, then prunes the cache to its size caps."""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, len(body), now, now, etag, last_modified),
+            )
+            self.__prune()
+
+    def touch(self, key: str):
+        """Marks a stored response as freshly fetched after the server confirmed it is unchanged."""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+        self.revalidations += 1
+
+    def __prune(self):
+        count, size = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if count > self.max_entries:
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,),
+            )
+        if self.max_bytes is not None and size > self.max_bytes:
+            excess = size - self.max_bytes
+            freed = 0
+            for key, row_size in self._connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at"
+            ).fetchall():
+                if freed >= excess:
+                    break
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                freed += row_size
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self):
+        self._connection.close()
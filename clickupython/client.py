@@ -1,59 +1,456 @@
 import requests
+from requests.adapters import HTTPAdapter
 import urllib
 import urllib.parse
 from urllib.parse import urlparse
 import os
 import json
 import ntpath
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Union
+from contextlib import contextmanager
+import threading
 from time import sleep
 from datetime import datetime
 
 from clickupython.helpers.timefuncs import fuzzy_time_to_seconds, fuzzy_time_to_unix
 from clickupython.helpers import formatting
+from clickupython.helpers.pagination import iter_pages, iter_windows
 from clickupython import models
 from clickupython import exceptions
+from clickupython.bulk import BulkFailure, BulkJob, Checkpoint
+from clickupython.cache import ResponseCache, SQLiteResponseCache, copy_json
+from clickupython.concurrency import AdaptiveConcurrencyLimiter, SingleFlight
+from clickupython.ratelimit import RateLimiter, TokenBucketRateLimiter
+from clickupython.retry import DEFAULT_RETRY_STATUSES, RetryPolicy
+from clickupython.tokens import TokenPool
 
 
 API_URL = "https://api.clickup.com/api/v2/"
 
 
+def _team_tasks_query(
+    page: int,
+    order_by: str,
+    reverse: bool,
+    subtasks: bool,
+    space_ids: List[str],
+    project_ids: List[str],
+    list_ids: List[str],
+    statuses: List[str],
+    include_closed: bool,
+    assignees: List[str],
+    tags: List[str],
+    due_date_gt: str,
+    due_date_lt: str,
+    date_created_gt: str,
+    date_created_lt: str,
+    date_updated_gt: str,
+    date_updated_lt: str,
+) -> str:
+    """Builds the path and query string for a filtered team tasks request."""
+    if order_by not in ["id", "created", "updated", "due_date"]:
+        raise exceptions.ClickupClientError(
+            "Options are: id, created, updated, due_date", "Invalid order_by value"
+        )
+
+    supplied_values = [
+        f"page={page}",
+        f"order_by={order_by}",
+        f"reverse={str(reverse).lower()}",
+        f"include_closed={str(include_closed).lower()}",
+    ]
+
+    if statuses:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('statuses[]')}={','.join(statuses)}"
+        )
+    if assignees:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('assignees[]')}={','.join(assignees)}"
+        )
+    if tags:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('tags[]')}={','.join(tags)}"
+        )
+    if due_date_gt:
+        supplied_values.append(f"due_date_gt={fuzzy_time_to_unix(due_date_gt)}")
+    if due_date_lt:
+        supplied_values.append(f"due_date_lt={fuzzy_time_to_unix(due_date_lt)}")
+    if space_ids:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('space_ids[]')}={','.join(space_ids)}"
+        )
+    if project_ids:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('project_ids[]')}={','.join(project_ids)}"
+        )
+    if list_ids:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('list_ids[]')}={','.join(list_ids)}"
+        )
+    if date_created_gt:
+        supplied_values.append(f"date_created_gt={date_created_gt}")
+    if date_created_lt:
+        supplied_values.append(f"date_created_lt={date_created_lt}")
+    if date_updated_gt:
+        supplied_values.append(f"date_updated_gt={date_updated_gt}")
+    if date_updated_lt:
+        supplied_values.append(f"date_updated_lt={date_updated_lt}")
+    if subtasks:
+        supplied_values.append(f"subtasks=true")
+
+    return f"task?{'&'.join(supplied_values)}"
+
+
+def _tasks_query(
+    archived: bool,
+    page: int,
+    order_by: str,
+    reverse: bool,
+    subtasks: bool,
+    statuses: List[str],
+    include_closed: bool,
+    assignees: List[str],
+    due_date_gt: str,
+    due_date_lt: str,
+    date_created_gt: str,
+    date_created_lt: str,
+    date_updated_gt: str,
+    date_updated_lt: str,
+) -> str:
+    """Builds the path and query string for a filtered list tasks request."""
+    if order_by not in ["id", "created", "updated", "due_date"]:
+        raise exceptions.ClickupClientError(
+            "Options are: id, created, updated, due_date", "Invalid order_by value"
+        )
+
+    supplied_values = [
+        f"archived={str(archived).lower()}",
+        f"page={page}",
+        f"order_by={order_by}",
+        f"reverse={str(reverse).lower()}",
+        f"include_closed={str(include_closed).lower()}",
+    ]
+
+    if statuses:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('statuses[]')}={','.join(statuses)}"
+        )
+    if assignees:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('assignees[]')}={','.join(assignees)}"
+        )
+    if due_date_gt:
+        supplied_values.append(f"due_date_gt={fuzzy_time_to_unix(due_date_gt)}")
+    if due_date_lt:
+        supplied_values.append(f"due_date_lt={fuzzy_time_to_unix(due_date_lt)}")
+    if date_created_gt:
+        supplied_values.append(f"date_created_gt={date_created_gt}")
+    if date_created_lt:
+        supplied_values.append(f"date_created_lt={date_created_lt}")
+    if date_updated_gt:
+        supplied_values.append(f"date_updated_gt={date_updated_gt}")
+    if date_updated_lt:
+        supplied_values.append(f"date_updated_lt={date_updated_lt}")
+    if subtasks:
+        supplied_values.append(f"subtasks=true")
+
+    return f"task?{'&'.join(supplied_values)}"
+
+
+def _time_entries_query(
+    start_date: str, end_date: str, assignees: List[str]
+) -> str:
+    """Builds the path and query string for a time entries in range request."""
+    return _time_entries_window_query(
+        fuzzy_time_to_unix(start_date) if start_date else "",
+        fuzzy_time_to_unix(end_date) if end_date else "",
+        assignees,
+    )
+
+
+def _time_entries_window_query(start: str, end: str, assignees: List[str]) -> str:
+    """Builds the path and query string for a time entries request between two Unix timestamps in milliseconds."""
+    assignees_temp = "assignee="
+
+    if assignees:
+        if len(assignees) > 1:
+            assignees_temp = f'assignee={",".join(assignees)}'
+
+        if len(assignees) == 1:
+            assignees_temp = f"assignee={assignees[0]}"
+
+    return f"time_entries?start_date={start}&end_date={end}&{assignees_temp}"
+
+
+def _entry_ms(value) -> int:
+    return int(value) if value not in (None, "") else None
+
+
+def _project(items: List[dict], fields: List[str] = None) -> List[dict]:
+    """Returns raw response items, trimmed to the given fields when there are any. Dotted fields such as
+    "status.status" reach into nested objects and are returned under the dotted name."""
+    if not fields:
+        return items
+    if not any("." in field for field in fields):
+        return [{field: item.get(field) for field in fields} for item in items]
+
+    paths = [(field, field.split(".")) for field in fields]
+    projected = []
+    for item in items:
+        row = {}
+        for field, path in paths:
+            value = item
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            row[field] = value
+        projected.append(row)
+    return projected
+
+
+def _update_task_payload(
+    name: str = None,
+    description: str = None,
+    status: str = None,
+    priority: int = None,
+    time_estimate: int = None,
+    archived: bool = None,
+    add_assignees: List[str] = None,
+    remove_assignees: List[int] = None,
+) -> str:
+    """Validates the changes to a task and serializes them into an update task request body."""
+    if priority and priority not in range(1, 4):
+        raise exceptions.ClickupClientError(
+            "Priority must be in range of 0-4.", "Priority out of range"
+        )
+
+    arguments = {}
+    arguments.update(vars())
+    arguments.pop("arguments", None)
+    arguments.pop("add_assignees", None)
+    arguments.pop("remove_assignees", None)
+
+    if add_assignees and remove_assignees:
+        arguments.update({"assignees": {"add": add_assignees, "rem": remove_assignees}})
+    elif add_assignees:
+        arguments.update({"assignees": {"add": add_assignees}})
+    elif remove_assignees:
+        arguments.update({"assignees": {"rem": remove_assignees}})
+
+    return json.dumps({k: v for k, v in arguments.items() if v is not None})
+
+
+def _task_payload(
+    name: str,
+    description: str = None,
+    priority: int = None,
+    assignees: [] = None,
+    tags: [] = None,
+    status: str = None,
+    due_date: str = None,
+    start_date: str = None,
+    notify_all: bool = True,
+) -> str:
+    """Validates the fields of a new task and serializes them into a create task request body."""
+    if priority and priority not in range(1, 4):
+        raise exceptions.ClickupClientError(
+            "Priority must be in range of 0-4.", "Priority out of range"
+        )
+    if due_date:
+        due_date = fuzzy_time_to_unix(due_date)
+
+    arguments = {}
+    arguments.update(vars())
+    arguments.pop("arguments", None)
+
+    return json.dumps({k: v for k, v in arguments.items() if v is not None})
+
+
+def request_headers(accesstoken: str, file_upload: bool = False) -> dict:
+    """Generates headers for HTTP requests to the ClickUp API. Used by both the synchronous and the async client.
+
+    Args:
+        :accesstoken (str): The access token to authorize with.
+        :file_upload (bool, optional): Leave out the JSON content type, so a multipart body can set its own. Defaults to False.
+
+    Returns:
+        :dict: Returns headers for HTTP requests
+    """
+    return (
+        {"Authorization": accesstoken}
+        if file_upload
+        else {"Authorization": accesstoken, "Content-Type": "application/json"}
+    )
+
+
+def error_text(response_json, attempts: int) -> str:
+    """Returns the server's error text from a decoded response body, falling back to a generic message when
+    the body carries none. Used by both the synchronous and the async client."""
+    if isinstance(response_json, dict) and response_json.get("err"):
+        return response_json["err"]
+    return f"Request failed after {attempts} attempt(s)"
+
+
 class ClickUpClient:
     def __init__(
         self,
-        accesstoken: str,
+        accesstoken: Union[str, TokenPool],
         api_url: str = API_URL,
         default_space: str = None,
         default_list: str = None,
         default_task: str = None,
         retry_rate_limited_requests: bool = False,
         rate_limit_buffer_wait_time: int = 5,
-        start_rate_limit_remaining: int = 100,
-        start_rate_limit_reset: float = datetime.now().timestamp()
+        start_rate_limit_remaining: int = None,
+        start_rate_limit_reset: float = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        session: requests.Session = None,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+        cache: ResponseCache = None,
+        disk_cache: SQLiteResponseCache = None,
+        coalesce_requests: bool = True,
+        trusted_models: bool = False,
+        lazy_tasks: bool = False,
     ):
         self.api_url = api_url
-        self.accesstoken = accesstoken
+        self.token_pool = accesstoken if isinstance(accesstoken, TokenPool) else None
+        self.accesstoken = self.token_pool.tokens[0] if self.token_pool else accesstoken
+        self._pinned = threading.local()
         self.request_count = 0
+        self._count_lock = threading.Lock()
         self.default_space = default_space
         self.default_list = default_list
         self.default_task = default_task
-        self.rate_limit_remaining = start_rate_limit_remaining
-        self.rate_limit_reset = start_rate_limit_reset
+        self.rate_limit_remaining = (
+            100 if start_rate_limit_remaining is None else start_rate_limit_remaining
+        )
+        self.rate_limit_reset = (
+            datetime.now().timestamp() if start_rate_limit_reset is None else start_rate_limit_reset
+        )
         self.rate_limit_buffer_wait_time = rate_limit_buffer_wait_time
         self.retry_rate_limited_requests= retry_rate_limited_requests
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter(
+            reset_buffer=rate_limit_buffer_wait_time
+        )
+        if start_rate_limit_remaining is not None and start_rate_limit_reset is not None:
+            # A known starting budget only fills in tokens the limiter has not seen, so it never
+            # overwrites state that other clients sharing the limiter learned from the server.
+            for token in self.token_pool or [self.accesstoken]:
+                self.rate_limiter.seed(
+                    token, start_rate_limit_remaining, start_rate_limit_reset
+                )
+        self.retry_policy = retry_policy or RetryPolicy(
+            retry_statuses=DEFAULT_RETRY_STATUSES | {429}
+            if retry_rate_limited_requests
+            else DEFAULT_RETRY_STATUSES
+        )
+        self.concurrency_limiter = concurrency_limiter
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.trusted_models = trusted_models
+        self.lazy_tasks = lazy_tasks
+        self._owns_session = session is None
+        self.session = session or self.__build_session(
+            pool_connections, pool_maxsize, pool_block, keep_alive
+        )
 
-    def __parse_response_rate_limit_headers(self, response : requests.Response):
-        self.rate_limit_remaining = int(response.headers.get("x-ratelimit-remaining"))
-        self.rate_limit_reset = float(response.headers.get("x-ratelimit-reset"))
+    def __build_session(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: bool,
+    ) -> requests.Session:
+        """Internal method to build the pooled HTTP session shared by GET, POST, PUT and DELETE requests.
 
-    def __check_rate_limit(self):
-        if self.rate_limit_remaining <= 1:
-            resume_time = datetime.fromtimestamp(
-                self.rate_limit_reset + self.rate_limit_buffer_wait_time
+        Args:
+            :pool_connections (int): The number of per-host connection pools to keep.
+            :pool_maxsize (int): The maximum number of connections kept open per host.
+            :pool_block (bool): Block when the pool is exhausted instead of opening a throwaway connection.
+            :keep_alive (bool): Reuse connections between requests. Disabling sends "Connection: close".
+
+        Returns:
+            :requests.Session: Returns a session with a pooled adapter mounted for http and https.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self):
+        """Closes the pooled HTTP session and releases its connections. Sessions passed in by the caller are left open."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @contextmanager
+    def use_token(self, token: str):
+        """Pins every request made by the current thread inside the block to one access token. Use it for
+        endpoints that act on behalf of a specific user, such as starting or stopping a timer.
+
+        Args:
+            :token (str): The access token to send.
+        """
+        previous = getattr(self._pinned, "token", None)
+        self._pinned.token = token
+        try:
+            yield self
+        finally:
+            self._pinned.token = previous
+
+    def __select_token(self) -> str:
+        """Internal method that picks the access token for the next request: the pinned token if there is one,
+        otherwise the pooled token with the most rate limit headroom."""
+        pinned = getattr(self._pinned, "token", None)
+        if pinned:
+            return pinned
+        if self.token_pool:
+            return self.token_pool.select(self.rate_limiter)
+        return self.accesstoken
+
+    def __parse_response_rate_limit_headers(
+        self, response: requests.Response, token: str
+    ):
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        limit = response.headers.get("x-ratelimit-limit")
+        if self.concurrency_limiter:
+            self.concurrency_limiter.observe(
+                self.rate_limit_remaining if remaining is None else int(remaining),
+                response.status_code,
             )
-            seconds = (resume_time - datetime.now()).total_seconds()
-            print(f"Waiting for rate limit to reset for {seconds} seconds.")
-            sleep(seconds)
+        if remaining is None or reset is None:
+            return
+        self.rate_limit_remaining = int(remaining)
+        self.rate_limit_reset = float(reset)
+        if limit is None:
+            self.rate_limiter.update(token, self.rate_limit_remaining, self.rate_limit_reset)
+        else:
+            self.rate_limiter.update(
+                token, self.rate_limit_remaining, self.rate_limit_reset, limit=int(limit)
+            )
+
+    def __check_rate_limit(self, token: str):
+        """Internal method that blocks until the rate limiter allows another request with the given token."""
+        self.rate_limiter.acquire(token)
 
     # Generates headers for use in GET, POST, DELETE, PUT requests
 
@@ -64,30 +461,120 @@ class ClickUpClient:
             :dict: Returns headers for HTTP requests
         """
 
-        return (
-            {"Authorization": self.accesstoken}
-            if file_upload
-            else {
-                "Authorization": self.accesstoken,
-                "Content-Type": "application/json",
-            }
-        )
+        return request_headers(self.accesstoken, file_upload)
+
+    def __send(self, method: str, path: str, idempotent: bool = None, token: str = None, **kwargs):
+        """Internal method that sends a request through the pooled session. Every attempt picks an access token,
+        waits for the rate limiter, and failed attempts are retried according to the client's retry policy.
+
+        Args:
+            :method (str): The HTTP verb.
+            :path (str): The full request URL.
+            :idempotent (bool, optional): Whether the request can safely be sent twice. Defaults to True for every verb except POST.
+            :token (str, optional): Send every attempt with this access token instead of picking one. Defaults to None.
 
-    def __get_request(self, model, *additionalpath) -> json:
-        """Performs a Get request to the ClickUp API"""
+        Returns:
+            :requests.Response: The final response.
+        """
+        if idempotent is None:
+            idempotent = method != "POST"
+
+        attempt = 0
+        while True:
+            attempt += 1
+            attempt_token = token or self.__select_token()
+            kwargs["headers"] = {**kwargs["headers"], "Authorization": attempt_token}
+            self.__check_rate_limit(attempt_token)
+            try:
+                if self.concurrency_limiter:
+                    with self.concurrency_limiter:
+                        response = self.session.request(method, path, **kwargs)
+                else:
+                    response = self.session.request(method, path, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                delay = self.retry_policy.retry_delay(attempt, idempotent, error=error)
+                if delay is None:
+                    raise
+            else:
+                with self._count_lock:
+                    self.request_count += 1
+                self.__parse_response_rate_limit_headers(response, attempt_token)
+                delay = self.retry_policy.retry_delay(
+                    attempt, idempotent, response=response
+                )
+                if delay is None:
+                    if response.status_code in self.retry_policy.retry_statuses:
+                        try:
+                            response_json = response.json()
+                        except ValueError:
+                            response_json = None
+                        raise exceptions.ClickupClientError(
+                            error_text(response_json, attempt), response.status_code
+                        )
+                    return response
+
+            for _, (_, upload) in kwargs.get("files") or []:
+                upload.seek(0)
+            sleep(delay)
+
+    def __build(self, model, data: dict):
+        """Internal method that builds a response model. With trusted_models, pydantic validation is skipped, and
+        with lazy_tasks, tasks defer building their nested fields until they are read."""
+        return models.build(model, data, self.trusted_models, self.lazy_tasks)
+
+    def __invalidate(self, *categories: str):
+        """Internal method that drops cached responses a write may have made stale."""
+        if self.cache is not None:
+            self.cache.invalidate(*categories)
+
+    def __get_request(self, model, *additionalpath, cache_category=None) -> json:
+        """Performs a Get request to the ClickUp API. Responses in a cache category are served from and stored
+        in the client's cache when one is configured. Identical requests made concurrently from several threads
+        share a single HTTP call. The access token is chosen up front and is part of every cache and sharing
+        key, and every caller gets its own copy of the decoded JSON."""
         path = formatting.url_join(API_URL, model, *additionalpath)
+        token = self.__select_token()
+
+        if self.cache is not None and cache_category:
+            key = SQLiteResponseCache.key(path, token)
+            cached = self.cache.get(cache_category, key)
+            if cached is not None:
+                return copy_json(cached)
+            response_json = self.__get_shared(path, token)
+            if response_json is not None:
+                self.cache.set(cache_category, key, copy_json(response_json))
+            return response_json
+        return self.__get_shared(path, token)
 
-        self.__check_rate_limit()
+    def __get_shared(self, path: str, token: str) -> json:
+        """Internal method that fetches a GET request, sharing the call with identical requests in flight."""
+        if self.single_flight is not None:
+            return self.single_flight.do(
+                (path, token), lambda: self.__fetch(path, token), share=copy_json
+            )
+        return self.__fetch(path, token)
+
+    def __fetch(self, path: str, token: str) -> json:
+        """Internal method that sends a GET request with the given token and decodes the response. With a disk
+        cache, every response is stored on disk and stale entries are revalidated with a conditional request."""
+        headers = self.__headers()
+        if self.disk_cache is not None:
+            disk_key = self.disk_cache.key(path, token)
+            stored = self.disk_cache.get(disk_key)
+            if stored is not None:
+                if stored.fresh:
+                    return stored.json()
+                headers.update(stored.revalidation_headers)
+
+        response = self.__send("GET", path, headers=headers, token=token)
+
+        if self.disk_cache is not None and stored is not None and response.status_code == 304:
+            self.disk_cache.touch(disk_key)
+            return stored.json()
 
-        response = requests.get(path, headers=self.__headers())
-        self.request_count += 1
         response_json = response.json()
 
-        self.__parse_response_rate_limit_headers(response)
-
         if response.status_code == 429:
-            if self.retry_rate_limited_requests:
-                return self.__get_request(model, *additionalpath)
             raise exceptions.ClickupClientError(
                 "Rate limit exceeded", response.status_code
             )
@@ -96,48 +583,58 @@ class ClickUpClient:
                 response_json["err"], response.status_code
             )
         if response.ok:
+            if self.disk_cache is not None:
+                self.disk_cache.set(
+                    disk_key,
+                    response.text,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
             return response_json
 
     # Performs a Post request to the ClickUp API
     def __post_request(
-        self, model, data, upload_files=None, file_upload=False, *additionalpath
+        self,
+        model,
+        data,
+        upload_files=None,
+        file_upload=False,
+        *additionalpath,
+        idempotent=False,
     ):
 
         path = formatting.url_join(API_URL, model, *additionalpath)
-        if data:
-            if upload_files:
-                response = requests.post(
-                    path, headers=self.__headers(True), data=data, files=upload_files
-                )
-                self.request_count += 1
-            else:
-                response = requests.post(path, headers=self.__headers(), data=data)
-
-                self.request_count += 1
-            response_json = response.json()
-
-            if response.status_code in [401, 400, 500, 404]:
-                raise exceptions.ClickupClientError(
-                    response_json["err"], response.status_code
-                )
-            if response.ok:
-                return response_json
+        if data and upload_files:
+            response = self.__send(
+                "POST",
+                path,
+                idempotent,
+                headers=self.__headers(True),
+                data=data,
+                files=upload_files,
+            )
+        elif data:
+            response = self.__send(
+                "POST", path, idempotent, headers=self.__headers(), data=data
+            )
         else:
-            response = requests.post(path, headers=self.__headers())
-            response_json = response.json()
-            if response.status_code in [401, 400, 500, 404]:
-                raise exceptions.ClickupClientError(
-                    response_json["err"], response.status_code
-                )
-            if response.ok:
-                return response_json
+            response = self.__send("POST", path, idempotent, headers=self.__headers())
+        response_json = response.json()
+
+        if response.status_code in [401, 400, 500, 404]:
+            raise exceptions.ClickupClientError(
+                response_json["err"], response.status_code
+            )
+        if response.ok:
+            return response_json
 
     # Performs a Put request to the ClickUp API
     def __put_request(self, model, data, *additionalpath):
         path = formatting.url_join(API_URL, model, *additionalpath)
-        response = requests.put(path, headers=self.__headers(), data=data)
-        self.request_count += 1
+
+        response = self.__send("PUT", path, headers=self.__headers(), data=data)
         response_json = response.json()
+
         if response.status_code in [401, 400]:
             raise exceptions.ClickupClientError(
                 response_json["err"], response.status_code
@@ -148,8 +645,9 @@ class ClickUpClient:
     # Performs a Delete request to the ClickUp API
     def __delete_request(self, model, *additionalpath):
         path = formatting.url_join(API_URL, model, *additionalpath)
-        response = requests.delete(path, headers=self.__headers())
-        self.request_count += 1
+
+        response = self.__send("DELETE", path, headers=self.__headers())
+
         try:
             response_json = response.json()
         except:
@@ -174,9 +672,9 @@ class ClickUpClient:
             :models.SingleList: Returns an object of type List.
         """
         model = "list/"
-        fetched_list = self.__get_request(model, list_id)
+        fetched_list = self.__get_request(model, list_id, cache_category="list")
 
-        return models.SingleList.build_list(fetched_list)
+        return self.__build(models.SingleList, fetched_list)
 
     
     def get_folderless_lists(self, space_id: str) -> models.AllLists:
@@ -189,8 +687,10 @@ class ClickUpClient:
             :list.AllLists: Returns a list of type AllLists.
         """
         model = "space/"
-        fetched_lists = self.__get_request(model, space_id, "list")
-        return models.AllLists.build_lists(fetched_lists)
+        fetched_lists = self.__get_request(
+            model, space_id, "list", cache_category="list"
+        )
+        return self.__build(models.AllLists, fetched_lists)
     
     
     def get_lists(self, folder_id: str) -> models.AllLists:
@@ -203,8 +703,8 @@ class ClickUpClient:
             :list.AllLists: Returns a list of type AllLists.
         """
         model = "folder/"
-        fetched_lists = self.__get_request(model, folder_id)
-        return models.AllLists.build_lists(fetched_lists)
+        fetched_lists = self.__get_request(model, folder_id, cache_category="list")
+        return self.__build(models.AllLists, fetched_lists)
 
     def create_list(
         self,
@@ -238,8 +738,9 @@ class ClickUpClient:
         created_list = self.__post_request(
             model, json.dumps(data), None, False, folder_id, "list"
         )
+        self.__invalidate("list", "folder")
         if created_list:
-            return models.SingleList.build_list(created_list)
+            return self.__build(models.SingleList, created_list)
 
     def create_folderless_list(
         self,
@@ -264,8 +765,9 @@ class ClickUpClient:
         created_list = self.__post_request(
             model, final_dict, None, False, space_id, "list"
         )
+        self.__invalidate("list", "folder")
         if created_list:
-            return models.SingleList.build_list(created_list)
+            return self.__build(models.SingleList, created_list)
 
     # //TODO Add unit tests
     def update_list(
@@ -298,8 +800,9 @@ class ClickUpClient:
         print(final_dict)
         model = "list/"
         updated_list = self.__put_request(model, final_dict, list_id)
+        self.__invalidate("list", "folder")
         if updated_list:
-            return models.SingleList.build_list(updated_list)
+            return self.__build(models.SingleList, updated_list)
 
     def delete_list(self, list_id: str) -> bool:
 
@@ -310,6 +813,7 @@ class ClickUpClient:
         """
         model = "list/"
         self.__delete_request(model, list_id)
+        self.__invalidate("list", "folder")
         return True
 
     def add_task_to_list(
@@ -327,7 +831,10 @@ class ClickUpClient:
             models.Task: Returns an object of type Task.
         """
         model = "list/"
-        task = self.__post_request(model, None, None, False, list_id, "task", task_id)
+        task = self.__post_request(
+            model, None, None, False, list_id, "task", task_id, idempotent=True
+        )
+        self.__invalidate("list")
 
         return True
 
@@ -347,6 +854,7 @@ class ClickUpClient:
         """
         model = "list/"
         task = self.__delete_request(model, list_id, "task", task_id)
+        self.__invalidate("list")
         return True
 
     # Folders
@@ -361,9 +869,11 @@ class ClickUpClient:
             :Folder: Returns an object of type Folder.
         """
         model = "folder/"
-        fetched_folder = self.__get_request(model, folder_id)
+        fetched_folder = self.__get_request(
+            model, folder_id, cache_category="folder"
+        )
         if fetched_folder:
-            return models.Folder.build_folder(fetched_folder)
+            return self.__build(models.Folder, fetched_folder)
 
     def get_folders(self, space_id: str) -> models.Folders:
         """Fetches all folders from a given space ID and returns a list of Folder objects.
@@ -375,9 +885,11 @@ class ClickUpClient:
             :Folders: Returns a list of Folder objects.
         """
         model = "space/"
-        fetched_folders = self.__get_request(model, space_id, "folder")
+        fetched_folders = self.__get_request(
+            model, space_id, "folder", cache_category="folder"
+        )
         if fetched_folders:
-            return models.Folders.build_folders(fetched_folders)
+            return self.__build(models.Folders, fetched_folders)
 
     def create_folder(self, space_id: str, name: str) -> models.Folder:
         """Creates and returns a Folder object in a space from a given space ID.
@@ -396,8 +908,9 @@ class ClickUpClient:
         created_folder = self.__post_request(
             model, json.dumps(data), None, False, space_id, "folder"
         )
+        self.__invalidate("folder")
         if created_folder:
-            return models.Folder.build_folder(created_folder)
+            return self.__build(models.Folder, created_folder)
 
     def update_folder(self, folder_id: str, name: str) -> models.Folder:
         """Updates the name of a folder given the folder ID.
@@ -414,8 +927,9 @@ class ClickUpClient:
         }
         model = "folder/"
         updated_folder = self.__put_request(model, json.dumps(data), folder_id)
+        self.__invalidate("folder", "list")
         if updated_folder:
-            return models.Folder.build_folder(updated_folder)
+            return self.__build(models.Folder, updated_folder)
 
     def delete_folder(self, folder_id: str) -> None:
         """Deletes a folder from a given folder ID.
@@ -425,6 +939,7 @@ class ClickUpClient:
         """
         model = "folder/"
         deleted_folder_status = self.__delete_request(model, folder_id)
+        self.__invalidate("folder", "list")
         return True
 
     # Tasks
@@ -450,9 +965,7 @@ class ClickUpClient:
                 )
 
                 if uploaded_attachment:
-                    final_attachment = models.Attachment.build_attachment(
-                        uploaded_attachment
-                    )
+                    final_attachment = self.__build(models.Attachment, uploaded_attachment)
                 return final_attachment
 
     # // TODO Add "Include subtasks option"
@@ -467,7 +980,7 @@ class ClickUpClient:
         """
         model = "task/"
         fetched_task = self.__get_request(model, task_id)
-        final_task = models.Task.build_task(fetched_task)
+        final_task = self.__build(models.Task, fetched_task)
         if final_task:
             return final_task
 
@@ -491,7 +1004,9 @@ class ClickUpClient:
         date_created_lt: str = None,
         date_updated_gt: str = None,
         date_updated_lt: str = None,
-    ) -> models.Tasks:
+        raw: bool = False,
+        fields: List[str] = None,
+    ) -> Union[models.Tasks, List[dict]]:
         """Gets filtered tasks for a team.
 
         Args:
@@ -513,6 +1028,9 @@ class ClickUpClient:
             :date_created_lt (str, optional): [description]. Defaults to None.
             :date_updated_gt (str, optional): [description]. Defaults to None.
             :date_updated_lt (str, optional): [description]. Defaults to None.
+            :raw (bool, optional): Return the tasks as plain dicts without building models. Defaults to False.
+            :fields (List[str], optional): Return plain dicts holding only these fields. Dotted names such as
+                "status.status" reach into nested objects. Defaults to None.
 
         Raises:
             exceptions.ClickupClientError: [description]
@@ -520,58 +1038,32 @@ class ClickUpClient:
         Returns:
             models.Tasks: [description]
         """
-        if order_by not in ["id", "created", "updated", "due_date"]:
-            raise exceptions.ClickupClientError(
-                "Options are: id, created, updated, due_date", "Invalid order_by value"
-            )
-
-        supplied_values = [
-            f"page={page}",
-            f"order_by={order_by}",
-            f"reverse={str(reverse).lower()}",
-        ]
-
-        if statuses:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('statuses[]')}={','.join(statuses)}"
-            )
-        if assignees:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('assignees[]')}={','.join(assignees)}"
-            )
-        if due_date_gt:
-            supplied_values.append(f"due_date_gt={fuzzy_time_to_unix(due_date_gt)}")
-        if due_date_lt:
-            supplied_values.append(f"due_date_lt={fuzzy_time_to_unix(due_date_lt)}")
-        if space_ids:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('space_ids[]')}={','.join(space_ids)}"
-            )
-        if project_ids:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('project_ids[]')}={','.join(project_ids)}"
-            )
-        if list_ids:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('list_ids[]')}={','.join(list_ids)}"
-            )
-        if date_created_gt:
-            supplied_values.append(f"date_created_gt={date_created_gt}")
-        if date_created_lt:
-            supplied_values.append(f"date_created_lt={date_created_lt}")
-        if date_updated_gt:
-            supplied_values.append(f"date_updated_gt={date_updated_gt}")
-        if date_updated_lt:
-            supplied_values.append(f"date_updated_lt={date_updated_lt}")
-        if subtasks:
-            supplied_values.append(f"subtasks=true")
-
-        joined_url = f"task?{'&'.join(supplied_values)}"
+        joined_url = _team_tasks_query(
+            page,
+            order_by,
+            reverse,
+            subtasks,
+            space_ids,
+            project_ids,
+            list_ids,
+            statuses,
+            include_closed,
+            assignees,
+            tags,
+            due_date_gt,
+            due_date_lt,
+            date_created_gt,
+            date_created_lt,
+            date_updated_gt,
+            date_updated_lt,
+        )
 
         model = "team/"
         fetched_tasks = self.__get_request(model, team_Id, joined_url)
         if fetched_tasks:
-            return models.Tasks.build_tasks(fetched_tasks)
+            if raw or fields:
+                return _project(fetched_tasks["tasks"], fields)
+            return self.__build(models.Tasks, fetched_tasks)
 
     def get_tasks(
         self,
@@ -590,7 +1082,9 @@ class ClickUpClient:
         date_created_lt: str = None,
         date_updated_gt: str = None,
         date_updated_lt: str = None,
-    ) -> models.Tasks:
+        raw: bool = False,
+        fields: List[str] = None,
+    ) -> Union[models.Tasks, List[dict]]:
 
         """The maximum number of tasks returned in this response is 100. When you are paging this request, you should check list limit
         against the length of each response to determine if you are on the last page.
@@ -624,6 +1118,9 @@ class ClickUpClient:
             :date_updated_gt (str, optional):
                 Retrieve tasks where the last update date is greater than the supplied date. Defaults to None.
             :date_updated_lt (str, optional): Retrieve tasks where the last update date is greater than the supplied date. Defaults to None.
+            :raw (bool, optional): Return the tasks as plain dicts without building models. Defaults to False.
+            :fields (List[str], optional): Return plain dicts holding only these fields. Dotted names such as
+                "status.status" reach into nested objects. Defaults to None.
 
         Raises:
             :exceptions.ClickupClientError: Invalid order_by value
@@ -632,48 +1129,173 @@ class ClickUpClient:
             :models.Tasks: Returns a list of item Task.
         """
 
-        if order_by not in ["id", "created", "updated", "due_date"]:
-            raise exceptions.ClickupClientError(
-                "Options are: id, created, updated, due_date", "Invalid order_by value"
-            )
-
-        supplied_values = [
-            f"archived={str(archived).lower()}",
-            f"page={page}",
-            f"order_by={order_by}",
-            f"reverse={str(reverse).lower()}",
-            f"include_closed={str(include_closed).lower()}",
-        ]
-
-        if statuses:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('statuses[]')}={','.join(statuses)}"
-            )
-        if assignees:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('assignees[]')}={','.join(assignees)}"
-            )
-        if due_date_gt:
-            supplied_values.append(f"due_date_gt={fuzzy_time_to_unix(due_date_gt)}")
-        if due_date_lt:
-            supplied_values.append(f"due_date_lt={fuzzy_time_to_unix(due_date_lt)}")
-        if date_created_gt:
-            supplied_values.append(f"date_created_gt={date_created_gt}")
-        if date_created_lt:
-            supplied_values.append(f"date_created_lt={date_created_lt}")
-        if date_updated_gt:
-            supplied_values.append(f"date_updated_gt={date_updated_gt}")
-        if date_updated_lt:
-            supplied_values.append(f"date_updated_lt={date_updated_lt}")
-        if subtasks:
-            supplied_values.append(f"subtasks=true")
-
-        joined_url = f"task?{'&'.join(supplied_values)}"
+        joined_url = _tasks_query(
+            archived,
+            page,
+            order_by,
+            reverse,
+            subtasks,
+            statuses,
+            include_closed,
+            assignees,
+            due_date_gt,
+            due_date_lt,
+            date_created_gt,
+            date_created_lt,
+            date_updated_gt,
+            date_updated_lt,
+        )
 
         model = "list/"
         fetched_tasks = self.__get_request(model, list_id, joined_url)
         if fetched_tasks:
-            return models.Tasks.build_tasks(fetched_tasks)
+            if raw or fields:
+                return _project(fetched_tasks["tasks"], fields)
+            return self.__build(models.Tasks, fetched_tasks)
+
+    def iter_tasks(
+        self,
+        list_id: str,
+        archived: bool = False,
+        page: int = 0,
+        order_by: str = "created",
+        reverse: bool = False,
+        subtasks: bool = False,
+        statuses: List[str] = None,
+        include_closed: bool = False,
+        assignees: List[str] = None,
+        due_date_gt: str = None,
+        due_date_lt: str = None,
+        date_created_gt: str = None,
+        date_created_lt: str = None,
+        date_updated_gt: str = None,
+        date_updated_lt: str = None,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        raw: bool = False,
+        fields: List[str] = None,
+    ) -> Iterator[Union[models.Task, dict]]:
+        """Lazily walks every page of tasks in a list, yielding one Task at a time. Only one page is held in memory
+        unless prefetch is enabled, in which case the next page is fetched in the background while the current one is consumed.
+
+        Args:
+            :list_id (str): The ID of the list to retrieve tasks from.
+            :page (int, optional): The page to start from. Defaults to 0.
+            :prefetch (bool, optional): Fetch the next page while the current one is being consumed. Defaults to False.
+            :concurrency (int, optional): Speculatively fetch this many pages at once, still yielding tasks in page order.
+                Every page request goes through the client's rate limit check. Defaults to 1.
+            :raw (bool, optional): Yield the tasks as plain dicts without building models. Defaults to False.
+            :fields (List[str], optional): Yield plain dicts holding only these fields. Dotted names such as
+                "status.status" reach into nested objects. Defaults to None.
+
+            All other arguments are the same filters accepted by get_tasks.
+
+        Returns:
+            :Iterator[models.Task]: Yields objects of type Task.
+        """
+
+        def fetch_page(page_number: int) -> List[models.Task]:
+            fetched_tasks = self.get_tasks(
+                list_id,
+                archived,
+                page_number,
+                order_by,
+                reverse,
+                subtasks,
+                statuses,
+                include_closed,
+                assignees,
+                due_date_gt,
+                due_date_lt,
+                date_created_gt,
+                date_created_lt,
+                date_updated_gt,
+                date_updated_lt,
+                raw,
+                fields,
+            )
+            if raw or fields:
+                return fetched_tasks or []
+            return fetched_tasks.tasks if fetched_tasks and fetched_tasks.tasks else []
+
+        return iter_pages(
+            fetch_page, page, prefetch=prefetch, concurrency=concurrency
+        )
+
+    def iter_team_tasks(
+        self,
+        team_Id: str,
+        page: int = 0,
+        order_by: str = "created",
+        reverse: bool = False,
+        subtasks: bool = False,
+        space_ids: List[str] = None,
+        project_ids: List[str] = None,
+        list_ids: List[str] = None,
+        statuses: List[str] = None,
+        include_closed: bool = False,
+        assignees: List[str] = None,
+        tags: List[str] = None,
+        due_date_gt: str = None,
+        due_date_lt: str = None,
+        date_created_gt: str = None,
+        date_created_lt: str = None,
+        date_updated_gt: str = None,
+        date_updated_lt: str = None,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        raw: bool = False,
+        fields: List[str] = None,
+    ) -> Iterator[Union[models.Task, dict]]:
+        """Lazily walks every page of filtered tasks for a team, yielding one Task at a time. Only one page is held in
+        memory unless prefetch is enabled, in which case the next page is fetched in the background while the current one is consumed.
+
+        Args:
+            :team_Id (str): The id of the team to get tasks for.
+            :page (int, optional): The page to start from. Defaults to 0.
+            :prefetch (bool, optional): Fetch the next page while the current one is being consumed. Defaults to False.
+            :concurrency (int, optional): Speculatively fetch this many pages at once, still yielding tasks in page order.
+                Every page request goes through the client's rate limit check. Defaults to 1.
+            :raw (bool, optional): Yield the tasks as plain dicts without building models. Defaults to False.
+            :fields (List[str], optional): Yield plain dicts holding only these fields. Dotted names such as
+                "status.status" reach into nested objects. Defaults to None.
+
+            All other arguments are the same filters accepted by get_team_tasks.
+
+        Returns:
+            :Iterator[models.Task]: Yields objects of type Task.
+        """
+
+        def fetch_page(page_number: int) -> List[models.Task]:
+            fetched_tasks = self.get_team_tasks(
+                team_Id,
+                page_number,
+                order_by,
+                reverse,
+                subtasks,
+                space_ids,
+                project_ids,
+                list_ids,
+                statuses,
+                include_closed,
+                assignees,
+                tags,
+                due_date_gt,
+                due_date_lt,
+                date_created_gt,
+                date_created_lt,
+                date_updated_gt,
+                date_updated_lt,
+                raw,
+                fields,
+            )
+            if raw or fields:
+                return fetched_tasks or []
+            return fetched_tasks.tasks if fetched_tasks and fetched_tasks.tasks else []
+
+        return iter_pages(
+            fetch_page, page, prefetch=prefetch, concurrency=concurrency
+        )
 
     def create_task(
         self,
@@ -709,28 +1331,63 @@ class ClickUpClient:
         Returns:
             :models.Task: [description]
         """
-        if priority and priority not in range(1, 4):
-            raise exceptions.ClickupClientError(
-                "Priority must be in range of 0-4.", "Priority out of range"
-            )
-        if due_date:
-            due_date = fuzzy_time_to_unix(due_date)
-
-        arguments = {}
-        arguments.update(vars())
-        arguments.pop("self", None)
-        arguments.pop("arguments", None)
-        arguments.pop("list_id", None)
-
-        final_dict = json.dumps({k: v for k, v in arguments.items() if v is not None})
+        final_dict = _task_payload(
+            name,
+            description,
+            priority,
+            assignees,
+            tags,
+            status,
+            due_date,
+            start_date,
+            notify_all,
+        )
+        return self.__post_task(list_id, final_dict)
 
+    def __post_task(self, list_id: str, payload: str) -> models.Task:
+        """Internal method that sends a serialized create task request body to a list."""
         model = "list/"
-        created_task = self.__post_request(
-            model, final_dict, None, False, list_id, "task"
-        )
+        created_task = self.__post_request(model, payload, None, False, list_id, "task")
 
         if created_task:
-            return models.Task.build_task(created_task)
+            return self.__build(models.Task, created_task)
+
+    def create_tasks_bulk(
+        self,
+        list_id: str,
+        specs: Iterable[dict],
+        max_workers: int = 8,
+        ordered: bool = False,
+    ) -> BulkJob:
+        """Creates many tasks in a list concurrently. Every spec is validated and serialized before the first
+        request is sent; invalid specs are reported as failures and never sent. Requests still go through the
+        client's rate limiter and retry policy.
+
+        Args:
+            :list_id (str): The id of the list to create the tasks in.
+            :specs (Iterable[dict]): One dict of :meth:`create_task` arguments per task, without list_id.
+            :max_workers (int, optional): The number of requests in flight at once. Defaults to 8.
+            :ordered (bool, optional): Yield tasks in the order of their specs instead of as they complete. Defaults to False.
+
+        Returns:
+            :BulkJob: Iterate over it to run the job and receive the created models.Task objects. Its failures list
+            holds a BulkFailure, with the spec's index, the spec and the error, for every task that was not created.
+        """
+        payloads = []
+        failures = []
+        for index, spec in enumerate(specs):
+            try:
+                payloads.append((index, spec, _task_payload(**spec)))
+            except Exception as error:
+                failures.append(BulkFailure(index, spec, error))
+
+        return BulkJob(
+            lambda payload: self.__post_task(list_id, payload),
+            payloads,
+            failures=failures,
+            max_workers=max_workers,
+            ordered=ordered,
+        )
 
     def update_task(
         self,
@@ -764,34 +1421,21 @@ class ClickUpClient:
         Returns:
             :models.Task: Returns an object of type Task.
         """
-        if priority and priority not in range(1, 4):
-            raise exceptions.ClickupClientError(
-                "Priority must be in range of 0-4.", "Priority out of range"
-            )
-
-        arguments = {}
-        arguments.update(vars())
-        arguments.pop("self", None)
-        arguments.pop("arguments", None)
-        arguments.pop("task_id", None)
-        arguments.pop("add_assignees", None)
-        arguments.pop("remove_assignees", None)
-
-        if add_assignees and remove_assignees:
-            arguments.update(
-                {"assignees": {"add": add_assignees, "rem": remove_assignees}}
-            )
-        elif add_assignees:
-            arguments.update({"assignees": {"add": add_assignees}})
-        elif remove_assignees:
-            arguments.update({"assignees": {"rem": remove_assignees}})
-
-        final_dict = json.dumps({k: v for k, v in arguments.items() if v is not None})
+        final_dict = _update_task_payload(
+            name,
+            description,
+            status,
+            priority,
+            time_estimate,
+            archived,
+            add_assignees,
+            remove_assignees,
+        )
 
         model = "task/"
         updated_task = self.__put_request(model, final_dict, task_id)
         if updated_task:
-            return models.Task.build_task(updated_task)
+            return self.__build(models.Task, updated_task)
 
     def delete_task(self, task_id: str) -> None:
         """Deletes a task via a given task ID.
@@ -803,42 +1447,87 @@ class ClickUpClient:
         deleted_task_status = self.__delete_request(model, task_id)
         return True
 
+    def delete_tasks_bulk(
+        self,
+        task_ids: Iterable[str],
+        max_workers: int = 8,
+        ordered: bool = False,
+        checkpoint: str = None,
+    ) -> BulkJob:
+        """Deletes many tasks concurrently.
+
+        Args:
+            :task_ids (Iterable[str]): The IDs of the tasks to delete.
+            :max_workers (int, optional): The number of requests in flight at once. Defaults to 8.
+            :ordered (bool, optional): Yield task IDs in input order instead of as they complete. Defaults to False.
+            :checkpoint (str, optional): A file that records deleted task IDs. Rerunning with the same file skips them. Defaults to None.
+
+        Returns:
+            :BulkJob: Iterate over it to run the job and receive the ID of every deleted task.
+        """
+        return self.__bulk_over_ids(
+            lambda task_id: self.delete_task(task_id) and task_id,
+            task_ids,
+            max_workers,
+            ordered,
+            checkpoint,
+        )
+
     # Comments
-    def get_task_comments(self, task_id: str) -> models.Comments:
+    def get_task_comments(
+        self, task_id: str, raw: bool = False, fields: List[str] = None
+    ) -> Union[models.Comments, List[dict]]:
         """Get all the comments for a task from a given task id.
 
         Args:
             :task_id (str): The id of the ClickUp task to retrieve comments from.
+            :raw (bool, optional): Return the comments as plain dicts without building models. Defaults to False.
+            :fields (List[str], optional): Return plain dicts holding only these fields. Dotted names such as
+                "user.username" reach into nested objects. Defaults to None.
 
         Returns:
             :models.Comments: Returns an object of type Comments.
         """
         model = "task/"
         fetched_comments = self.__get_request(model, task_id, "comment")
-        final_comments = models.Comments.build_comments(fetched_comments)
+        if raw or fields:
+            return _project(fetched_comments["comments"], fields)
+        final_comments = self.__build(models.Comments, fetched_comments)
         if final_comments:
             return final_comments
 
-    def get_list_comments(self, list_id: str) -> models.Comments:
+    def get_list_comments(
+        self, list_id: str, raw: bool = False, fields: List[str] = None
+    ) -> Union[models.Comments, List[dict]]:
         """Get all the comments for a list from a given list id.
 
         Args:
             :list_id (str): The id of the ClickUp list to retrieve comments from.
+            :raw (bool, optional): Return the comments as plain dicts without building models. Defaults to False.
+            :fields (List[str], optional): Return plain dicts holding only these fields. Dotted names such as
+                "user.username" reach into nested objects. Defaults to None.
 
         Returns:
             :models.Comments: Returns an object of type Comments.
         """
         model = "list/"
         fetched_comments = self.__get_request(model, list_id, "comment/")
-        final_comments = models.Comments.build_comments(fetched_comments)
+        if raw or fields:
+            return _project(fetched_comments["comments"], fields)
+        final_comments = self.__build(models.Comments, fetched_comments)
         if final_comments:
             return final_comments
 
-    def get_chat_comments(self, view_id: str) -> models.Comments:
+    def get_chat_comments(
+        self, view_id: str, raw: bool = False, fields: List[str] = None
+    ) -> Union[models.Comments, List[dict]]:
         """Get all the comments for a chat from a given view id.
 
         Args:
             :view_id (str): The id of the view to retrieve comments from.
+            :raw (bool, optional): Return the comments as plain dicts without building models. Defaults to False.
+            :fields (List[str], optional): Return plain dicts holding only these fields. Dotted names such as
+                "user.username" reach into nested objects. Defaults to None.
 
         Returns:
             :models.Comments: Returns an object of type Comments.
@@ -846,7 +1535,9 @@ class ClickUpClient:
         model = "view/"
         fetched_comments = self.__get_request(model, view_id, "comment/")
         print(fetched_comments)
-        final_comments = models.Comments.build_comments(fetched_comments)
+        if raw or fields:
+            return _project(fetched_comments["comments"], fields)
+        final_comments = self.__build(models.Comments, fetched_comments)
         if final_comments:
             return final_comments
 
@@ -927,7 +1618,7 @@ class ClickUpClient:
             model, final_dict, None, False, task_id, "comment"
         )
 
-        final_comment = models.Comment.build_comment(created_comment)
+        final_comment = self.__build(models.Comment, created_comment)
         if final_comment:
             return final_comment
 
@@ -961,7 +1652,7 @@ class ClickUpClient:
             model, final_dict, None, False, view_id, "comment"
         )
 
-        final_comment = models.Comment.build_comment(created_comment)
+        final_comment = self.__build(models.Comment, created_comment)
         if final_comment:
             return final_comment
 
@@ -975,7 +1666,7 @@ class ClickUpClient:
         """
         model = "team"
         fetched_teams = self.__get_request(model)
-        final_teams = models.Teams.build_teams(fetched_teams)
+        final_teams = self.__build(models.Teams, fetched_teams)
         if final_teams:
             return final_teams
 
@@ -1115,11 +1806,15 @@ class ClickUpClient:
 
     # Members
 
-    def get_task_members(self, task_id: str) -> models.Members:
+    def get_task_members(
+        self, task_id: str, raw: bool = False, fields: List[str] = None
+    ) -> Union[models.Members, List[dict]]:
         """Get all members assigned to a specific task via a task id.
 
         Args:
             :task_id (str): The id of the task to get members of.
+            :raw (bool, optional): Return the members as plain dicts without building models. Defaults to False.
+            :fields (List[str], optional): Return plain dicts holding only these fields. Defaults to None.
 
         Returns:
             :models.Members: Returns an object of type Members.
@@ -1128,13 +1823,19 @@ class ClickUpClient:
         model = "task/"
 
         task_members = self.__get_request(model, task_id, "member")
-        return models.Members.build_members(task_members)
+        if raw or fields:
+            return _project(task_members["members"], fields)
+        return self.__build(models.Members, task_members)
 
-    def get_list_members(self, list_id: str) -> models.Members:
+    def get_list_members(
+        self, list_id: str, raw: bool = False, fields: List[str] = None
+    ) -> Union[models.Members, List[dict]]:
         """Get all members assigned to a specific list via a list id.
 
         Args:
             :list_id (str): The id of the list to get members of.
+            :raw (bool, optional): Return the members as plain dicts without building models. Defaults to False.
+            :fields (List[str], optional): Return plain dicts holding only these fields. Defaults to None.
 
         Returns:
             :models.Members: Returns an object of type Members.
@@ -1142,7 +1843,9 @@ class ClickUpClient:
         model = "list/"
 
         task_members = self.__get_request(model, list_id, "member")
-        return models.Members.build_members(task_members)
+        if raw or fields:
+            return _project(task_members["members"], fields)
+        return self.__build(models.Members, task_members)
 
     # Goals
 
@@ -1272,7 +1975,7 @@ class ClickUpClient:
                 model, team_id, "goal?include_completed=false"
             )
 
-        final_goals = models.GoalsList.build_goals(fetched_goals)
+        final_goals = self.__build(models.GoalsList, fetched_goals)
         if final_goals:
             return final_goals
 
@@ -1291,7 +1994,7 @@ class ClickUpClient:
 
         fetched_tags = self.__get_request(model, space_id, "tag")
 
-        final_tags = models.Tags.build_tags(fetched_tags)
+        final_tags = self.__build(models.Tags, fetched_tags)
 
         if final_tags:
             return final_tags
@@ -1341,7 +2044,7 @@ class ClickUpClient:
     #     model = "space/"
     #     updated_tag = self.__put_request(model, None, space_id, "tag", tag_name)
     #     if updated_tag:
-    #         return models.Tags.build_tags(updated_tag)
+    #         return self.__build(models.Tags, updated_tag)
     #     return None
 
     def tag_task(
@@ -1351,7 +2054,9 @@ class ClickUpClient:
     ):
 
         model = "task/"
-        self.__post_request(model, None, None, False, task_id, "tag", tag_name)
+        self.__post_request(
+            model, None, None, False, task_id, "tag", tag_name, idempotent=True
+        )
 
         return True
 
@@ -1364,6 +2069,112 @@ class ClickUpClient:
         self.__delete_request(model, task_id, "tag", tag_name)
         return True
 
+    def __bulk_over_ids(
+        self,
+        send,
+        task_ids: Iterable[str],
+        max_workers: int,
+        ordered: bool,
+        checkpoint: str,
+    ) -> BulkJob:
+        """Internal method that builds a bulk job sending one request per task ID."""
+        return BulkJob(
+            send,
+            ((index, task_id, task_id) for index, task_id in enumerate(task_ids)),
+            max_workers=max_workers,
+            ordered=ordered,
+            checkpoint=Checkpoint(checkpoint) if checkpoint else None,
+        )
+
+    def update_tasks_bulk(
+        self,
+        task_ids: Iterable[str],
+        changes: dict,
+        max_workers: int = 8,
+        ordered: bool = False,
+        checkpoint: str = None,
+    ) -> BulkJob:
+        """Applies the same update to many tasks concurrently. The changes are validated once, before any request
+        is sent. Task IDs are read lazily, so a generator of any length can be passed.
+
+        Args:
+            :task_ids (Iterable[str]): The IDs of the tasks to update.
+            :changes (dict): :meth:`update_task` arguments, without task_id.
+            :max_workers (int, optional): The number of requests in flight at once. Defaults to 8.
+            :ordered (bool, optional): Yield tasks in the order of their IDs instead of as they complete. Defaults to False.
+            :checkpoint (str, optional): A file that records updated task IDs. Rerunning with the same file skips them. Defaults to None.
+
+        Returns:
+            :BulkJob: Iterate over it to run the job and receive the updated models.Task objects.
+        """
+        final_dict = _update_task_payload(**changes)
+
+        def send(task_id):
+            updated_task = self.__put_request("task/", final_dict, task_id)
+            if not updated_task:
+                raise exceptions.ClickupClientError(
+                    f"Task {task_id} was not updated.", "Update failed"
+                )
+            return self.__build(models.Task, updated_task)
+
+        return self.__bulk_over_ids(send, task_ids, max_workers, ordered, checkpoint)
+
+    def tag_tasks_bulk(
+        self,
+        task_ids: Iterable[str],
+        tag_name: str,
+        max_workers: int = 8,
+        ordered: bool = False,
+        checkpoint: str = None,
+    ) -> BulkJob:
+        """Adds a tag to many tasks concurrently.
+
+        Args:
+            :task_ids (Iterable[str]): The IDs of the tasks to tag.
+            :tag_name (str): The name of the tag to add.
+            :max_workers (int, optional): The number of requests in flight at once. Defaults to 8.
+            :ordered (bool, optional): Yield task IDs in input order instead of as they complete. Defaults to False.
+            :checkpoint (str, optional): A file that records tagged task IDs. Rerunning with the same file skips them. Defaults to None.
+
+        Returns:
+            :BulkJob: Iterate over it to run the job and receive the ID of every tagged task.
+        """
+        return self.__bulk_over_ids(
+            lambda task_id: self.tag_task(task_id, tag_name) and task_id,
+            task_ids,
+            max_workers,
+            ordered,
+            checkpoint,
+        )
+
+    def untag_tasks_bulk(
+        self,
+        task_ids: Iterable[str],
+        tag_name: str,
+        max_workers: int = 8,
+        ordered: bool = False,
+        checkpoint: str = None,
+    ) -> BulkJob:
+        """Removes a tag from many tasks concurrently.
+
+        Args:
+            :task_ids (Iterable[str]): The IDs of the tasks to untag.
+            :tag_name (str): The name of the tag to remove.
+            :max_workers (int, optional): The number of requests in flight at once. Defaults to 8.
+            :ordered (bool, optional): Yield task IDs in input order instead of as they complete. Defaults to False.
+            :checkpoint (str, optional): A file that records untagged task IDs. Rerunning with the same file skips them. Defaults to None.
+
+        Returns:
+            :BulkJob: Iterate over it to run the job and receive the ID of every untagged task.
+        """
+        return self.__bulk_over_ids(
+            lambda task_id: self.untag_task(task_id, tag_name) and task_id,
+            task_ids,
+            max_workers,
+            ordered,
+            checkpoint,
+        )
+
     # Spaces
 
     def create_space(
@@ -1391,24 +2202,26 @@ class ClickUpClient:
         created_space = self.__post_request(
             model, final_dict, None, False, team_id, "space"
         )
+        self.__invalidate("space")
         print(created_space)
         if created_space:
-            return models.Space.build_space(created_space)
+            return self.__build(models.Space, created_space)
 
     def delete_space(self, space_id: str):
 
         model = "space/"
         self.__delete_request(model, space_id)
+        self.__invalidate("space", "folder", "list")
         return True
 
     def get_space(self, space_id: str):
 
         model = "space/"
 
-        fetched_space = self.__get_request(model, space_id)
+        fetched_space = self.__get_request(model, space_id, cache_category="space")
 
         if fetched_space:
-            return models.Space.build_space(fetched_space)
+            return self.__build(models.Space, fetched_space)
 
     def get_spaces(self, team_id: str, archived: bool = False):
 
@@ -1419,10 +2232,12 @@ class ClickUpClient:
 
         model = "team/"
 
-        fetched_spaces = self.__get_request(model, team_id, path)
+        fetched_spaces = self.__get_request(
+            model, team_id, path, cache_category="space"
+        )
 
         if fetched_spaces:
-            return models.Spaces.build_spaces(fetched_spaces)
+            return self.__build(models.Spaces, fetched_spaces)
 
     # Shared Hierarchy
     # Returns all resources you have access to where you don't have access to its parent.
@@ -1443,7 +2258,7 @@ class ClickUpClient:
         fetched_hierarchy = self.__get_request(model, team_id, "shared")
         print(fetched_hierarchy)
         if fetched_hierarchy:
-            return models.SharedHierarchy.build_shared(fetched_hierarchy)
+            return self.__build(models.SharedHierarchy, fetched_hierarchy)
 
     # Time Tracking
     def get_time_entries_in_range(
@@ -1452,7 +2267,9 @@ class ClickUpClient:
         start_date: str = None,
         end_date: str = None,
         assignees: List[str] = None,
-    ) -> models.TimeTrackingData:
+        raw: bool = False,
+        fields: List[str] = None,
+    ) -> Union[models.TimeTrackingDataList, List[dict]]:
         """Gets a list of time tracking entries for a specific date range.
 
         Args:
@@ -1460,33 +2277,77 @@ class ClickUpClient:
             :start_date (str, optional): The minimum date to fetch time entries for. Defaults to None.
             :end_date (str, optional): The maximum date to fetch time entries for. Defaults to None.
             :assignees (List[str], optional): A list of user ids to add as assignees. Defaults to None.
+            :raw (bool, optional): Return the time entries as plain dicts without building models. Defaults to False.
+            :fields (List[str], optional): Return plain dicts holding only these fields. Dotted names such as
+                "task.id" reach into nested objects. Defaults to None.
 
         Returns:
             :models.TimeTrackingData: Returns an object of type TimeTrackingData.
         """
-        startdate = "start_date="
-        enddate = "end_date="
-        assignees_temp = "assignee="
+        joined_url = _time_entries_query(start_date, end_date, assignees)
+        model = "team/"
+        fetched_time_data = self.__get_request(model, team_id, joined_url)
 
-        if start_date:
-            startdate = f"start_date={fuzzy_time_to_unix(start_date)}"
+        if fetched_time_data:
+            if raw or fields:
+                return _project(fetched_time_data["data"], fields)
+            return self.__build(models.TimeTrackingDataList, fetched_time_data)
 
-        if end_date:
-            enddate = f"end_date={fuzzy_time_to_unix(end_date)}"
+    def iter_time_entries_in_range(
+        self,
+        team_id: str,
+        start_date: Union[str, int],
+        end_date: Union[str, int],
+        assignees: List[str] = None,
+        window_days: float = 7,
+        concurrency: int = 4,
+        raw: bool = False,
+    ) -> Iterator[Union[models.TimeTrackingData, dict]]:
+        """Lazily fetches the time entries of a long date range in windows, yielding them in start time order.
 
-        if assignees:
-            if len(assignees) > 1:
-                assignees_temp = f'assignee={",".join(assignees)}'
+        The range is split into windows of ``window_days`` that are fetched ``concurrency`` at a time, within the
+        client's rate limits, so a year of entries is neither one slow request nor at risk of being truncated by the
+        server. An entry that spans a window boundary and comes back in both windows is only yielded once. Only the
+        windows in flight are held in memory.
 
-            if len(assignees) == 1:
-                assignees_temp = f"assignee={assignees[0]}"
+        Args:
+            :team_id (str): The id of the team to fetch time entries for.
+            :start_date (Union[str, int]): The start of the range, as Unix milliseconds or a human readable date.
+            :end_date (Union[str, int]): The end of the range, as Unix milliseconds or a human readable date.
+            :assignees (List[str], optional): Only fetch the entries of these user ids. Defaults to None.
+            :window_days (float, optional): The length of each window in days. Defaults to 7.
+            :concurrency (int, optional): The number of windows fetched at once. Defaults to 4.
+            :raw (bool, optional): Yield the time entries as plain dicts without building models. Defaults to False.
 
-        joined_url = f"time_entries?{startdate}&{enddate}&{assignees_temp}"
-        model = "team/"
-        fetched_time_data = self.__get_request(model, team_id, joined_url)
+        Returns:
+            :Iterator[Union[models.TimeTrackingData, dict]]: Yields every time entry in the range once.
+        """
+        start, end = int(fuzzy_time_to_unix(start_date)), int(fuzzy_time_to_unix(end_date))
+        if end < start:
+            raise exceptions.ClickupClientError(
+                "The end date must not be before the start date.", "Invalid date range"
+            )
+        window = max(int(window_days * 86_400_000), 1)
 
-        if fetched_time_data:
-            return models.TimeTrackingDataList.build_data(fetched_time_data)
+        def fetch_window(window_start: int, window_end: int) -> List[dict]:
+            fetched = self.__get_request(
+                "team/", team_id, _time_entries_window_query(window_start, window_end, assignees)
+            )
+            entries = (fetched or {}).get("data") or []
+            return sorted(entries, key=lambda entry: (_entry_ms(entry.get("start")) or 0, entry.get("id")))
+
+        carried = set()
+        for _, window_end, entries in iter_windows(fetch_window, start, end, window, concurrency):
+            # Entries still open at the end of this window may come back in the next one.
+            spanning = set()
+            for entry in entries:
+                entry_end = _entry_ms(entry.get("end"))
+                if entry_end is None or entry_end >= window_end:
+                    spanning.add(entry.get("id"))
+                if entry.get("id") in carried:
+                    continue
+                yield entry if raw else self.__build(models.TimeTrackingData, entry)
+            carried = spanning
 
     def get_single_time_entry(
         self, team_id: str, timer_id: str
@@ -1505,7 +2366,7 @@ class ClickUpClient:
         fetched_time_data = self.__get_request(model, team_id, "time_entries", timer_id)
         print(fetched_time_data)
         if fetched_time_data:
-            return models.TimeTrackingDataSingle.build_data(fetched_time_data)
+            return self.__build(models.TimeTrackingDataSingle, fetched_time_data)
 
     def start_timer(self, team_id: str, timer_id: str) -> models.TimeTrackingData:
         """start_timer Starts the time tracking timer for a task via a timer id.
@@ -1523,7 +2384,7 @@ class ClickUpClient:
         )
 
         if fetched_time_data:
-            return models.TimeTrackingDataSingle.build_data(fetched_time_data)
+            return self.__build(models.TimeTrackingDataSingle, fetched_time_data)
 
     def stop_timer(self, team_id: str) -> models.TimeTrackingData:
         """Stops the time tracking timer for a task via a team id.
@@ -1540,4 +2401,4 @@ class ClickUpClient:
         )
 
         if fetched_time_data:
-            return models.TimeTrackingDataSingle.build_data(fetched_time_data)
+            return self.__build(models.TimeTrackingDataSingle, fetched_time_data)
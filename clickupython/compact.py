@@ -0,0 +1,244 @@
+import json
+from typing import Any, Iterable, Iterator
+
+from pydantic import BaseModel
+
+from clickupython import models
+
+# Millisecond timestamps and durations are kept as ints, which take half the memory of their digit strings.
+_NUMERIC_FIELDS = (
+    "date_created",
+    "date_updated",
+    "date_closed",
+    "due_date",
+    "start_date",
+    "time_estimate",
+    "time_spent",
+)
+# Short values that repeat across many tasks and are stored once per pool.
+_INTERNED_FIELDS = ("orderindex", "parent")
+# Nested objects that are usually identical across many tasks and are shared within a pool.
+_SHARED_FIELDS = ("status", "creator", "priority", "list", "folder", "space")
+# Lists whose items are shared within a pool.
+_SHARED_LIST_FIELDS = ("assignees", "task_tags")
+
+
+class InternPool:
+    """Canonical copies of the strings and nested objects held by a set of compact tasks.
+
+    Equal values are stored once and every compact task refers to the same object, so
+    a status, an assignee or a list reference costs memory once per pool rather than
+    once per task. Unlike ``sys.intern``, everything is released with the pool.
+    """
+
+    def __init__(self):
+        self._strings = {}
+        self._objects = {}
+
+    def __len__(self):
+        return len(self._strings) + len(self._objects)
+
+    def string(self, value: str) -> str:
+        """Returns the pool's copy of a string."""
+        if value is None:
+            return None
+        return self._strings.setdefault(value, value)
+
+    def shared(self, value: Any, blank: str = None) -> Any:
+        """Returns the pool's copy of a model or a JSON value equal to the given one.
+
+        Args:
+            :value (Any): A pydantic model, dict or scalar.
+            :blank (str, optional): A model field left out of the comparison and set to None on the pooled copy. Defaults to None.
+
+        Returns:
+            :Any: The shared object. Treat it as read-only.
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return self.string(value)
+        if isinstance(value, BaseModel):
+            key = (type(value), tuple((k, v) for k, v in value.__dict__.items() if k != blank))
+        elif isinstance(value, dict):
+            key = (dict, tuple(value.items()))
+        elif isinstance(value, list):
+            key = (list, json.dumps(value, sort_keys=True, default=str))
+        else:
+            return value
+        try:
+            pooled = self._objects.get(key)
+        except TypeError:
+            # Values holding lists, dicts or models are not hashable; compare their JSON instead.
+            data = value.dict(exclude={blank} if blank else None) if isinstance(value, BaseModel) else value
+            key = (type(value), json.dumps(data, sort_keys=True, default=str))
+            pooled = self._objects.get(key)
+        if pooled is None:
+            if blank is not None:
+                value = value.copy(update={blank: None})
+            pooled = self._objects[key] = value
+        return pooled
+
+
+def _to_int(value):
+    """Turns a digit string into an int, leaving anything else as it is."""
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+
+def _to_str(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def _rebuild(cls, values):
+    """Recreates a compact record from its slot values, for pickle and copy."""
+    compact = cls.__new__(cls)
+    for name, value in zip(cls.__slots__, values):
+        object.__setattr__(compact, name, value)
+    return compact
+
+
+def _copy(value):
+    """Copies a pooled object so a rebuilt task can be modified without touching the pool."""
+    if isinstance(value, BaseModel):
+        return value.copy()
+    if isinstance(value, (dict, list)):
+        return value.copy()
+    return value
+
+
+class CompactTask:
+    """A memory-efficient, read-only record of a task.
+
+    It has the same attributes as ``models.Task`` in a slotted object with no per-instance
+    ``__dict__``. Nested objects (status, creator, assignees, tags, priority, list,
+    folder, space and custom field definitions) are shared with every other task in the
+    same InternPool, repeated strings are interned, dates and durations are ints in Unix
+    milliseconds, and lists are tuples. Use :meth:`to_task` for a regular, independent
+    ``models.Task``.
+    """
+
+    __slots__ = tuple(models.Task.__fields__)
+
+    @classmethod
+    def from_task(cls, task: models.Task, pool: InternPool) -> "CompactTask":
+        """Builds a compact record from a task.
+
+        Args:
+            :task (models.Task): The task to copy.
+            :pool (InternPool): The pool holding shared strings and objects.
+
+        Returns:
+            :CompactTask: The compact record.
+        """
+        compact = cls.__new__(cls)
+        set_slot = object.__setattr__
+        for name in cls.__slots__:
+            value = getattr(task, name)
+            if name in _NUMERIC_FIELDS:
+                value = _to_int(value)
+            elif name in _INTERNED_FIELDS:
+                value = pool.string(value)
+            elif name in _SHARED_FIELDS:
+                value = pool.shared(value)
+            elif name in _SHARED_LIST_FIELDS:
+                value = None if value is None else tuple([pool.shared(item) for item in value])
+            elif name == "custom_fields":
+                value = (
+                    None
+                    if value is None
+                    else tuple((pool.shared(field, blank="value"), field.value) for field in value)
+                )
+            elif name == "task_checklists":
+                value = None if value is None else tuple(value)
+            elif name == "description" and value == task.text_content:
+                # The API usually sends the same text twice; keep one copy.
+                value = task.text_content
+            set_slot(compact, name, value)
+        return compact
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only; use to_task() for an editable copy")
+
+    def __reduce__(self):
+        return _rebuild, (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+    def to_task(self) -> models.Task:
+        """Rebuilds a regular ``models.Task`` that shares nothing with the pool.
+
+        Returns:
+            :models.Task: A task equal to the one the record was built from.
+        """
+        values = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if name in _NUMERIC_FIELDS:
+                value = _to_str(value)
+            elif name in _SHARED_FIELDS:
+                value = _copy(value)
+            elif name in _SHARED_LIST_FIELDS or name == "task_checklists":
+                value = None if value is None else [_copy(item) for item in value]
+            elif name == "custom_fields":
+                value = (
+                    None
+                    if value is None
+                    else [definition.copy(update={"value": field_value}) for definition, field_value in value]
+                )
+            values[name] = value
+        return models.Task.construct(**values)
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactTask):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"CompactTask(id={self.id!r}, name={self.name!r})"
+
+
+class CompactTasks:
+    """A list of CompactTask records that share one InternPool.
+
+    Feed it tasks as they are fetched, for example ``CompactTasks(client.iter_tasks(list_id))``,
+    so that only the compact records stay in memory.
+
+    Args:
+        :tasks (Iterable[models.Task], optional): Tasks to add. Defaults to an empty list.
+    """
+
+    def __init__(self, tasks: Iterable[models.Task] = ()):
+        self.pool = InternPool()
+        self._tasks = []
+        self.extend(tasks)
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __iter__(self) -> Iterator[CompactTask]:
+        return iter(self._tasks)
+
+    def __getitem__(self, index):
+        return self._tasks[index]
+
+    def append(self, task: models.Task):
+        self._tasks.append(CompactTask.from_task(task, self.pool))
+
+    def extend(self, tasks: Iterable[models.Task]):
+        """Adds every task of a models.Tasks page or of an iterable of tasks, such as a task iterator."""
+        if isinstance(tasks, models.Tasks):
+            tasks = tasks.tasks or []
+        for task in tasks:
+            self.append(task)
+
+    def to_tasks(self) -> models.Tasks:
+        """Rebuilds every record as a regular task.
+
+        Returns:
+            :models.Tasks: The tasks, in the order they were added.
+        """
+        return models.Tasks.construct(tasks=[task.to_task() for task in self._tasks])
@@ -0,0 +1,160 @@
+import threading
+
+
+class AdaptiveConcurrencyLimiter:
+    """Caps the number of requests in flight and adapts the cap to the rate limit headroom (AIMD).
+
+    Every response's ``x-ratelimit-remaining`` is fed to :meth:`observe`. While the
+    remaining share of the budget is above ``high_watermark`` the limit grows
+    additively, by about ``increase`` per round of ``limit`` responses. When it falls
+    below ``low_watermark``, or the server answers 429, the limit is multiplied by
+    ``decrease``, at most once per round so a burst of low readings does not collapse
+    it. In between, the limit holds steady.
+
+    Use it as a context manager around each request, from any number of threads.
+
+    Args:
+        :initial (int, optional): The starting limit. Defaults to 4.
+        :minimum (int, optional): The limit never drops below this. Defaults to 1.
+        :maximum (int, optional): The limit never grows above this. Defaults to 64.
+        :increase (float, optional): Additive increase per round. Defaults to 1.
+        :decrease (float, optional): Multiplicative decrease factor. Defaults to 0.5.
+        :high_watermark (float, optional): Grow while remaining / capacity is above this. Defaults to 0.5.
+        :low_watermark (float, optional): Shrink when remaining / capacity is below this. Defaults to 0.2.
+        :capacity (int, optional): The full rate limit budget per window. Defaults to 100.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 64,
+        increase: float = 1,
+        decrease: float = 0.5,
+        high_watermark: float = 0.5,
+        low_watermark: float = 0.2,
+        capacity: int = 100,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.capacity = capacity
+        self._limit = float(min(max(initial, minimum), maximum))
+        self._in_flight = 0
+        self._since_decrease = self.limit
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """The number of requests currently allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self):
+        """Blocks until fewer than ``limit`` requests are in flight, then takes a slot."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    def release(self):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def observe(self, remaining: int, status_code: int = None):
+        """Adjusts the limit from the rate limit headroom reported with a response.
+
+        Args:
+            :remaining (int): The response's x-ratelimit-remaining value.
+            :status_code (int, optional): The response status. A 429 always shrinks the limit.
+        """
+        with self._condition:
+            self._since_decrease += 1
+            headroom = remaining / self.capacity
+            if status_code == 429 or headroom < self.low_watermark:
+                if self._since_decrease >= self.limit:
+                    self._limit = max(self.minimum, self._limit * self.decrease)
+                    self._since_decrease = 0
+            elif headroom > self.high_watermark:
+                self._limit = min(self.maximum, self._limit + self.increase / self._limit)
+            self._condition.notify_all()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Collapses identical concurrent calls into one.
+
+    The first caller for a key runs the function; callers that arrive with the same
+    key while it is still running wait for it and receive the same result, or the
+    same exception. Once the call finishes the key is forgotten, so later callers
+    run it again.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.collapsed = 0
+
+    @property
+    def stats(self) -> dict:
+        """The number of calls executed and the number of callers that shared another caller's result."""
+        with self._lock:
+            return {"calls": self.calls, "collapsed": self.collapsed}
+
+    def do(self, key, function, share=None):
+        """Runs ``function`` unless a call with the same key is already in flight, in which case its result is shared.
+
+        Args:
+            :key (Hashable): Identifies calls that are interchangeable.
+            :function (Callable): The call to run, without arguments.
+            :share (Callable, optional): Applied to the result handed to each caller that waited for another
+                caller's call, for example to give it its own copy. Defaults to None, meaning the same object.
+
+        Returns:
+            :Any: The function's return value.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.collapsed += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result if share is None else share(call.result)
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,176 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List
+
+LEVELS = ("team", "space", "folder", "list", "task")
+
+
+class Node:
+    """A team, space, folder, list or task found by a HierarchyCrawler.
+
+    Attributes:
+        :kind (str): One of "team", "space", "folder", "list" or "task".
+        :id (str): The object's id.
+        :name (str): The object's name.
+        :parent (Node): The node it was found under, or None for a team.
+        :model (BaseModel): The model returned by the client.
+    """
+
+    def __init__(self, kind: str, model: Any, parent: "Node" = None):
+        self.kind = kind
+        self.id = model.id
+        self.name = model.name
+        self.parent = parent
+        self.model = model
+
+    @property
+    def path(self) -> List["Node"]:
+        """The node's ancestors from its team down, followed by the node itself."""
+        node, path = self, []
+        while node is not None:
+            path.append(node)
+            node = node.parent
+        return path[::-1]
+
+    def __repr__(self):
+        return f"Node(kind={self.kind!r}, id={self.id!r}, name={self.name!r})"
+
+
+class LevelStats:
+    """Requests, wall time and nodes found while expanding the nodes of one level."""
+
+    def __init__(self):
+        self.requests = 0
+        self.seconds = 0.0
+        self.nodes = 0
+
+    def __repr__(self):
+        return f"LevelStats(requests={self.requests!r}, seconds={self.seconds:.3f}, nodes={self.nodes!r})"
+
+
+class HierarchyCrawler:
+    """Walks a workspace breadth-first: teams, then spaces, then folders and lists, then tasks.
+
+    All nodes of a level are expanded in parallel on a pool of ``max_workers`` threads,
+    and every node is yielded as soon as the request that found it returns; the tasks
+    of a list are yielded page by page as the pages arrive. The next
+    level starts once the current one is done. A node for which ``prune`` returns True
+    is still yielded, but nothing below it is fetched.
+
+    Expanding a space finds both its folders and its folderless lists, and only requests
+    the ones within ``depth``. The lists of a folder come back with the folder itself, so
+    expanding a folder costs no request.
+    ``stats`` maps each level to the requests spent, the wall time taken and the nodes
+    found while expanding its nodes; ``stats["root"]`` covers the teams request.
+
+    Args:
+        :client (ClickUpClient): The client used to fetch the hierarchy.
+        :max_workers (int, optional): The number of requests in flight at once. Defaults to 8.
+        :prune (Callable[[Node], bool], optional): Returns True for nodes whose subtree should be skipped. Defaults to None.
+        :depth (str, optional): The deepest level to visit. Defaults to "task".
+    """
+
+    def __init__(
+        self,
+        client,
+        max_workers: int = 8,
+        prune: Callable[[Node], bool] = None,
+        depth: str = "task",
+    ):
+        self.client = client
+        self.max_workers = max_workers
+        self.prune = prune
+        self.depth = LEVELS.index(depth)
+        self.stats = {level: LevelStats() for level in ("root",) + LEVELS[:-1]}
+
+    def __children(self, node: Node) -> Iterator[Node]:
+        """Internal method that fetches the nodes directly below a node, within the crawl's depth."""
+        if node.kind == "team":
+            spaces = self.client.get_spaces(node.id)
+            for space in getattr(spaces, "spaces", None) or []:
+                yield Node("space", space, node)
+        elif node.kind == "space":
+            if self.depth >= LEVELS.index("folder"):
+                folders = self.client.get_folders(node.id)
+                for folder in getattr(folders, "folders", None) or []:
+                    yield Node("folder", folder, node)
+            if self.depth >= LEVELS.index("list"):
+                lists = self.client.get_folderless_lists(node.id)
+                for single_list in lists.lists or []:
+                    yield Node("list", single_list, node)
+        elif node.kind == "folder":
+            for single_list in node.model.lists or []:
+                yield Node("list", single_list, node)
+        elif node.kind == "list":
+            for task in self.client.iter_tasks(node.id, subtasks=True, include_closed=True):
+                yield Node("task", task, node)
+
+    def __expand(self, node: Node, results: queue.Queue, stop: threading.Event):
+        """Internal method, run on the pool, that passes each child of a node to the crawl as it is found.
+        A final (None, error) entry marks the node as done."""
+        error = None
+        try:
+            for child in self.__children(node):
+                if stop.is_set():
+                    break
+                results.put((child, None))
+        except BaseException as raised:
+            error = raised
+        results.put((None, error))
+
+    def crawl(self) -> Iterator[Node]:
+        """Yields every node of the workspace, level by level.
+
+        Returns:
+            :Iterator[Node]: The teams, spaces, folders, lists and tasks, in the order they were found.
+        """
+        frontiers = {level: [] for level in LEVELS}
+        started = time.monotonic()
+        requests_before = self.client.request_count
+        teams = self.client.get_teams()
+        frontiers["team"] = [Node("team", team) for team in getattr(teams, "teams", None) or []]
+        self.__record("root", started, requests_before, len(frontiers["team"]))
+        yield from frontiers["team"]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for level in LEVELS[: self.depth]:
+                expandable = [
+                    node
+                    for node in frontiers.pop(level)
+                    if self.prune is None or not self.prune(node)
+                ]
+                if not expandable:
+                    continue
+                started = time.monotonic()
+                requests_before = self.client.request_count
+                found = 0
+                results = queue.Queue()
+                stop = threading.Event()
+                futures = [pool.submit(self.__expand, node, results, stop) for node in expandable]
+                running = len(futures)
+                try:
+                    while running:
+                        child, error = results.get()
+                        if child is None:
+                            running -= 1
+                            if error is not None:
+                                raise error
+                            continue
+                        if LEVELS.index(child.kind) > self.depth:
+                            continue
+                        frontiers[child.kind].append(child)
+                        found += 1
+                        yield child
+                finally:
+                    stop.set()
+                    for future in futures:
+                        future.cancel()
+                self.__record(level, started, requests_before, found)
+
+    def __record(self, level: str, started: float, requests_before: int, nodes: int):
+        stats = self.stats[level]
+        stats.requests += self.client.request_count - requests_before
+        stats.seconds += time.monotonic() - started
+        stats.nodes += nodes
@@ -0,0 +1,232 @@
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+from clickupython import exceptions
+from clickupython import models
+
+# Custom field types stored as numbers, booleans or Unix milliseconds; every other type, including
+# formulas whose results may be text, is stored as text.
+_FLOAT_FIELD_TYPES = ("number", "currency", "emoji", "progress")
+_BOOL_FIELD_TYPES = ("checkbox",)
+_DATE_FIELD_TYPES = ("date",)
+
+
+def _require_pyarrow():
+    if pyarrow is None:
+        raise exceptions.ClickupClientError(
+            "Exporting tasks requires pyarrow. Install it with: pip install clickupython[arrow]",
+            "Missing dependency",
+        )
+
+
+def _int(value) -> int:
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def _text(value) -> str:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def _nested(item: dict, key: str, field: str):
+    value = item.get(key)
+    return value.get(field) if isinstance(value, dict) else None
+
+
+def _field_number(value, cast):
+    """Reads a numeric custom field value as cast (float or int), giving None for anything that is not a number."""
+    if isinstance(value, dict):
+        # Progress fields hold their value as {"percent_completed": ...}.
+        value = value.get("percent_completed")
+    if value is None or value == "" or isinstance(value, bool):
+        return None
+    try:
+        return cast(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _custom_field_type(field_type: str):
+    if field_type in _FLOAT_FIELD_TYPES:
+        return pyarrow.float64(), lambda value: _field_number(value, float)
+    if field_type in _BOOL_FIELD_TYPES:
+        return pyarrow.bool_(), lambda value: None if value is None else value in (True, "true")
+    if field_type in _DATE_FIELD_TYPES:
+        return pyarrow.int64(), lambda value: _field_number(value, int)
+    return pyarrow.string(), _text
+
+
+# Each column: its name, its Arrow type (built lazily, as pyarrow is optional) and how to read it from a raw task.
+_COLUMNS = [
+    ("id", "string", lambda task: task.get("id")),
+    ("custom_id", "string", lambda task: task.get("custom_id")),
+    ("name", "string", lambda task: task.get("name")),
+    ("status", "string", lambda task: _nested(task, "status", "status")),
+    ("status_type", "string", lambda task: _nested(task, "status", "type")),
+    ("orderindex", "string", lambda task: _text(task.get("orderindex"))),
+    ("date_created", "int64", lambda task: _int(task.get("date_created"))),
+    ("date_updated", "int64", lambda task: _int(task.get("date_updated"))),
+    ("date_closed", "int64", lambda task: _int(task.get("date_closed"))),
+    ("due_date", "int64", lambda task: _int(task.get("due_date"))),
+    ("start_date", "int64", lambda task: _int(task.get("start_date"))),
+    ("time_estimate", "int64", lambda task: _int(task.get("time_estimate"))),
+    ("time_spent", "int64", lambda task: _int(task.get("time_spent"))),
+    ("creator_id", "string", lambda task: _text(_nested(task, "creator", "id"))),
+    (
+        "assignee_ids",
+        "list<string>",
+        lambda task: [_text(user.get("id")) for user in task.get("assignees") or []],
+    ),
+    ("tags", "list<string>", lambda task: [tag.get("name") for tag in task.get("tags") or []]),
+    ("priority", "string", lambda task: _text(_nested(task, "priority", "priority"))),
+    ("parent", "string", lambda task: task.get("parent")),
+    ("list_id", "string", lambda task: _nested(task, "list", "id")),
+    ("folder_id", "string", lambda task: _nested(task, "folder", "id")),
+    ("space_id", "string", lambda task: _nested(task, "space", "id")),
+    ("url", "string", lambda task: task.get("url")),
+]
+
+
+def _arrow_type(name: str):
+    if name == "list<string>":
+        return pyarrow.list_(pyarrow.string())
+    return getattr(pyarrow, name)()
+
+
+class TaskBatches:
+    """Turns a stream of tasks into Arrow record batches of at most ``batch_size`` rows.
+
+    Tasks can be raw task dicts, as yielded by ``iter_tasks(..., raw=True)`` or
+    ``iter_team_tasks(..., raw=True)``, or ``models.Task`` objects. Only the rows of the
+    batch being filled are held in memory. Dates and durations become int64 Unix
+    milliseconds, assignees and tags become lists of ids and names, and every custom
+    field becomes a ``custom_fields.<field id>`` column typed after the field: numbers
+    and progress as float64, checkboxes as bool, dates as int64 and anything else,
+    formulas included, as text (JSON for non-string values). Numeric values that cannot
+    be read are written as nulls rather than stopping the export. The field names are kept in the schema metadata under
+    ``custom_fields``.
+
+    The schema is fixed by the first batch: custom fields are the ones given, or the
+    ones seen in the first batch when none are given, and fields that only show up
+    later are left out. A given field that is not in the first batch is exported as text.
+
+    Args:
+        :tasks (Iterable[Union[dict, models.Task]]): The tasks to convert.
+        :custom_fields (List[str], optional): The ids of the custom fields to export. Defaults to None, meaning the fields found in the first batch.
+        :batch_size (int, optional): The maximum number of rows per batch. Defaults to 10000.
+    """
+
+    def __init__(
+        self,
+        tasks: Iterable[Union[dict, models.Task]],
+        custom_fields: List[str] = None,
+        batch_size: int = 10000,
+    ):
+        _require_pyarrow()
+        self.tasks = tasks
+        self.custom_fields = list(custom_fields) if custom_fields is not None else None
+        self.batch_size = batch_size
+        self.schema = None
+        self.rows = 0
+        self._converters = {}
+
+    def __iter__(self) -> Iterator["pyarrow.RecordBatch"]:
+        pending = []
+        for task in self.tasks:
+            if isinstance(task, models.Task):
+                task = json.loads(task.json(by_alias=True))
+            pending.append(task)
+            if len(pending) >= self.batch_size:
+                yield self.__batch(pending)
+                pending = []
+        if pending or self.schema is None:
+            yield self.__batch(pending)
+
+    def __batch(self, tasks: List[dict]) -> "pyarrow.RecordBatch":
+        """Internal method that builds one record batch, fixing the schema on the first call."""
+        if self.schema is None:
+            self.schema = self.__schema(tasks)
+        columns = [[read(task) for task in tasks] for _, _, read in _COLUMNS]
+        if self.custom_fields:
+            values = [
+                {field.get("id"): field.get("value") for field in task.get("custom_fields") or []}
+                for task in tasks
+            ]
+            for field_id in self.custom_fields:
+                convert = self._converters[field_id]
+                columns.append([convert(task_values.get(field_id)) for task_values in values])
+        self.rows += len(tasks)
+        return pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array(values, type=field.type) for values, field in zip(columns, self.schema)],
+            schema=self.schema,
+        )
+
+    def __schema(self, tasks: List[dict]) -> "pyarrow.Schema":
+        definitions: Dict[str, Any] = {}
+        for task in tasks:
+            for field in task.get("custom_fields") or []:
+                definitions.setdefault(field.get("id"), field)
+        if self.custom_fields is None:
+            self.custom_fields = list(definitions)
+
+        fields = [pyarrow.field(name, _arrow_type(kind)) for name, kind, _ in _COLUMNS]
+        names = {}
+        for field_id in self.custom_fields:
+            definition = definitions.get(field_id, {})
+            arrow_type, self._converters[field_id] = _custom_field_type(definition.get("type"))
+            fields.append(pyarrow.field(f"custom_fields.{field_id}", arrow_type))
+            names[field_id] = definition.get("name")
+        return pyarrow.schema(fields, metadata={"custom_fields": json.dumps(names)})
+
+
+def export_tasks(
+    tasks: Iterable[Union[dict, models.Task]],
+    path: str,
+    format: str = "parquet",
+    custom_fields: List[str] = None,
+    batch_size: int = 10000,
+) -> int:
+    """Streams tasks into a Parquet or Arrow IPC file, one batch at a time.
+
+    Pass a task iterator with ``raw=True`` so that tasks are never built as models and
+    only one page and one batch are in memory at any time. See :class:`TaskBatches`
+    for the columns written.
+
+    Args:
+        :tasks (Iterable[Union[dict, models.Task]]): The tasks to export, for example ``client.iter_team_tasks(team_id, raw=True)``.
+        :path (str): The file to write.
+        :format (str, optional): "parquet" or "arrow" (the Arrow IPC file format). Defaults to "parquet".
+        :custom_fields (List[str], optional): The ids of the custom fields to export. Defaults to None, meaning the fields found in the first batch.
+        :batch_size (int, optional): Rows per batch and per Parquet row group. Defaults to 10000.
+
+    Returns:
+        :int: The number of tasks written.
+    """
+    if format not in ("parquet", "arrow"):
+        raise exceptions.ClickupClientError(
+            f"Unknown export format {format!r}; expected 'parquet' or 'arrow'.", "Invalid format"
+        )
+    batches = TaskBatches(tasks, custom_fields=custom_fields, batch_size=batch_size)
+    writer = None
+    try:
+        for batch in batches:
+            if writer is None:
+                if format == "parquet":
+                    writer = pyarrow.parquet.ParquetWriter(path, batch.schema)
+                else:
+                    writer = pyarrow.ipc.new_file(path, batch.schema)
+            if batch.num_rows:
+                writer.write_batch(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+    return batches.rows
@@ -0,0 +1,115 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Tuple
+
+# ClickUp returns at most this many tasks per page. A shorter page is the last one.
+TASKS_PAGE_SIZE = 100
+
+
+def iter_pages(
+    fetch_page: Callable[[int], List],
+    start_page: int = 0,
+    page_size: int = TASKS_PAGE_SIZE,
+    prefetch: bool = False,
+    concurrency: int = 1,
+) -> Iterator:
+    """Lazily walks a paged endpoint and yields its items one at a time, in page order.
+
+    Args:
+        :fetch_page (Callable[[int], List]): Fetches the items on a given page number.
+        :start_page (int, optional): The first page to fetch. Defaults to 0.
+        :page_size (int, optional): The maximum number of items per page. Defaults to 100.
+        :prefetch (bool, optional): Fetch the next page in a background thread while the current one is consumed. Defaults to False.
+        :concurrency (int, optional): Speculatively keep this many pages in flight at once. Pages past the
+            first short page are discarded. Defaults to 1.
+
+    Returns:
+        :Iterator: Yields the items of every page in order.
+    """
+    lookahead = concurrency if concurrency > 1 else int(prefetch)
+
+    if not lookahead:
+        page = start_page
+        while True:
+            items = fetch_page(page)
+            yield from items
+            if len(items) < page_size:
+                return
+            page += 1
+
+    executor = ThreadPoolExecutor(max_workers=lookahead)
+    pending = deque()
+    next_page = start_page
+
+    def fill():
+        nonlocal next_page
+        while len(pending) < lookahead:
+            pending.append(executor.submit(fetch_page, next_page))
+            next_page += 1
+
+    try:
+        fill()
+        while True:
+            items = pending.popleft().result()
+            last_page = len(items) < page_size
+            if not last_page:
+                fill()
+            yield from items
+            if last_page:
+                return
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def iter_windows(
+    fetch_window: Callable[[int, int], List],
+    start: int,
+    end: int,
+    window: int,
+    concurrency: int = 1,
+) -> Iterator[Tuple[int, int, List]]:
+    """Splits a range into consecutive windows and fetches them, yielding the results in window order.
+
+    Windows cover ``start`` to ``end`` inclusively without overlapping: each one spans at most
+    ``window`` units and the next one starts one unit after it ends.
+
+    Args:
+        :fetch_window (Callable[[int, int], List]): Fetches the items of a window given its first and last unit.
+        :start (int): The start of the range.
+        :end (int): The end of the range, inclusive.
+        :window (int): The length of each window.
+        :concurrency (int, optional): Keep this many windows in flight at once. Defaults to 1.
+
+    Returns:
+        :Iterator[Tuple[int, int, List]]: Yields the start, end and items of every window in order.
+    """
+    bounds = []
+    window_start = start
+    while window_start <= end:
+        window_end = min(window_start + window - 1, end)
+        bounds.append((window_start, window_end))
+        window_start = window_end + 1
+
+    if concurrency <= 1:
+        for window_start, window_end in bounds:
+            yield window_start, window_end, fetch_window(window_start, window_end)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = deque()
+    remaining = deque(bounds)
+    try:
+        while remaining or pending:
+            while remaining and len(pending) < concurrency:
+                window_start, window_end = remaining.popleft()
+                pending.append(
+                    (window_start, window_end, executor.submit(fetch_window, window_start, window_end))
+                )
+            window_start, window_end, future = pending.popleft()
+            yield window_start, window_end, future.result()
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -1,8 +1,11 @@
-from word2number import w2n
-from timefhuman import timefhuman
+import re
+import time as clock
 from datetime import datetime
+from functools import lru_cache
 from clickupython import exceptions
-import pendulum as time
+
+# timefhuman, pendulum and word2number are slow to import and only needed for fuzzy
+# input, so they are imported on first use rather than with the client.
 
 SCALES = {
     "min": 60,
@@ -21,25 +24,80 @@ SCALES = {
     "years": 31536000,
 }
 
+# Digit strings of this length are Unix timestamps in milliseconds, which covers March 1973
+# to November 2286. Shorter or longer digit strings are left to the natural language parser.
+UNIX_MS = re.compile(r"^\d{12,13}$")
+
+ISO_DATE = re.compile(
+    r"^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?(Z|[+-]\d{2}:?\d{2})?$"
+)
+
+# datetime.fromisoformat is new in Python 3.7. Without it, ISO 8601 dates are parsed as
+# natural language like any other input.
+_fromisoformat = getattr(datetime, "fromisoformat", None)
+
+# Relative phrases such as "tomorrow" are parsed against the current time rounded down to
+# this many seconds, so repeated phrases within the same interval hit the cache.
+NOW_GRANULARITY = 60
 
-def fuzzy_time_to_unix(text: str):
+
+def fuzzy_time_to_unix(text: str, granularity: int = None):
     """
     Converts a human readable time and date to a Unix timestamp
 
-    Args: text - a human readable date in string form
+    Unix timestamps in milliseconds (strings of 12 or 13 digits) and ISO 8601 dates are
+    converted directly. Anything else, including shorter digit strings such as "20221201",
+    is parsed as natural language against the current time rounded down to ``granularity``
+    seconds, and the results are cached per input and interval.
+
+    Args: text - a human readable date in string form, a Unix timestamp in milliseconds or a datetime
+          granularity - seconds the current time is rounded down to for relative phrases; defaults to NOW_GRANULARITY
 
     Returns: a Unix timestamp
     """
+    if isinstance(text, datetime):
+        return str(int(text.timestamp() * 1000))
+    if isinstance(text, int) and not isinstance(text, bool):
+        return str(text)
+    if not isinstance(text, str):
+        raise _conversion_error()
+
+    stripped = text.strip()
+    if UNIX_MS.match(stripped):
+        return str(int(stripped))
+    if _fromisoformat is not None and ISO_DATE.match(stripped):
+        if stripped.endswith("Z"):
+            stripped = stripped[:-1] + "+00:00"
+        try:
+            return str(int(_fromisoformat(stripped).timestamp() * 1000))
+        except ValueError:
+            pass
+
+    granularity = granularity or NOW_GRANULARITY
+    return _parse_fuzzy_time(text, int(clock.time() // granularity), granularity)
+
+
+@lru_cache(maxsize=1024)
+def _parse_fuzzy_time(text: str, interval: int, granularity: int) -> str:
+    """Parses natural language against the start of an interval. Failed parses raise and are not cached."""
+    # Outside the try, so that a missing package raises ImportError rather than a conversion error.
+    import pendulum as time
+    from timefhuman import timefhuman
+
     try:
-        now = time.now()
+        now = time.from_timestamp(interval * granularity, tz=time.local_timezone())
         timestamp = datetime.timestamp(timefhuman(text, now))
         return str(int(timestamp * 1000))
     except BaseException:
         print("\n")
-        raise exceptions.ClickupClientError(
-            "The date you entered was not convertable to a Unix timestamp. Check the format and spelling.",
-            "Time conversion error",
-        )
+        raise _conversion_error()
+
+
+def _conversion_error() -> exceptions.ClickupClientError:
+    return exceptions.ClickupClientError(
+        "The date you entered was not convertable to a Unix timestamp. Check the format and spelling.",
+        "Time conversion error",
+    )
 
 
 def fuzzy_time_to_seconds(text: any) -> int:
@@ -57,6 +115,8 @@ def fuzzy_time_to_seconds(text: any) -> int:
 
     # Not a timestamp, so let's interpret the fuzzy string
     except ValueError:
+        from word2number import w2n
+
         text = text.lower()
         pairs = []
         for word in text.split():
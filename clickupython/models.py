@@ -1,6 +1,8 @@
 from typing import Optional, List, Any
 
-from pydantic import BaseModel, ValidationError, validator, Field
+from pydantic import BaseModel, ValidationError, validator, Field, PrivateAttr
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+from pydantic.validators import bool_validator, float_validator, int_validator, str_validator
 
 import json
 
@@ -863,3 +865,260 @@ class TimeTrackingDataSingle(BaseModel):
 
     def __iter__(self):
         return iter(self.data)
+
+
+_construct_plans = {}
+_MISSING = object()
+_IMMUTABLE_DEFAULTS = (type(None), str, int, float, bool)
+# The scalar types construct coerces, with pydantic's own converters for them.
+_SCALAR_VALIDATORS = {
+    str: str_validator,
+    int: int_validator,
+    float: float_validator,
+    bool: bool_validator,
+}
+
+
+def _construct_plan(model):
+    """Lists, once per model, each field's name, alias, default, nested model, whether it holds a list of them,
+    its scalar type when it is declared as str, int, float or bool, and the field itself when it has pre
+    validators to run."""
+    entry = _construct_plans.get(model)
+    if entry is None:
+        plan = []
+        for name, field in model.__fields__.items():
+            nested = field.type_ if isinstance(field.type_, type) and issubclass(field.type_, BaseModel) else None
+            # Immutable defaults can be shared; anything else is copied per instance, as pydantic does.
+            copied = None if isinstance(field.default, _IMMUTABLE_DEFAULTS) else field
+            plan.append(
+                (
+                    name,
+                    field.alias,
+                    field.required,
+                    copied,
+                    field.default,
+                    nested,
+                    field.shape == SHAPE_LIST,
+                    field.type_ if field.type_ in _SCALAR_VALIDATORS else None,
+                    field if field.pre_validators else None,
+                )
+            )
+        entry = _construct_plans[model] = (plan, bool(model.__private_attributes__))
+    return entry
+
+
+def _scalar(scalar_type: type, value):
+    """Converts a value to a field's declared str, int, float or bool type as validation would,
+    leaving values validation would reject as they are."""
+    if value is None or value.__class__ is scalar_type:
+        return value
+    try:
+        return _SCALAR_VALIDATORS[scalar_type](value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _scalar_value(scalar_type: type, is_list: bool, value):
+    if is_list:
+        if isinstance(value, list):
+            return [_scalar(scalar_type, item) for item in value]
+        return value
+    return _scalar(scalar_type, value)
+
+
+def _construct_value(nested, is_list: bool, value):
+    """Builds the nested models held by one field value without validation."""
+    if nested is None or value is None:
+        return value
+    if is_list:
+        return [construct(nested, item) if isinstance(item, dict) else item for item in value]
+    if isinstance(value, dict):
+        return construct(nested, value)
+    return value
+
+
+def construct(model, data: dict):
+    """Builds a model from trusted response data without running pydantic validation.
+
+    Nested models and lists of nested models are constructed the same way, keys that
+    are not fields are dropped, and missing fields get their defaults. Values of fields
+    declared as str, int, float or bool (and lists of them) are converted with pydantic's
+    own validators, so an id sent as 5 becomes "5" and an orderindex sent as "1" becomes
+    1, and ``pre`` validators still run. Values those validators reject, and values of
+    any other declared type (unions, dicts, Any), are stored as received, so only use it
+    for payloads that come straight from the ClickUp API.
+
+    Args:
+        :model (Type[BaseModel]): The model class to build.
+        :data (dict): The decoded JSON for it.
+
+    Returns:
+        :BaseModel: An instance of model.
+    """
+    plan, has_private = _construct_plan(model)
+    values = {}
+    fields_set = set()
+    for name, alias, required, copied_default, default, nested, is_list, scalar_type, validated in plan:
+        value = data.get(alias, _MISSING)
+        if value is _MISSING:
+            value = data.get(name, _MISSING)
+        if value is not _MISSING:
+            fields_set.add(name)
+        elif required:
+            continue
+        else:
+            value = default if copied_default is None else copied_default.get_default()
+            if validated is None or not validated.validate_always:
+                values[name] = value
+                continue
+        if validated is not None:
+            for pre_validator in validated.pre_validators:
+                value = pre_validator(model, value, values, validated, model.__config__)
+        if scalar_type is not None:
+            if value.__class__ is not scalar_type and value is not None:
+                value = _scalar_value(scalar_type, is_list, value)
+        elif nested is not None:
+            value = _construct_value(nested, is_list, value)
+        values[name] = value
+
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__fields_set__", fields_set)
+    if has_private:
+        instance._init_private_attributes()
+    return instance
+
+
+class LazyTask(Task):
+    """A Task that keeps its raw JSON and builds nested fields the first time they are read.
+
+    Scalar fields such as ``id``, ``name`` and ``date_updated`` are set when the task
+    is created. Fields holding nested models or lists (``status``, ``creator``,
+    ``assignees``, ``custom_fields``, ``task_checklists``, ``task_tags``, ``list``,
+    ``folder``, ``space`` and ``priority``) are validated, or constructed when
+    ``trusted`` is set, on first access and then cached like ordinary fields.
+    Exporting, comparing or copying the task builds every remaining field first.
+    """
+
+    _raw: dict = PrivateAttr(default=None)
+    _trusted: bool = PrivateAttr(default=False)
+
+    @classmethod
+    def from_raw(cls, data: dict, trusted: bool = False) -> "LazyTask":
+        """Creates a task from response JSON, deferring its nested fields.
+
+        Args:
+            :data (dict): The task's decoded JSON.
+            :trusted (bool, optional): Construct nested fields without validation when they are read. Defaults to False.
+
+        Returns:
+            :LazyTask: The task.
+        """
+        values = {}
+        fields_set = set()
+        lazy = _lazy_fields(cls)
+        for name, field in cls.__fields__.items():
+            key = field.alias if field.alias in data else name
+            if name in lazy and key in data:
+                continue
+            if key not in data:
+                values[name] = field.get_default()
+                continue
+            if trusted:
+                value = data[key]
+                if field.type_ in _SCALAR_VALIDATORS:
+                    value = _scalar_value(field.type_, field.shape == SHAPE_LIST, value)
+            else:
+                value, errors = field.validate(data[key], values, loc=field.alias, cls=cls)
+                if errors:
+                    raise ValidationError([errors], cls)
+            values[name] = value
+            fields_set.add(name)
+
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__fields_set__", fields_set)
+        instance._init_private_attributes()
+        object.__setattr__(instance, "_raw", data)
+        object.__setattr__(instance, "_trusted", trusted)
+        return instance
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or name not in _lazy_fields(type(self)):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return self.__materialize(name)
+
+    def __materialize(self, name: str):
+        field = self.__fields__[name]
+        value = self._raw[field.alias if field.alias in self._raw else name]
+        if self._trusted:
+            nested = field.type_ if isinstance(field.type_, type) and issubclass(field.type_, BaseModel) else None
+            if field.type_ in _SCALAR_VALIDATORS:
+                value = _scalar_value(field.type_, field.shape == SHAPE_LIST, value)
+            value = _construct_value(nested, field.shape == SHAPE_LIST, value)
+        else:
+            value, errors = field.validate(value, self.__dict__, loc=field.alias, cls=type(self))
+            if errors:
+                raise ValidationError([errors], type(self))
+        self.__dict__[name] = value
+        self.__fields_set__.add(name)
+        return value
+
+    def materialize(self) -> "LazyTask":
+        """Builds every field that has not been read yet and drops the raw JSON."""
+        if self._raw is not None:
+            for name in _lazy_fields(type(self)):
+                if name not in self.__dict__:
+                    getattr(self, name)
+            ordered = {name: self.__dict__[name] for name in self.__fields__}
+            object.__setattr__(self, "__dict__", ordered)
+            object.__setattr__(self, "_raw", None)
+        return self
+
+    def _iter(self, *args, **kwargs):
+        self.materialize()
+        return super()._iter(*args, **kwargs)
+
+    def __repr_args__(self):
+        self.materialize()
+        return super().__repr_args__()
+
+
+_lazy_field_names = {}
+
+
+def _lazy_fields(model) -> frozenset:
+    """The fields of a model that hold nested models or lists, which LazyTask defers."""
+    names = _lazy_field_names.get(model)
+    if names is None:
+        names = _lazy_field_names[model] = frozenset(
+            name
+            for name, field in model.__fields__.items()
+            if field.shape != SHAPE_SINGLETON
+            or field.type_ is Any
+            or (isinstance(field.type_, type) and issubclass(field.type_, BaseModel))
+        )
+    return names
+
+
+def build(model, data: dict, trusted: bool = False, lazy_tasks: bool = False):
+    """Builds a response model the way the clients are configured to.
+
+    Args:
+        :model (Type[BaseModel]): The model class to build.
+        :data (dict): The decoded JSON for it.
+        :trusted (bool, optional): Skip pydantic validation and use :func:`construct`. Defaults to False.
+        :lazy_tasks (bool, optional): Build tasks as :class:`LazyTask`, deferring their nested fields until they are read. Defaults to False.
+
+    Returns:
+        :BaseModel: An instance of model.
+    """
+    if lazy_tasks and model is Task:
+        return LazyTask.from_raw(data, trusted)
+    if lazy_tasks and model is Tasks:
+        return Tasks.construct(
+            tasks=[LazyTask.from_raw(task, trusted) for task in data.get("tasks") or []]
+        )
+    if trusted:
+        return construct(model, data)
+    return model(**data)
@@ -0,0 +1,330 @@
+import abc
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+# ClickUp allows 100 requests per minute per token on the default plan. Higher plans allow more,
+# so unless a capacity is configured the limiters start from this and learn the real budget
+# from the rate limit headers.
+DEFAULT_CAPACITY = 100
+DEFAULT_PERIOD = 60
+
+
+def _new_state(capacity: int, now: float) -> dict:
+    return {
+        "tokens": float(capacity),
+        "stamp": now,
+        "window_remaining": None,
+        "window_reset": 0.0,
+        "capacity": None,
+    }
+
+
+def _capacity(state: dict, capacity: int, learn: bool) -> int:
+    """Returns the bucket size to use: the learned server budget when learning and one is known."""
+    if learn and state.get("capacity"):
+        return state["capacity"]
+    return capacity
+
+
+def _take(state: dict, now: float, capacity: int, period: float, reserve: int) -> float:
+    """Tries to take one token from a bucket state in place.
+
+    Returns:
+        :float: 0 when a token was taken, otherwise the number of seconds to wait before trying again.
+    """
+    rate = capacity / period
+    state["tokens"] = min(capacity, state["tokens"] + (now - state["stamp"]) * rate)
+    state["stamp"] = now
+
+    if state["window_remaining"] is not None:
+        if now >= state["window_reset"]:
+            state["window_remaining"] = None
+        elif state["window_remaining"] <= reserve:
+            return state["window_reset"] - now
+
+    if state["tokens"] < 1:
+        return (1 - state["tokens"]) / rate
+
+    state["tokens"] -= 1
+    if state["window_remaining"] is not None:
+        state["window_remaining"] -= 1
+    return 0
+
+
+def _observe(
+    state: dict,
+    now: float,
+    remaining: int,
+    reset: float,
+    buffer: float,
+    limit: int,
+    capacity: int,
+    learn: bool,
+):
+    """Folds the server's rate limit headers into a bucket state in place.
+
+    The server's count of remaining requests replaces the local one. When learning, the
+    bucket size becomes the reported limit, or else the largest budget seen so far.
+    """
+    if learn:
+        if limit:
+            state["capacity"] = limit
+        else:
+            state["capacity"] = max(state.get("capacity") or capacity, remaining)
+    state["tokens"] = float(min(_capacity(state, capacity, learn), remaining))
+    state["stamp"] = now
+    state["window_remaining"] = remaining
+    state["window_reset"] = reset + buffer
+
+
+def _headroom(state: dict, now: float, capacity: int, period: float) -> float:
+    rate = capacity / period
+    tokens = min(capacity, state["tokens"] + (now - state["stamp"]) * rate)
+    if state["window_remaining"] is not None and now < state["window_reset"]:
+        tokens = min(tokens, state["window_remaining"])
+    return tokens
+
+
+class RateLimiter(abc.ABC):
+    """Paces requests made with an access token.
+
+    Implementations keep one budget per key (the access token) so any number of
+    clients can share a limiter. ``acquire`` blocks until a request may be sent and
+    ``update`` feeds back the rate limit headers of every response.
+    """
+
+    @abc.abstractmethod
+    def acquire(self, key: str) -> None:
+        """Blocks until a request may be sent with the key, and counts it against the key's budget."""
+
+    @abc.abstractmethod
+    def update(self, key: str, remaining: int, reset: float, limit: int = None) -> None:
+        """Folds the rate limit headers of a response sent with the key into its budget."""
+
+    @abc.abstractmethod
+    def seed(self, key: str, remaining: int, reset: float) -> None:
+        """Records a starting budget for a key the limiter knows nothing about yet. Known keys are left alone."""
+
+    @abc.abstractmethod
+    def headroom(self, key: str) -> float:
+        """Returns the number of requests that could be sent right now without waiting."""
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """A thread-safe, in-process token bucket per access token.
+
+    The bucket holds ``capacity`` tokens and refills at ``capacity / period`` tokens
+    per second, so bursts are allowed but sustained traffic is paced evenly. When the
+    server reports how many requests remain in its window, the bucket never spends
+    more than that and waits for the window to reset once only ``reserve`` are left.
+    Without a configured capacity, each token's bucket grows to the limit the server
+    reports (``x-ratelimit-limit``, or the largest remaining count seen), so plans with
+    higher limits are not held to the default.
+
+    Args:
+        :capacity (int, optional): Requests allowed per period. Defaults to None, meaning 100 until the server reports its budget.
+        :period (float, optional): Length of the rate limit window in seconds. Defaults to 60.
+        :reserve (int, optional): Requests to hold back from the server's reported budget. Defaults to 1.
+        :reset_buffer (float, optional): Seconds to wait past the server's reset time. Defaults to 5.
+    """
+
+    def __init__(
+        self,
+        capacity: int = None,
+        period: float = DEFAULT_PERIOD,
+        reserve: int = 1,
+        reset_buffer: float = 5,
+    ):
+        self.capacity = capacity or DEFAULT_CAPACITY
+        self.learn_capacity = capacity is None
+        self.period = period
+        self.reserve = reserve
+        self.reset_buffer = reset_buffer
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def __state(self, key: str) -> dict:
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _new_state(self.capacity, time.time())
+        return state
+
+    def acquire(self, key: str) -> None:
+        while True:
+            with self._lock:
+                state = self.__state(key)
+                wait = _take(
+                    state,
+                    time.time(),
+                    _capacity(state, self.capacity, self.learn_capacity),
+                    self.period,
+                    self.reserve,
+                )
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def update(self, key: str, remaining: int, reset: float, limit: int = None) -> None:
+        with self._lock:
+            _observe(
+                self.__state(key),
+                time.time(),
+                remaining,
+                reset,
+                self.reset_buffer,
+                limit,
+                self.capacity,
+                self.learn_capacity,
+            )
+
+    def seed(self, key: str, remaining: int, reset: float) -> None:
+        with self._lock:
+            if key not in self._states:
+                _observe(
+                    self.__state(key),
+                    time.time(),
+                    remaining,
+                    reset,
+                    self.reset_buffer,
+                    None,
+                    self.capacity,
+                    False,
+                )
+
+    def headroom(self, key: str) -> float:
+        with self._lock:
+            state = self.__state(key)
+            return _headroom(
+                state,
+                time.time(),
+                _capacity(state, self.capacity, self.learn_capacity),
+                self.period,
+            )
+
+
+class FileRateLimiter(RateLimiter):
+    """A token bucket shared between processes on the same machine through a locked state file.
+
+    Every access token gets its own small JSON file under ``directory``, named by a
+    hash of the token, and every read-modify-write of it holds an exclusive file lock.
+    Worker processes that point at the same directory therefore share one budget
+    without any external service.
+
+    Args:
+        :directory (str, optional): Where state files are kept. Defaults to a folder in the system temp directory.
+        :capacity (int, optional): Requests allowed per period. Defaults to None, meaning 100 until the server reports its budget.
+        :period (float, optional): Length of the rate limit window in seconds. Defaults to 60.
+        :reserve (int, optional): Requests to hold back from the server's reported budget. Defaults to 1.
+        :reset_buffer (float, optional): Seconds to wait past the server's reset time. Defaults to 5.
+    """
+
+    def __init__(
+        self,
+        directory: str = None,
+        capacity: int = None,
+        period: float = DEFAULT_PERIOD,
+        reserve: int = 1,
+        reset_buffer: float = 5,
+    ):
+        self.directory = directory or os.path.join(
+            tempfile.gettempdir(), "clickupython-ratelimit"
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        self.capacity = capacity or DEFAULT_CAPACITY
+        self.learn_capacity = capacity is None
+        self.period = period
+        self.reserve = reserve
+        self.reset_buffer = reset_buffer
+        self._lock = threading.Lock()
+
+    def path(self, key: str) -> str:
+        """Returns the state file used for an access token."""
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def __transact(self, key: str, change, only_new: bool = False):
+        """Internal method that applies change(state, now) to a token's state file under an exclusive lock.
+        With only_new, an existing state is left untouched."""
+        with self._lock, open(self.path(key), "a+") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            else:  # pragma: no cover - Windows
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                now = time.time()
+                f.seek(0)
+                contents = f.read()
+                if contents and only_new:
+                    return None
+                state = json.loads(contents) if contents else _new_state(self.capacity, now)
+                result = change(state, now)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+                return result
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+                else:  # pragma: no cover - Windows
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def acquire(self, key: str) -> None:
+        while True:
+            wait = self.__transact(
+                key,
+                lambda state, now: _take(
+                    state,
+                    now,
+                    _capacity(state, self.capacity, self.learn_capacity),
+                    self.period,
+                    self.reserve,
+                ),
+            )
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def update(self, key: str, remaining: int, reset: float, limit: int = None) -> None:
+        self.__transact(
+            key,
+            lambda state, now: _observe(
+                state,
+                now,
+                remaining,
+                reset,
+                self.reset_buffer,
+                limit,
+                self.capacity,
+                self.learn_capacity,
+            ),
+        )
+
+    def seed(self, key: str, remaining: int, reset: float) -> None:
+        self.__transact(
+            key,
+            lambda state, now: _observe(
+                state, now, remaining, reset, self.reset_buffer, None, self.capacity, False
+            ),
+            only_new=True,
+        )
+
+    def headroom(self, key: str) -> float:
+        return self.__transact(
+            key,
+            lambda state, now: _headroom(
+                state, now, _capacity(state, self.capacity, self.learn_capacity), self.period
+            ),
+        )
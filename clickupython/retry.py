@@ -0,0 +1,132 @@
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+import requests
+
+DEFAULT_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is sent again.
+
+    Retries use capped exponential backoff (``backoff_factor * 2 ** (attempt - 1)``,
+    at most ``max_backoff`` seconds) with full jitter. A ``Retry-After`` header sent
+    by the server is honored as is, even when it exceeds ``max_backoff``. POST
+    requests are not idempotent, so they are only retried when the server rejected
+    them outright (429), when the connection could not be established, or when
+    ``retry_non_idempotent`` is set.
+
+    Counters for every decision are kept in ``counters``.
+
+    Args:
+        :max_attempts (int, optional): Total attempts per request, including the first. Defaults to 5.
+        :backoff_factor (float, optional): Base delay in seconds. Defaults to 0.5.
+        :max_backoff (float, optional): Upper bound for a single delay in seconds. Defaults to 30.
+        :jitter (bool, optional): Randomize each delay between 0 and its computed value. Defaults to True.
+        :retry_statuses (Iterable[int], optional): HTTP status codes that are retried. Defaults to 500, 502, 503 and 504.
+        :retry_connection_errors (bool, optional): Retry connection errors and timeouts. Defaults to True.
+        :retry_non_idempotent (bool, optional): Also retry POST requests on server errors and read failures. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_connection_errors: bool = True,
+        retry_non_idempotent: bool = False,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_connection_errors = retry_connection_errors
+        self.retry_non_idempotent = retry_non_idempotent
+        self._counters = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def counters(self) -> dict:
+        """A snapshot of the attempts, retries and give ups recorded so far, plus retries per status code."""
+        with self._lock:
+            return dict(self._counters)
+
+    def __count(self, *keys: str):
+        with self._lock:
+            self._counters.update(keys)
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the delay in seconds before the retry following a given attempt."""
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def retry_after(self, response: requests.Response) -> Optional[float]:
+        """Returns the delay requested by the server's Retry-After header, if any."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def retry_delay(
+        self,
+        attempt: int,
+        idempotent: bool,
+        response: requests.Response = None,
+        error: Exception = None,
+        sent: bool = None,
+    ) -> Optional[float]:
+        """Records the outcome of an attempt and decides what to do next.
+
+        Args:
+            :attempt (int): The number of the attempt that just finished, starting at 1.
+            :idempotent (bool): Whether the request can safely be sent twice.
+            :response (requests.Response, optional): The response, when one was received. An aiohttp response works too.
+            :error (Exception, optional): The connection error raised, when no response was received.
+            :sent (bool, optional): Whether the failed request may have reached the server. Defaults to None,
+                meaning every error except requests.ConnectTimeout.
+
+        Returns:
+            :Optional[float]: Seconds to wait before retrying, or None to stop.
+        """
+        self.__count("attempts")
+
+        if error is not None:
+            if sent is None:
+                sent = not isinstance(error, requests.ConnectTimeout)
+            retryable = self.retry_connection_errors and (
+                idempotent or self.retry_non_idempotent or not sent
+            )
+            reason = "connection_error"
+        else:
+            status = getattr(response, "status_code", None) or response.status
+            if status not in self.retry_statuses:
+                return None
+            retryable = idempotent or self.retry_non_idempotent or status == 429
+            reason = f"status_{status}"
+
+        if not retryable:
+            return None
+        if attempt >= self.max_attempts:
+            self.__count("gave_up")
+            return None
+
+        self.__count("retries", reason)
+        if response is not None:
+            requested = self.retry_after(response)
+            if requested is not None:
+                return requested
+        return self.backoff(attempt)
@@ -0,0 +1,215 @@
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from clickupython import models
+
+HASH_INDEXES = ("status", "assignee", "tag", "list")
+SORTED_INDEXES = ("due_date", "date_updated")
+
+
+def _index_keys(task: models.Task) -> Dict[str, Any]:
+    """Extracts the values a task is indexed under."""
+    tags = []
+    for tag in task.task_tags or []:
+        tags.append(tag.get("name") if isinstance(tag, dict) else getattr(tag, "name", None))
+    return {
+        "status": {task.status.status} if task.status and task.status.status else set(),
+        "assignee": {assignee.id for assignee in task.assignees or [] if assignee.id},
+        "tag": {tag for tag in tags if tag},
+        "list": {task.list.id} if task.list and task.list.id else set(),
+        "due_date": int(task.due_date) if task.due_date else None,
+        "date_updated": int(task.date_updated) if task.date_updated else None,
+    }
+
+
+class TaskStore:
+    """An in-memory collection of tasks with secondary indexes for fast filtering.
+
+    Tasks are indexed by status, assignee id, tag name and list id in hash indexes, and
+    by ``due_date`` and ``date_updated`` in sorted indexes. :meth:`query` intersects
+    the smallest matching index entries first and only checks the remaining candidates,
+    so a query touches the tasks that can match instead of every task in the store.
+    Tasks can be added or replaced at any time, for example page by page as they are
+    fetched.
+
+    The store is not thread-safe; guard it with a lock if it is shared between threads.
+
+    Args:
+        :tasks (Iterable[models.Task], optional): Tasks to add to the store. Defaults to an empty store.
+    """
+
+    def __init__(self, tasks: Iterable[models.Task] = ()):
+        self._tasks = {}
+        self._keys = {}
+        self._hash = {name: defaultdict(set) for name in HASH_INDEXES}
+        self._sorted = {name: [] for name in SORTED_INDEXES}
+        self.upsert_many(tasks)
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._tasks
+
+    def __iter__(self):
+        return iter(self._tasks.values())
+
+    def get(self, task_id: str) -> Optional[models.Task]:
+        return self._tasks.get(task_id)
+
+    def upsert(self, task: models.Task):
+        """Adds a task, or replaces the stored task with the same id and reindexes it."""
+        if task.id in self._tasks:
+            self.remove(task.id)
+        keys = _index_keys(task)
+        self._tasks[task.id] = task
+        self._keys[task.id] = keys
+        for name in HASH_INDEXES:
+            for value in keys[name]:
+                self._hash[name][value].add(task.id)
+        for name in SORTED_INDEXES:
+            if keys[name] is not None:
+                insort(self._sorted[name], (keys[name], task.id))
+
+    def upsert_many(self, tasks: Iterable[models.Task]):
+        """Adds or replaces every task in an iterable, such as a models.Tasks page."""
+        for task in tasks:
+            self.upsert(task)
+
+    def remove(self, task_id: str) -> Optional[models.Task]:
+        """Removes a task from the store and its indexes. Returns the removed task, or None if it was not stored."""
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return None
+        keys = self._keys.pop(task_id)
+        for name in HASH_INDEXES:
+            for value in keys[name]:
+                entries = self._hash[name][value]
+                entries.discard(task_id)
+                if not entries:
+                    del self._hash[name][value]
+        for name in SORTED_INDEXES:
+            if keys[name] is not None:
+                index = self._sorted[name]
+                del index[bisect_left(index, (keys[name], task_id))]
+        return task
+
+    def __range(self, name: str, gt: Optional[int], lt: Optional[int]) -> List[tuple]:
+        """Internal method that returns the sorted index entries strictly between two bounds."""
+        index = self._sorted[name]
+        start = 0 if gt is None else bisect_left(index, (gt + 1,))
+        end = len(index) if lt is None else bisect_left(index, (lt,))
+        return index[start:end]
+
+    def query(
+        self,
+        status: Union[str, List[str]] = None,
+        assignee: Union[str, List[str]] = None,
+        tag: Union[str, List[str]] = None,
+        list_id: Union[str, List[str]] = None,
+        due_date_gt: int = None,
+        due_date_lt: int = None,
+        date_updated_gt: int = None,
+        date_updated_lt: int = None,
+        custom_fields: Dict[str, Any] = None,
+        order_by: str = None,
+        reverse: bool = False,
+    ) -> List[models.Task]:
+        """Returns the tasks matching every given condition.
+
+        Conditions on different fields are combined with AND. Passing a list for status, assignee, tag or
+        list_id matches tasks with any of the values.
+
+        Args:
+            :status (Union[str, List[str]], optional): Status names. Defaults to None.
+            :assignee (Union[str, List[str]], optional): Assignee user ids. Defaults to None.
+            :tag (Union[str, List[str]], optional): Tag names. Defaults to None.
+            :list_id (Union[str, List[str]], optional): List ids. Defaults to None.
+            :due_date_gt (int, optional): Due strictly after this Unix time in milliseconds. Defaults to None.
+            :due_date_lt (int, optional): Due strictly before this Unix time in milliseconds. Defaults to None.
+            :date_updated_gt (int, optional): Updated strictly after this Unix time in milliseconds. Defaults to None.
+            :date_updated_lt (int, optional): Updated strictly before this Unix time in milliseconds. Defaults to None.
+            :custom_fields (Dict[str, Any], optional): Custom field ids mapped to the value they must hold. Not indexed, so
+                they are only checked on tasks that match the other conditions. Defaults to None.
+            :order_by (str, optional): "due_date" or "date_updated". Tasks without a value are left out. Defaults to None,
+                meaning no particular order.
+            :reverse (bool, optional): Return the newest first when ordering. Defaults to False.
+
+        Returns:
+            :List[models.Task]: The matching tasks.
+        """
+        candidates: Optional[Set[str]] = None
+
+        filters = []
+        for name, values in (
+            ("status", status),
+            ("assignee", assignee),
+            ("tag", tag),
+            ("list", list_id),
+        ):
+            if values is None:
+                continue
+            if isinstance(values, str):
+                values = [values]
+            index = self._hash[name]
+            filters.append(set().union(*(index.get(value, ()) for value in values)))
+        for ids in sorted(filters, key=len):
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+
+        for name, gt, lt in (
+            ("due_date", due_date_gt, due_date_lt),
+            ("date_updated", date_updated_gt, date_updated_lt),
+        ):
+            if gt is None and lt is None:
+                continue
+            if candidates is not None and len(candidates) < len(self._sorted[name]) // 4:
+                candidates = {
+                    task_id
+                    for task_id in candidates
+                    if self._keys[task_id][name] is not None
+                    and (gt is None or self._keys[task_id][name] > gt)
+                    and (lt is None or self._keys[task_id][name] < lt)
+                }
+            else:
+                in_range = {task_id for _, task_id in self.__range(name, gt, lt)}
+                candidates = in_range if candidates is None else candidates & in_range
+            if not candidates:
+                return []
+
+        if custom_fields:
+            candidates = {
+                task_id
+                for task_id in (self._tasks if candidates is None else candidates)
+                if self.__has_custom_fields(self._tasks[task_id], custom_fields)
+            }
+
+        if order_by is not None:
+            entries = self._sorted[order_by]
+            if candidates is not None and len(candidates) < len(entries) // 4:
+                # Few candidates left: sort them by their stored keys instead of walking the whole index.
+                keyed = sorted(
+                    (
+                        (self._keys[task_id][order_by], task_id)
+                        for task_id in candidates
+                        if self._keys[task_id][order_by] is not None
+                    ),
+                    reverse=reverse,
+                )
+                return [self._tasks[task_id] for _, task_id in keyed]
+            ordered = reversed(entries) if reverse else entries
+            return [
+                self._tasks[task_id]
+                for _, task_id in ordered
+                if candidates is None or task_id in candidates
+            ]
+        if candidates is None:
+            return list(self._tasks.values())
+        return [self._tasks[task_id] for task_id in candidates]
+
+    @staticmethod
+    def __has_custom_fields(task: models.Task, wanted: Dict[str, Any]) -> bool:
+        values = {field.id: field.value for field in task.custom_fields or []}
+        return all(field_id in values and values[field_id] == value for field_id, value in wanted.items())
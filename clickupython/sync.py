@@ -0,0 +1,362 @@
+import sqlite3
+import time
+from typing import Iterable, Iterator, List
+
+from clickupython import models
+
+# Tasks are written in chunks of this many rows as their pages arrive.
+TASK_CHUNK = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    data TEXT NOT NULL,
+    removed_at REAL
+);
+CREATE TABLE IF NOT EXISTS spaces (
+    id TEXT PRIMARY KEY,
+    team_id TEXT NOT NULL,
+    name TEXT,
+    data TEXT NOT NULL,
+    removed_at REAL
+);
+CREATE TABLE IF NOT EXISTS folders (
+    id TEXT PRIMARY KEY,
+    team_id TEXT NOT NULL,
+    space_id TEXT NOT NULL,
+    name TEXT,
+    data TEXT NOT NULL,
+    removed_at REAL
+);
+CREATE TABLE IF NOT EXISTS lists (
+    id TEXT PRIMARY KEY,
+    team_id TEXT NOT NULL,
+    space_id TEXT NOT NULL,
+    folder_id TEXT,
+    name TEXT,
+    data TEXT NOT NULL,
+    removed_at REAL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    team_id TEXT NOT NULL,
+    list_id TEXT,
+    name TEXT,
+    status TEXT,
+    date_updated INTEGER,
+    data TEXT NOT NULL,
+    removed_at REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_list_id ON tasks (list_id);
+CREATE INDEX IF NOT EXISTS tasks_team_id ON tasks (team_id, date_updated);
+CREATE TABLE IF NOT EXISTS deletions (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    team_id TEXT,
+    removed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    team_id TEXT PRIMARY KEY,
+    high_water INTEGER,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+class SyncReport:
+    """What a sync changed for one team.
+
+    Attributes:
+        :team_id (str): The team that was synced.
+        :full (bool): Whether every task was fetched rather than only the ones updated since the last sync.
+        :upserted (dict): The number of rows written, per table.
+        :removed (dict): The number of rows marked as removed, per table.
+        :high_water (int): The newest task date_updated seen, in Unix milliseconds. Later syncs fetch tasks updated after it.
+        :requests (int): The number of API requests the sync used.
+    """
+
+    def __init__(self, team_id: str, full: bool):
+        self.team_id = team_id
+        self.full = full
+        self.upserted = {}
+        self.removed = {}
+        self.high_water = None
+        self.requests = 0
+
+    def __repr__(self):
+        return (
+            f"SyncReport(team_id={self.team_id!r}, full={self.full!r}, upserted={self.upserted!r}, "
+            f"removed={self.removed!r}, high_water={self.high_water!r}, requests={self.requests!r})"
+        )
+
+
+class WorkspaceMirror:
+    """A local SQLite copy of the teams, spaces, folders, lists and tasks a client can see.
+
+    The first sync of a team fetches all of its tasks. Later syncs fetch, one page at a
+    time, only the tasks updated after the stored high-water mark less ``overlap``
+    milliseconds, so tasks updated in the same instant as the last sync read them are
+    not missed, and upsert them by id. The
+    hierarchy is small, so it is refetched on every sync, and spaces, folders and lists
+    that no longer come back (deleted or archived) are marked as removed together with
+    their tasks. Tasks deleted directly are not reported by ``date_updated_gt``; a sync
+    with ``full=True`` refetches every task and marks the missing ones as removed.
+    Every removal is also logged in the ``deletions`` table.
+
+    Each team is synced in one transaction, so an interrupted sync leaves the mirror and
+    its high-water mark as they were. Tasks are written in chunks as their pages arrive
+    rather than held in memory. Rows keep the raw JSON of the object in ``data``
+    and the mirror's ``connection`` can be queried directly.
+
+    Args:
+        :client (ClickUpClient): The client used to fetch the workspace.
+        :path (str): The SQLite database file. Created if it does not exist.
+        :concurrency (int, optional): Task pages fetched in parallel during full syncs. Incremental syncs page
+            serially, since tasks edited mid-sync move between pages. Defaults to 1.
+        :overlap (int, optional): Milliseconds before the high-water mark that incremental syncs refetch. Defaults to 60000.
+    """
+
+    def __init__(self, client, path: str, concurrency: int = 1, overlap: int = 60000):
+        self.client = client
+        self.path = path
+        self.concurrency = concurrency
+        self.overlap = overlap
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def high_water(self, team_id: str) -> int:
+        """Returns the newest task date_updated synced for a team, or None before its first sync."""
+        row = self.connection.execute(
+            "SELECT high_water FROM sync_state WHERE team_id = ?", (team_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def sync(self, team_ids: List[str] = None, full: bool = False) -> List[SyncReport]:
+        """Brings the mirror up to date.
+
+        Args:
+            :team_ids (List[str], optional): The teams to sync. Defaults to None, meaning every team the client can see.
+            :full (bool, optional): Refetch every task and mark tasks that no longer exist as removed. Defaults to False.
+                Incremental syncs only see removals of spaces, folders and lists; a task deleted from a list that
+                still exists stays in the mirror until a full sync.
+
+        Returns:
+            :List[SyncReport]: One report per synced team.
+        """
+        teams = getattr(self.client.get_teams(), "teams", None) or []
+        with self.connection:
+            self.__upsert(
+                "teams",
+                [(team.id, team.name, team.json(exclude_none=True)) for team in teams],
+            )
+            self.__remove_missing("teams", [team.id for team in teams])
+
+        reports = []
+        for team in teams:
+            if team_ids is None or team.id in team_ids:
+                reports.append(self.__sync_team(team.id, full))
+        return reports
+
+    def __sync_team(self, team_id: str, full: bool) -> SyncReport:
+        high_water = None if full else self.high_water(team_id)
+        report = SyncReport(team_id, full or high_water is None)
+        requests_before = self.client.request_count
+
+        spaces, folders, lists = [], [], []
+        fetched_spaces = self.client.get_spaces(team_id)
+        for space in getattr(fetched_spaces, "spaces", None) or []:
+            spaces.append((space.id, team_id, space.name, space.json(exclude_none=True)))
+            fetched_folders = self.client.get_folders(space.id)
+            for folder in getattr(fetched_folders, "folders", None) or []:
+                folders.append(
+                    (folder.id, team_id, space.id, folder.name, folder.json(exclude_none=True))
+                )
+                for single_list in folder.lists or []:
+                    lists.append(
+                        (
+                            single_list.id,
+                            team_id,
+                            space.id,
+                            folder.id,
+                            single_list.name,
+                            single_list.json(exclude_none=True),
+                        )
+                    )
+            for single_list in self.client.get_folderless_lists(space.id).lists or []:
+                lists.append(
+                    (
+                        single_list.id,
+                        team_id,
+                        space.id,
+                        None,
+                        single_list.name,
+                        single_list.json(exclude_none=True),
+                    )
+                )
+
+        with self.connection:
+            for table, rows in (("spaces", spaces), ("folders", folders), ("lists", lists)):
+                self.__upsert(table, rows)
+                report.upserted[table] = len(rows)
+
+            newest = high_water
+            seen_tasks = set() if report.full else None
+            report.upserted["tasks"] = 0
+            chunk = []
+            for task in self.client.iter_team_tasks(
+                team_id,
+                order_by="updated",
+                subtasks=True,
+                include_closed=True,
+                date_updated_gt=None if report.full else str(max(0, high_water - self.overlap)),
+                concurrency=self.concurrency if report.full else 1,
+            ):
+                date_updated = int(task.date_updated) if task.date_updated else None
+                if date_updated is not None and (newest is None or date_updated > newest):
+                    newest = date_updated
+                if seen_tasks is not None:
+                    seen_tasks.add(task.id)
+                chunk.append(
+                    (
+                        task.id,
+                        team_id,
+                        task.list.id if task.list else None,
+                        task.name,
+                        task.status.status if task.status else None,
+                        date_updated,
+                        task.json(by_alias=True, exclude_none=True),
+                    )
+                )
+                if len(chunk) >= TASK_CHUNK:
+                    report.upserted["tasks"] += self.__upsert_tasks(chunk, high_water)
+                    chunk = []
+            report.upserted["tasks"] += self.__upsert_tasks(chunk, high_water)
+
+            report.removed["spaces"] = self.__remove_missing(
+                "spaces", [row[0] for row in spaces], team_id
+            )
+            report.removed["folders"] = self.__remove_missing(
+                "folders", [row[0] for row in folders], team_id
+            )
+            report.removed["lists"] = self.__remove_missing(
+                "lists", [row[0] for row in lists], team_id
+            )
+            report.removed["tasks"] = self.__remove_orphaned_tasks(team_id)
+            if report.full:
+                report.removed["tasks"] += self.__remove_missing("tasks", seen_tasks, team_id)
+
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                (team_id, newest, time.time()),
+            )
+
+        report.high_water = newest
+        report.requests = self.client.request_count - requests_before
+        return report
+
+    def __upsert(self, table: str, rows: List[tuple]):
+        """Internal method that writes rows, clearing the removed mark of any that reappeared."""
+        if rows:
+            placeholders = ", ".join("?" * (len(rows[0]) + 1))
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})",
+                [row + (None,) for row in rows],
+            )
+
+    def __upsert_tasks(self, rows: List[tuple], high_water: int) -> int:
+        """Internal method that writes a chunk of task rows. Rows refetched from the overlap before the
+        high-water mark are skipped when the mirror already holds them at the same date_updated.
+
+        Returns:
+            :int: The number of rows written.
+        """
+        if high_water is not None and rows:
+            placeholders = ", ".join("?" * len(rows))
+            stored = dict(
+                self.connection.execute(
+                    f"SELECT id, date_updated FROM tasks WHERE removed_at IS NULL AND id IN ({placeholders})",
+                    [row[0] for row in rows],
+                )
+            )
+            rows = [
+                row
+                for row in rows
+                if row[5] is None or row[5] > high_water or stored.get(row[0]) != row[5]
+            ]
+        self.__upsert("tasks", rows)
+        return len(rows)
+
+    def __remove_missing(self, table: str, seen_ids: Iterable[str], team_id: str = None) -> int:
+        """Internal method that marks rows that were not fetched this time as removed and logs them."""
+        scope, parameters = ("team_id = ? AND ", [team_id]) if team_id else ("", [])
+        seen = set(seen_ids)
+        missing = [
+            row[0]
+            for row in self.connection.execute(
+                f"SELECT id FROM {table} WHERE {scope}removed_at IS NULL", parameters
+            )
+            if row[0] not in seen
+        ]
+        return self.__mark_removed(table, missing, team_id)
+
+    def __remove_orphaned_tasks(self, team_id: str) -> int:
+        """Internal method that marks the tasks of removed lists as removed."""
+        orphaned = [
+            row[0]
+            for row in self.connection.execute(
+                """SELECT tasks.id FROM tasks JOIN lists ON tasks.list_id = lists.id
+                WHERE tasks.team_id = ? AND tasks.removed_at IS NULL AND lists.removed_at IS NOT NULL""",
+                (team_id,),
+            )
+        ]
+        return self.__mark_removed("tasks", orphaned, team_id)
+
+    def __mark_removed(self, table: str, ids: List[str], team_id: str) -> int:
+        now = time.time()
+        self.connection.executemany(
+            f"UPDATE {table} SET removed_at = ? WHERE id = ?",
+            [(now, row_id) for row_id in ids],
+        )
+        self.connection.executemany(
+            "INSERT INTO deletions VALUES (?, ?, ?, ?)",
+            [(table, row_id, team_id, now) for row_id in ids],
+        )
+        return len(ids)
+
+    def tasks(
+        self, team_id: str = None, list_id: str = None, include_removed: bool = False
+    ) -> Iterator[models.Task]:
+        """Reads tasks from the mirror without calling the API.
+
+        Args:
+            :team_id (str, optional): Only tasks of this team. Defaults to None.
+            :list_id (str, optional): Only tasks of this list. Defaults to None.
+            :include_removed (bool, optional): Also return tasks marked as removed. Defaults to False.
+
+        Returns:
+            :Iterator[models.Task]: The matching tasks, most recently updated first.
+        """
+        conditions, parameters = [], []
+        if team_id:
+            conditions.append("team_id = ?")
+            parameters.append(team_id)
+        if list_id:
+            conditions.append("list_id = ?")
+            parameters.append(list_id)
+        if not include_removed:
+            conditions.append("removed_at IS NULL")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        for (data,) in self.connection.execute(
+            f"SELECT data FROM tasks {where} ORDER BY date_updated DESC", parameters
+        ):
+            yield models.Task.parse_raw(data)
@@ -0,0 +1,264 @@
+from typing import Dict, Iterable, Sequence, Union
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+from pydantic import BaseModel
+
+from clickupython import exceptions
+from clickupython import models
+
+DAY_MS = 86_400_000
+GROUP_KEYS = ("user", "task", "tag", "day", "billable")
+STATISTICS = ("count", "sum", "mean", "min", "max")
+
+
+def _require_numpy():
+    if numpy is None:
+        raise exceptions.ClickupClientError(
+            "TimeEntryTable requires numpy. Install it with: pip install clickupython[numpy]",
+            "Missing dependency",
+        )
+
+
+def _ms(value) -> int:
+    if value is None or value == "":
+        return 0
+    return int(value)
+
+
+class TimeEntryTable:
+    """Time entries held as NumPy arrays, with vectorized group-by rollups.
+
+    Each entry is a row: ``start``, ``end`` and ``duration`` are int64 Unix
+    milliseconds, ``billable`` is a bool array, and users and tasks are stored as
+    integer codes into the ``users`` and ``tasks`` id arrays. Tags are kept as
+    (row, tag code) pairs into ``tags`` since an entry can have several. Running
+    timers, which the API reports with a negative duration, are flagged in
+    ``running`` and left out of rollups.
+
+    Build one with :meth:`from_entries` from ``get_time_entries_in_range(..., raw=True)``
+    to skip building models, or from a ``models.TimeTrackingDataList``.
+
+    Args:
+        :utc_offset (int, optional): Milliseconds added to start times before they are cut into days, for local-time
+            daily rollups. Defaults to 0 (UTC).
+    """
+
+    def __init__(self, utc_offset: int = 0):
+        _require_numpy()
+        self.utc_offset = utc_offset
+        self.ids = numpy.empty(0, dtype=object)
+        self.start = numpy.empty(0, dtype=numpy.int64)
+        self.end = numpy.empty(0, dtype=numpy.int64)
+        self.duration = numpy.empty(0, dtype=numpy.int64)
+        self.billable = numpy.empty(0, dtype=bool)
+        self.user_codes = numpy.empty(0, dtype=numpy.int32)
+        self.task_codes = numpy.empty(0, dtype=numpy.int32)
+        self.tag_rows = numpy.empty(0, dtype=numpy.int64)
+        self.tag_codes = numpy.empty(0, dtype=numpy.int32)
+        self.users = numpy.empty(0, dtype=object)
+        self.user_names = numpy.empty(0, dtype=object)
+        self.tasks = numpy.empty(0, dtype=object)
+        self.tags = numpy.empty(0, dtype=object)
+
+    def __len__(self):
+        return len(self.start)
+
+    @property
+    def running(self) -> "numpy.ndarray":
+        """A bool array flagging timers that are still running."""
+        return self.duration < 0
+
+    @property
+    def day(self) -> "numpy.ndarray":
+        """The day each entry started on, as datetime64[D] shifted by ``utc_offset``."""
+        return ((self.start + self.utc_offset) // DAY_MS).astype("datetime64[D]")
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Iterable[Union[dict, models.TimeTrackingData]],
+        utc_offset: int = 0,
+    ) -> "TimeEntryTable":
+        """Builds a table from time entries.
+
+        Args:
+            :entries (Iterable[Union[dict, models.TimeTrackingData]]): Raw time entry dicts or TimeTrackingData models,
+                for example the result of ``get_time_entries_in_range``.
+            :utc_offset (int, optional): Milliseconds added to start times before they are cut into days. Defaults to 0.
+
+        Returns:
+            :TimeEntryTable: The table.
+        """
+        table = cls(utc_offset)
+        users, user_names, tasks, tags = {}, [], {}, {}
+        ids, start, end, duration, billable, user_codes, task_codes = [], [], [], [], [], [], []
+        tag_rows, tag_codes = [], []
+        for row, entry in enumerate(entries or []):
+            if isinstance(entry, BaseModel):
+                entry = entry.dict()
+            ids.append(entry.get("id"))
+            start.append(_ms(entry.get("start")))
+            end.append(_ms(entry.get("end")))
+            duration.append(_ms(entry.get("duration")))
+            billable.append(bool(entry.get("billable")))
+
+            user = entry.get("user") or {}
+            user_id = None if user.get("id") is None else str(user.get("id"))
+            code = users.get(user_id)
+            if code is None:
+                code = users[user_id] = len(users)
+                user_names.append(user.get("username"))
+            user_codes.append(code)
+
+            task = entry.get("task") or {}
+            task_id = task.get("id") if isinstance(task, dict) else None
+            task_codes.append(tasks.setdefault(task_id, len(tasks)))
+
+            for tag in entry.get("tags") or []:
+                tag_rows.append(row)
+                tag_codes.append(tags.setdefault(tag.get("name"), len(tags)))
+
+        table.ids = numpy.array(ids, dtype=object)
+        table.start = numpy.array(start, dtype=numpy.int64)
+        table.end = numpy.array(end, dtype=numpy.int64)
+        table.duration = numpy.array(duration, dtype=numpy.int64)
+        table.billable = numpy.array(billable, dtype=bool)
+        table.user_codes = numpy.array(user_codes, dtype=numpy.int32)
+        table.task_codes = numpy.array(task_codes, dtype=numpy.int32)
+        table.tag_rows = numpy.array(tag_rows, dtype=numpy.int64)
+        table.tag_codes = numpy.array(tag_codes, dtype=numpy.int32)
+        table.users = numpy.array(list(users), dtype=object)
+        table.user_names = numpy.array(user_names, dtype=object)
+        table.tasks = numpy.array(list(tasks), dtype=object)
+        table.tags = numpy.array(list(tags), dtype=object)
+        return table
+
+    def filter(self, mask: "numpy.ndarray") -> "TimeEntryTable":
+        """Returns a table holding only the rows where a bool array is True, e.g. ``table.filter(table.billable)``."""
+        mask = numpy.asarray(mask, dtype=bool)
+        table = TimeEntryTable(self.utc_offset)
+        for name in ("ids", "start", "end", "duration", "billable", "user_codes", "task_codes"):
+            setattr(table, name, getattr(self, name)[mask])
+        kept = mask[self.tag_rows] if len(self.tag_rows) else numpy.zeros(0, dtype=bool)
+        new_rows = numpy.cumsum(mask) - 1
+        table.tag_rows = new_rows[self.tag_rows[kept]]
+        table.tag_codes = self.tag_codes[kept]
+        table.users, table.user_names, table.tasks, table.tags = (
+            self.users,
+            self.user_names,
+            self.tasks,
+            self.tags,
+        )
+        return table
+
+    def __key(self, name: str, rows: "numpy.ndarray"):
+        """Internal method that returns the integer codes of a group key for some rows, and the values they stand for."""
+        if name == "user":
+            return self.user_codes[rows], self.users
+        if name == "task":
+            return self.task_codes[rows], self.tasks
+        if name == "billable":
+            return self.billable[rows].astype(numpy.int64), numpy.array([False, True])
+        if name == "day":
+            days = (self.start[rows] + self.utc_offset) // DAY_MS
+            first = days.min() if len(days) else 0
+            span = int(days.max() - first + 1) if len(days) else 0
+            return days - first, numpy.arange(first, first + span).astype("datetime64[D]")
+        raise exceptions.ClickupClientError(
+            f"Unknown group key {name!r}; expected one of {', '.join(GROUP_KEYS)}.", "Invalid group key"
+        )
+
+    def rollup(
+        self,
+        by: Union[str, Sequence[str]],
+        statistics: Sequence[str] = ("count", "sum", "mean"),
+        percentiles: Sequence[float] = (),
+    ) -> Dict[str, "numpy.ndarray"]:
+        """Aggregates entry durations per group.
+
+        Groups come from one or more keys: "user" (user id), "task" (task id), "tag" (tag name), "day"
+        (datetime64[D] of the start, shifted by ``utc_offset``) and "billable". Grouping by "tag" counts an entry
+        once per tag and leaves out entries without tags. Only groups with entries are returned, ordered by key.
+
+        Args:
+            :by (Union[str, Sequence[str]]): The key or keys to group by.
+            :statistics (Sequence[str], optional): Any of "count", "sum", "mean", "min" and "max" of the durations.
+                Defaults to ("count", "sum", "mean").
+            :percentiles (Sequence[float], optional): Duration percentiles to compute, between 0 and 100, returned as
+                e.g. "p50" and "p95". Defaults to ().
+
+        Returns:
+            :Dict[str, numpy.ndarray]: One array per key and per statistic, aligned by group.
+        """
+        keys = [by] if isinstance(by, str) else list(by)
+        unknown = [name for name in statistics if name not in STATISTICS]
+        if unknown:
+            raise exceptions.ClickupClientError(
+                f"Unknown statistic {unknown[0]!r}; expected one of {', '.join(STATISTICS)}.", "Invalid statistic"
+            )
+
+        if "tag" in keys:
+            rows, tag_codes = self.tag_rows, self.tag_codes
+        else:
+            rows, tag_codes = numpy.arange(len(self)), None
+        finished = ~self.running[rows]
+        rows = rows[finished]
+
+        codes, labels = [], []
+        for name in keys:
+            if name == "tag":
+                codes.append(tag_codes[finished])
+                labels.append(self.tags)
+            else:
+                key_codes, key_labels = self.__key(name, rows)
+                codes.append(key_codes)
+                labels.append(key_labels)
+
+        shape = tuple(max(len(values), 1) for values in labels)
+        flat = numpy.ravel_multi_index(codes, shape) if codes[0].size else numpy.zeros(0, dtype=numpy.int64)
+        size = int(numpy.prod(shape))
+        if size <= 4 * len(flat) + 1024:
+            # Few possible groups: count them directly instead of sorting.
+            present = numpy.bincount(flat, minlength=size) > 0
+            groups = numpy.flatnonzero(present)
+            inverse = (numpy.cumsum(present) - 1)[flat]
+        else:
+            groups, inverse = numpy.unique(flat, return_inverse=True)
+            inverse = inverse.reshape(-1)
+        durations = self.duration[rows]
+
+        result: Dict[str, numpy.ndarray] = {}
+        for name, values, group_codes in zip(keys, labels, numpy.unravel_index(groups, shape)):
+            result[name] = values[group_codes]
+
+        counts = numpy.bincount(inverse, minlength=len(groups))
+        sums = numpy.bincount(inverse, weights=durations, minlength=len(groups)).astype(numpy.int64)
+        if "count" in statistics:
+            result["count"] = counts
+        if "sum" in statistics:
+            result["sum"] = sums
+        if "mean" in statistics:
+            result["mean"] = sums / numpy.maximum(counts, 1)
+
+        if "min" in statistics or "max" in statistics or percentiles:
+            order = numpy.lexsort((durations, inverse))
+            ordered = durations[order]
+            starts = numpy.concatenate(([0], numpy.cumsum(counts)[:-1])).astype(numpy.int64)
+            if "min" in statistics:
+                result["min"] = ordered[starts] if len(groups) else ordered[:0]
+            if "max" in statistics:
+                result["max"] = ordered[starts + counts - 1] if len(groups) else ordered[:0]
+            for percentile in percentiles:
+                position = starts + (counts - 1) * (percentile / 100)
+                lower = numpy.floor(position).astype(numpy.int64)
+                upper = numpy.ceil(position).astype(numpy.int64)
+                if len(groups):
+                    low, high = ordered[lower], ordered[upper]
+                    result[f"p{percentile:g}"] = low + (high - low) * (position - lower)
+                else:
+                    result[f"p{percentile:g}"] = numpy.zeros(0)
+        return result
@@ -0,0 +1,47 @@
+import itertools
+import threading
+from typing import List
+
+from clickupython import exceptions
+from clickupython.ratelimit import RateLimiter
+
+
+class TokenPool:
+    """A set of access tokens that a single client spreads its requests across.
+
+    Rate limit state is tracked per token by the client's rate limiter, and each
+    request is sent with the token that currently has the most headroom. Ties are
+    broken round-robin so idle tokens share the load evenly.
+
+    Args:
+        :tokens (List[str]): The access tokens to use. Must not be empty.
+    """
+
+    def __init__(self, tokens: List[str]):
+        if not tokens:
+            raise exceptions.ClickupClientError(
+                "A token pool needs at least one access token.", "Empty token pool"
+            )
+        self.tokens = list(dict.fromkeys(tokens))
+        self._offsets = itertools.count()
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def select(self, rate_limiter: RateLimiter) -> str:
+        """Returns the token with the most rate limit headroom.
+
+        Args:
+            :rate_limiter (RateLimiter): The limiter that tracks each token's budget.
+
+        Returns:
+            :str: An access token from the pool.
+        """
+        with self._lock:
+            offset = next(self._offsets) % len(self.tokens)
+        rotated = self.tokens[offset:] + self.tokens[:offset]
+        return max(rotated, key=rate_limiter.headroom)
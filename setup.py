@@ -43,6 +43,11 @@ setuptools.setup(
         "typing-extensions==3.10.0.2",
         "setuptools",
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "arrow": ["pyarrow"],
+        "numpy": ["numpy"],
+    },
     # extras_require='requirements.txt',
     # entry_points={
     #     'console_scripts': [  # This can provide executable scripts
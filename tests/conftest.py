@@ -0,0 +1,88 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import urlparse
+
+import pytest
+
+
+class StubAPI:
+    """A local stand-in for the ClickUp API.
+
+    Routes are registered as callables keyed by (method, path) and return a
+    (status_code, json_body, headers) tuple. Every request is recorded in
+    ``calls`` together with the client port that sent it.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.calls = []
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        host, port = self.server.server_address
+        self.url = f"http://{host}:{port}/api/v2/"
+
+    def route(self, method, path, handler):
+        """Registers a handler. Plain dicts are served as a 200 response."""
+        if not callable(handler):
+            body = handler
+            handler = lambda request: (200, body, {})
+        self.routes[(method, path)] = handler
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                parsed = urlparse(self.path)
+                path = parsed.path[len("/api/v2/") :].rstrip("/")
+                request = {
+                    "method": self.command,
+                    "path": path,
+                    "query": parsed.query,
+                    "body": body,
+                    "headers": dict(self.headers),
+                    "port": self.client_address[1],
+                }
+                with stub.lock:
+                    stub.calls.append(request)
+                handler = stub.routes.get((self.command, path))
+                if handler is None:
+                    status, payload, headers = 404, {"err": "Route not found"}, {}
+                else:
+                    status, payload, headers = handler(request)
+                encoded = b"" if payload is None else json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.send_header("x-ratelimit-remaining", "99")
+                self.send_header("x-ratelimit-reset", "0")
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+        return Handler
+
+
+@pytest.fixture
+def stub_api():
+    stub = StubAPI()
+    thread = threading.Thread(target=stub.server.serve_forever, daemon=True)
+    thread.start()
+    with mock.patch("clickupython.client.API_URL", stub.url):
+        yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
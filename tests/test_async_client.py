@@ -0,0 +1,178 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from clickupython import async_client
+from clickupython import exceptions
+from clickupython import models
+from clickupython import retry
+
+API_KEY = "pk_test"
+
+
+class TestAsyncClient:
+    @pytest.mark.asyncclient
+    def test_get_list(self, stub_api):
+        stub_api.route("GET", "list/124", {"id": "124", "name": "List"})
+
+        async def run():
+            async with async_client.AsyncClickUpClient(API_KEY) as c:
+                return await c.get_list("124")
+
+        result = asyncio.run(run())
+        assert isinstance(result, models.SingleList)
+        assert result.id == "124"
+        assert stub_api.calls[0]["headers"]["Authorization"] == API_KEY
+
+    @pytest.mark.asyncclient
+    def test_get_tasks_query(self, stub_api):
+        stub_api.route("GET", "list/124/task", {"tasks": [{"id": "1"}]})
+
+        async def run():
+            async with async_client.AsyncClickUpClient(API_KEY) as c:
+                return await c.get_tasks("124", page=2, include_closed=True)
+
+        result = asyncio.run(run())
+        assert isinstance(result, models.Tasks)
+        assert result.tasks[0].id == "1"
+        assert "page=2" in stub_api.calls[0]["query"]
+        assert "include_closed=true" in stub_api.calls[0]["query"]
+
+    @pytest.mark.asyncclient
+    def test_create_task(self, stub_api):
+        stub_api.route(
+            "POST", "list/124/task", lambda request: (200, json.loads(request["body"]), {})
+        )
+
+        async def run():
+            async with async_client.AsyncClickUpClient(API_KEY) as c:
+                return await c.create_task("124", name="New task")
+
+        result = asyncio.run(run())
+        assert result.name == "New task"
+
+    @pytest.mark.asyncclient
+    def test_concurrent_requests_are_bounded(self, stub_api):
+        stub_api.route("GET", "task/1", {"id": "1"})
+
+        async def run():
+            async with async_client.AsyncClickUpClient(
+                API_KEY, max_concurrency=4
+            ) as c:
+                tasks = await asyncio.gather(*(c.get_task("1") for _ in range(20)))
+                return c, tasks
+
+        c, tasks = asyncio.run(run())
+        assert len(tasks) == 20
+        assert c.request_count == 20
+        assert len({call["port"] for call in stub_api.calls}) <= 4
+
+    @pytest.mark.asyncclient
+    def test_errors(self, stub_api):
+        async def run():
+            async with async_client.AsyncClickUpClient(API_KEY) as c:
+                await c.get_list("missing")
+
+        with pytest.raises(exceptions.ClickupClientError):
+            asyncio.run(run())
+
+    @pytest.mark.asyncclient
+    def test_adaptive_concurrency_limiter(self, stub_api):
+        from clickupython.concurrency import AdaptiveConcurrencyLimiter
+
+        stub_api.route("GET", "task/1", {"id": "1"})
+        limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=4)
+
+        async def run():
+            async with async_client.AsyncClickUpClient(
+                API_KEY, concurrency_limiter=limiter
+            ) as c:
+                return await asyncio.gather(*(c.get_task("1") for _ in range(30)))
+
+        assert len(asyncio.run(run())) == 30
+        assert limiter.limit == 4
+        assert len({call["port"] for call in stub_api.calls}) <= 4
+
+    @pytest.mark.asyncclient
+    def test_projected_tasks(self, stub_api):
+        stub_api.route(
+            "GET", "list/124/task", {"tasks": [{"id": "1", "status": {"status": "open"}}]}
+        )
+
+        async def run():
+            async with async_client.AsyncClickUpClient(API_KEY) as c:
+                return await c.get_tasks("124", fields=["id", "status.status"])
+
+        assert asyncio.run(run()) == [{"id": "1", "status.status": "open"}]
+
+    @pytest.mark.asyncclient
+    def test_transient_errors_are_retried(self, stub_api):
+        statuses = iter([502, 503])
+        stub_api.route(
+            "GET", "list/124", lambda request: (next(statuses, 200), {"id": "124"}, {})
+        )
+
+        async def run():
+            async with async_client.AsyncClickUpClient(
+                API_KEY, retry_policy=retry.RetryPolicy(backoff_factor=0)
+            ) as c:
+                return await c.get_list("124")
+
+        assert asyncio.run(run()).id == "124"
+        assert len(stub_api.calls) == 3
+
+    @pytest.mark.asyncclient
+    def test_idempotent_posts_are_retried(self, stub_api):
+        statuses = iter([502])
+        stub_api.route(
+            "POST", "list/124/task/1", lambda request: (next(statuses, 200), {}, {})
+        )
+        stub_api.route(
+            "POST", "space/789/folder", lambda request: (502, {"err": "Bad gateway"}, {})
+        )
+
+        async def run():
+            async with async_client.AsyncClickUpClient(
+                API_KEY, retry_policy=retry.RetryPolicy(backoff_factor=0)
+            ) as c:
+                assert await c.add_task_to_list("1", "124")
+                await c.create_folder("789", "Folder")
+
+        with pytest.raises(exceptions.ClickupClientError) as error:
+            asyncio.run(run())
+        assert error.value.error_message == "Bad gateway"
+        assert len(stub_api.calls) == 3
+
+    @pytest.mark.asyncclient
+    def test_rate_limited_retries_are_bounded(self, stub_api):
+        stub_api.route("GET", "list/124", lambda request: (429, {"err": "Rate limited"}, {}))
+        policy = retry.RetryPolicy(max_attempts=3, backoff_factor=0, retry_statuses={429})
+
+        async def run():
+            async with async_client.AsyncClickUpClient(
+                API_KEY, retry_rate_limited_requests=True, retry_policy=policy
+            ) as c:
+                await c.get_list("124")
+
+        with pytest.raises(exceptions.ClickupClientError):
+            asyncio.run(run())
+        assert len(stub_api.calls) == 3
+
+    @pytest.mark.asyncclient
+    def test_requests_in_flight_count_against_the_budget(self, stub_api):
+        stub_api.route("GET", "task/1", {"id": "1"})
+
+        async def run():
+            async with async_client.AsyncClickUpClient(
+                API_KEY,
+                start_rate_limit_remaining=3,
+                start_rate_limit_reset=time.time() + 0.5,
+                rate_limit_buffer_wait_time=0,
+            ) as c:
+                return await asyncio.gather(*(c.get_task("1") for _ in range(5)))
+
+        start = time.monotonic()
+        assert len(asyncio.run(run())) == 5
+        assert time.monotonic() - start >= 0.4
@@ -0,0 +1,82 @@
+import threading
+import time
+
+import pytest
+
+from clickupython import bulk
+
+
+def work(payloads):
+    return ((index, payload, payload) for index, payload in enumerate(payloads))
+
+
+class TestBulkJob:
+    @pytest.mark.bulk
+    def test_ordered_results(self):
+        job = bulk.BulkJob(
+            lambda delay: time.sleep(delay) or delay, work([0.05, 0, 0.02]), ordered=True
+        )
+        assert job.run() == [0.05, 0, 0.02]
+        assert job.succeeded == 3
+
+    @pytest.mark.bulk
+    def test_completion_order(self):
+        job = bulk.BulkJob(lambda delay: time.sleep(delay) or delay, work([0.2, 0]))
+        assert job.run() == [0, 0.2]
+
+    @pytest.mark.bulk
+    def test_failures_are_collected(self):
+        def send(value):
+            if value % 2:
+                raise ValueError(value)
+            return value
+
+        job = bulk.BulkJob(send, work(range(6)), failures=[bulk.BulkFailure(9, "x", None)])
+        assert sorted(job.run()) == [0, 2, 4]
+        assert sorted(failure.index for failure in job.failures) == [1, 3, 5, 9]
+
+    @pytest.mark.bulk
+    def test_in_flight_is_bounded(self):
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def send(value):
+            with lock:
+                in_flight.append(value)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(value)
+            return value
+
+        job = bulk.BulkJob(send, work(range(40)), max_workers=3)
+        assert len(job.run()) == 40
+        assert max(peak) <= 3
+
+
+class TestCheckpoint:
+    @pytest.mark.bulk
+    def test_resume_skips_completed(self, tmp_path):
+        path = str(tmp_path / "job.checkpoint")
+        sent = []
+
+        def send(task_id):
+            if task_id == "c":
+                raise ValueError(task_id)
+            sent.append(task_id)
+            return task_id
+
+        job = bulk.BulkJob(send, work("abcd"), checkpoint=bulk.Checkpoint(path))
+        assert sorted(job.run()) == ["a", "b", "d"]
+
+        sent.clear()
+        resumed = bulk.BulkJob(
+            lambda task_id: sent.append(task_id) or task_id,
+            work("abcde"),
+            checkpoint=bulk.Checkpoint(path),
+        )
+        assert sorted(resumed.run()) == ["c", "e"]
+        assert sorted(sent) == ["c", "e"]
+        assert resumed.skipped == 3
+        assert len(bulk.Checkpoint(path)) == 5
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from clickupython import cache
+
+
+class TestResponseCache:
+    @pytest.mark.cache
+    def test_hit_and_miss(self):
+        c = cache.ResponseCache()
+        assert c.get("list", "a") is None
+        c.set("list", "a", {"id": "a"})
+
+        assert c.get("list", "a") == {"id": "a"}
+        assert c.stats["hits"] == 1
+        assert c.stats["misses"] == 1
+        assert c.stats["hit_rate"] == 0.5
+
+    @pytest.mark.cache
+    def test_ttl_per_category(self):
+        c = cache.ResponseCache(ttl=60, ttls={"space": 0.05})
+        c.set("space", "a", {"id": "a"})
+        c.set("list", "a", {"id": "a"})
+        time.sleep(0.1)
+
+        assert c.get("space", "a") is None
+        assert c.get("list", "a") == {"id": "a"}
+
+    @pytest.mark.cache
+    def test_lru_eviction(self):
+        c = cache.ResponseCache(maxsize=2)
+        c.set("list", "a", 1)
+        c.set("list", "b", 2)
+        c.get("list", "a")
+        c.set("list", "c", 3)
+
+        assert c.get("list", "b") is None
+        assert c.get("list", "a") == 1
+        assert c.stats["evictions"] == 1
+
+    @pytest.mark.cache
+    def test_invalidate_categories(self):
+        c = cache.ResponseCache()
+        c.set("list", "a", 1)
+        c.set("folder", "a", 2)
+        c.set("space", "a", 3)
+        c.invalidate("list", "folder")
+
+        assert len(c) == 1
+        assert c.stats["invalidations"] == 2
+
+
+class TestSQLiteResponseCache:
+    @pytest.mark.cache
+    def test_key_normalizes_query_and_hashes_token(self):
+        first = cache.SQLiteResponseCache.key("https://x/api/v2/task?b=2&a=1", "pk_1")
+        second = cache.SQLiteResponseCache.key("https://x/api/v2/task?a=1&b=2", "pk_1")
+        other = cache.SQLiteResponseCache.key("https://x/api/v2/task?a=1&b=2", "pk_2")
+
+        assert first == second
+        assert first != other
+        assert "pk_1" not in first
+
+    @pytest.mark.cache
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "responses.db")
+        c = cache.SQLiteResponseCache(path)
+        c.set("k", '{"id": "1"}', etag='"v1"')
+        c.close()
+
+        stored = cache.SQLiteResponseCache(path).get("k")
+        assert stored.fresh
+        assert stored.json() == {"id": "1"}
+        assert stored.revalidation_headers == {"If-None-Match": '"v1"'}
+
+    @pytest.mark.cache
+    def test_stale_entries_and_touch(self, tmp_path):
+        c = cache.SQLiteResponseCache(str(tmp_path / "responses.db"), ttl=0.05)
+        c.set("k", "{}")
+        time.sleep(0.1)
+
+        assert not c.get("k").fresh
+        c.touch("k")
+        assert c.get("k").fresh
+        assert c.stats["revalidations"] == 1
+
+    @pytest.mark.cache
+    def test_size_caps(self, tmp_path):
+        c = cache.SQLiteResponseCache(
+            str(tmp_path / "responses.db"), max_entries=3, max_bytes=10
+        )
+        for key in "abcd":
+            c.set(key, "1234")
+
+        assert c.get("a") is None
+        assert c.get("b") is None
+        assert c.get("d") is not None
+        assert c.stats["size"] == 2
@@ -19,6 +19,7 @@ from clickupython import models
 import os
 import sys
 from clickupython import exceptions
+from clickupython import retry
 
 API_KEY = "pk_6341704_8OV9MRRLXIK2VO3XV3FNKKLY9IMQAXB3"
 MOCK_API_URL = "https://private-anon-3a942619a6-clickup20.apiary-mock.com/api/v2/"
@@ -623,3 +624,563 @@ class TesttimeTracking:
         assert result.data.task.id == "task_id"
         assert result.data.user.id == "1"
         assert result.data.billable is False
+
+
+class TestSession:
+    @pytest.mark.session
+    def test_verbs_share_pooled_connection(self, stub_api):
+        stub_api.route("GET", "list/124", {"id": "124"})
+        stub_api.route("PUT", "folder/457", {"id": "457"})
+        stub_api.route("POST", "space/789/folder", {"id": "457"})
+        stub_api.route("DELETE", "folder/457", {})
+
+        with client.ClickUpClient(API_KEY) as c:
+            c.get_list("124")
+            c.update_folder("457", "Updated Folder Name")
+            c.create_folder("789", "New Folder Name")
+            c.delete_folder("457")
+
+        assert len(stub_api.calls) == 4
+        assert len({call["port"] for call in stub_api.calls}) == 1
+
+    @pytest.mark.session
+    def test_keep_alive_disabled(self, stub_api):
+        stub_api.route("GET", "list/124", {"id": "124"})
+
+        with client.ClickUpClient(API_KEY, keep_alive=False) as c:
+            c.get_list("124")
+            c.get_list("124")
+
+        assert len({call["port"] for call in stub_api.calls}) == 2
+        assert stub_api.calls[0]["headers"]["Connection"] == "close"
+
+    @pytest.mark.session
+    def test_close_leaves_external_session_open(self):
+        session = mock.MagicMock()
+        c = client.ClickUpClient(API_KEY, session=session)
+        c.close()
+        session.close.assert_not_called()
+
+        c = client.ClickUpClient(API_KEY)
+        with mock.patch.object(c.session, "close") as close:
+            c.close()
+        close.assert_called_once()
+
+
+def paged_tasks(total):
+    def handler(request):
+        page = int(dict(p.split("=") for p in request["query"].split("&"))["page"])
+        start = page * 100
+        ids = range(start, min(start + 100, total))
+        return 200, {"tasks": [{"id": str(i)} for i in ids]}, {}
+
+    return handler
+
+
+class TestTaskIterators:
+    @pytest.mark.tasks
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_iter_tasks(self, stub_api, prefetch):
+        stub_api.route("GET", "list/124/task", paged_tasks(250))
+
+        with client.ClickUpClient(API_KEY) as c:
+            tasks = list(c.iter_tasks("124", prefetch=prefetch))
+
+        assert [t.id for t in tasks] == [str(i) for i in range(250)]
+        assert all(isinstance(t, models.Task) for t in tasks)
+        assert len(stub_api.calls) == 3
+
+    @pytest.mark.tasks
+    def test_iter_team_tasks(self, stub_api):
+        stub_api.route("GET", "team/1/task", paged_tasks(200))
+
+        with client.ClickUpClient(API_KEY) as c:
+            tasks = list(c.iter_team_tasks("1", statuses=["open"]))
+
+        assert len(tasks) == 200
+        assert len(stub_api.calls) == 3
+        assert "statuses%5B%5D=open" in stub_api.calls[0]["query"]
+
+    @pytest.mark.tasks
+    def test_iter_team_tasks_concurrent(self, stub_api):
+        stub_api.route("GET", "team/1/task", paged_tasks(1050))
+
+        with client.ClickUpClient(API_KEY) as c:
+            tasks = list(c.iter_team_tasks("1", concurrency=4))
+
+        assert [t.id for t in tasks] == [str(i) for i in range(1050)]
+
+
+class TestRateLimiting:
+    @pytest.mark.ratelimit
+    def test_every_verb_consults_the_limiter(self, stub_api):
+        stub_api.route("GET", "list/124", {"id": "124"})
+        stub_api.route("PUT", "folder/457", {"id": "457"})
+        stub_api.route("POST", "space/789/folder", {"id": "457"})
+        stub_api.route("DELETE", "folder/457", {})
+        limiter = mock.MagicMock()
+
+        with client.ClickUpClient(API_KEY, rate_limiter=limiter) as c:
+            c.get_list("124")
+            c.update_folder("457", "Updated Folder Name")
+            c.create_folder("789", "New Folder Name")
+            c.delete_folder("457")
+
+        assert limiter.acquire.call_count == 4
+        limiter.acquire.assert_called_with(API_KEY)
+        limiter.update.assert_called_with(API_KEY, 99, 0.0)
+        assert c.rate_limit_remaining == 99
+
+    @pytest.mark.ratelimit
+    def test_start_budget_does_not_overwrite_shared_state(self):
+        limiter = mock.MagicMock()
+
+        client.ClickUpClient(API_KEY, rate_limiter=limiter)
+        client.ClickUpClient(API_KEY, rate_limiter=limiter, start_rate_limit_remaining=50, start_rate_limit_reset=0)
+
+        limiter.update.assert_not_called()
+        limiter.seed.assert_called_once_with(API_KEY, 50, 0)
+
+
+def flaky(statuses, body, headers=None):
+    responses = iter(statuses)
+
+    def handler(request):
+        status = next(responses, 200)
+        payload = body if status < 400 else {"err": "Bad gateway"}
+        return status, payload, headers if status >= 400 and headers else {}
+
+    return handler
+
+
+class TestRetries:
+    @pytest.mark.retry
+    def test_transient_errors_are_retried_for_every_verb(self, stub_api):
+        stub_api.route("GET", "list/124", flaky([502, 503], {"id": "124"}))
+        stub_api.route("PUT", "folder/457", flaky([500], {"id": "457"}))
+        stub_api.route("DELETE", "folder/457", flaky([504], {}))
+        policy = retry.RetryPolicy(backoff_factor=0.01)
+
+        with client.ClickUpClient(API_KEY, retry_policy=policy) as c:
+            assert c.get_list("124").id == "124"
+            assert c.update_folder("457", "Folder").id == "457"
+            assert c.delete_folder("457")
+
+        assert len(stub_api.calls) == 7
+        assert policy.counters["retries"] == 4
+
+    @pytest.mark.retry
+    def test_post_is_not_retried_on_server_error(self, stub_api):
+        stub_api.route("POST", "space/789/folder", flaky([502], {"id": "457"}))
+        policy = retry.RetryPolicy(backoff_factor=0.01)
+
+        with client.ClickUpClient(API_KEY, retry_policy=policy) as c:
+            with pytest.raises(exceptions.ClickupClientError) as error:
+                c.create_folder("789", "New Folder Name")
+
+        assert error.value.status_code == 502
+        assert error.value.error_message == "Bad gateway"
+        assert len(stub_api.calls) == 1
+
+    @pytest.mark.retry
+    def test_rate_limited_requests_honor_retry_after(self, stub_api):
+        stub_api.route(
+            "POST",
+            "list/124/task",
+            flaky([429], {"id": "1"}, {"Retry-After": "0.2"}),
+        )
+
+        with client.ClickUpClient(API_KEY, retry_rate_limited_requests=True) as c:
+            assert c.create_task("124", name="Task").id == "1"
+
+        assert len(stub_api.calls) == 2
+
+    @pytest.mark.retry
+    def test_rate_limited_requests_raise_without_retry(self, stub_api):
+        stub_api.route("GET", "list/124", flaky([429], {"id": "124"}))
+
+        with client.ClickUpClient(API_KEY) as c:
+            with pytest.raises(exceptions.ClickupClientError):
+                c.get_list("124")
+
+    @pytest.mark.retry
+    def test_gives_up_after_max_attempts(self, stub_api):
+        stub_api.route("GET", "list/124", flaky([502] * 10, {"id": "124"}))
+        policy = retry.RetryPolicy(max_attempts=3, backoff_factor=0.01)
+
+        with client.ClickUpClient(API_KEY, retry_policy=policy) as c:
+            with pytest.raises(exceptions.ClickupClientError) as error:
+                c.get_list("124")
+
+        assert error.value.status_code == 502
+        assert error.value.error_message == "Bad gateway"
+        assert len(stub_api.calls) == 3
+        assert policy.counters["gave_up"] == 1
+
+
+class TestAdaptiveConcurrency:
+    @pytest.mark.concurrency
+    def test_client_feeds_headers_to_limiter(self, stub_api):
+        from concurrent.futures import ThreadPoolExecutor
+        from clickupython.concurrency import AdaptiveConcurrencyLimiter
+
+        stub_api.route("GET", "task/1", {"id": "1"})
+        limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=6)
+
+        with client.ClickUpClient(API_KEY, concurrency_limiter=limiter) as c:
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                tasks = list(pool.map(lambda _: c.get_task("1"), range(60)))
+
+        assert len(tasks) == 60
+        assert limiter.limit > 2
+        assert limiter.in_flight == 0
+
+
+class TestTokenPool:
+    @pytest.mark.tokens
+    def test_requests_are_spread_across_tokens(self, stub_api):
+        from collections import Counter
+        from clickupython.tokens import TokenPool
+
+        stub_api.route("GET", "task/1", {"id": "1"})
+        pool = TokenPool(["pk_a", "pk_b", "pk_c"])
+
+        with client.ClickUpClient(pool) as c:
+            for _ in range(30):
+                c.get_task("1")
+
+        used = Counter(call["headers"]["Authorization"] for call in stub_api.calls)
+        assert used == {"pk_a": 10, "pk_b": 10, "pk_c": 10}
+
+    @pytest.mark.tokens
+    def test_use_token_pins_requests(self, stub_api):
+        from clickupython.tokens import TokenPool
+
+        stub_api.route("POST", "team/457/time_entries/stop", {"data": {"id": "1"}})
+
+        with client.ClickUpClient(TokenPool(["pk_a", "pk_b"])) as c:
+            with c.use_token("pk_b"):
+                c.stop_timer("457")
+                c.stop_timer("457")
+
+        assert [call["headers"]["Authorization"] for call in stub_api.calls] == [
+            "pk_b",
+            "pk_b",
+        ]
+
+
+class TestResponseCache:
+    @pytest.mark.cache
+    def test_hierarchy_lookups_are_cached(self, stub_api):
+        from clickupython.cache import ResponseCache
+
+        stub_api.route("GET", "list/124", {"id": "124"})
+        stub_api.route("GET", "space/789/folder", {"folders": [{"id": "457"}]})
+        stub_api.route("GET", "task/1", {"id": "1"})
+
+        with client.ClickUpClient(API_KEY, cache=ResponseCache()) as c:
+            for _ in range(3):
+                assert c.get_list("124").id == "124"
+                assert c.get_folders("789").folders[0].id == "457"
+                c.get_task("1")
+
+        paths = [call["path"] for call in stub_api.calls]
+        assert paths.count("list/124") == 1
+        assert paths.count("space/789/folder") == 1
+        assert paths.count("task/1") == 3
+        assert c.cache.stats["hits"] == 4
+
+    @pytest.mark.cache
+    def test_writes_invalidate(self, stub_api):
+        from clickupython.cache import ResponseCache
+
+        stub_api.route("GET", "list/124", {"id": "124"})
+        stub_api.route("PUT", "list/124", {"id": "124", "name": "Renamed"})
+        stub_api.route("GET", "folder/457", {"id": "457"})
+        stub_api.route("DELETE", "folder/457", {})
+
+        with client.ClickUpClient(API_KEY, cache=ResponseCache()) as c:
+            c.get_list("124")
+            c.get_folder("457")
+            c.update_list("124", name="Renamed")
+            c.get_list("124")
+            c.delete_folder("457")
+            c.get_folder("457")
+
+        paths = [call["path"] for call in stub_api.calls if call["method"] == "GET"]
+        assert paths == ["list/124", "folder/457", "list/124", "folder/457"]
+
+
+    @pytest.mark.cache
+    def test_cache_is_keyed_by_token(self, stub_api):
+        from clickupython.cache import ResponseCache
+        from clickupython.tokens import TokenPool
+
+        stub_api.route("GET", "list/124", {"id": "124"})
+
+        with client.ClickUpClient(TokenPool(["pk_a", "pk_b"]), cache=ResponseCache()) as c:
+            for token in ("pk_a", "pk_b", "pk_a", "pk_b"):
+                with c.use_token(token):
+                    c.get_list("124")
+
+        assert [call["headers"]["Authorization"] for call in stub_api.calls] == ["pk_a", "pk_b"]
+
+    @pytest.mark.cache
+    def test_callers_get_their_own_copy(self, stub_api):
+        from clickupython.cache import ResponseCache
+
+        stub_api.route("GET", "list/124", {"id": "124", "statuses": [{"status": "open"}]})
+
+        with client.ClickUpClient(API_KEY, cache=ResponseCache()) as c:
+            get = c._ClickUpClient__get_request
+            first = get("list/", "124", cache_category="list")
+            first["statuses"][0]["status"] = "changed"
+            second = get("list/", "124", cache_category="list")
+            second["id"] = "changed"
+
+            assert get("list/", "124", cache_category="list") == {"id": "124", "statuses": [{"status": "open"}]}
+        assert len(stub_api.calls) == 1
+
+
+class TestDiskCache:
+    @pytest.mark.cache
+    def test_fresh_responses_survive_clients(self, stub_api, tmp_path):
+        from clickupython.cache import SQLiteResponseCache
+
+        stub_api.route("GET", "task/1", {"id": "1", "name": "Stored"})
+        path = str(tmp_path / "responses.db")
+
+        with client.ClickUpClient(API_KEY, disk_cache=SQLiteResponseCache(path)) as c:
+            c.get_task("1")
+        with client.ClickUpClient(API_KEY, disk_cache=SQLiteResponseCache(path)) as c:
+            assert c.get_task("1").name == "Stored"
+
+        assert len(stub_api.calls) == 1
+
+    @pytest.mark.cache
+    def test_stale_responses_are_revalidated(self, stub_api, tmp_path):
+        from clickupython.cache import SQLiteResponseCache
+
+        def conditional(request):
+            if request["headers"].get("If-None-Match") == '"v1"':
+                return 304, None, {"ETag": '"v1"'}
+            return 200, {"id": "1", "name": "Original"}, {"ETag": '"v1"'}
+
+        stub_api.route("GET", "task/1", conditional)
+        disk_cache = SQLiteResponseCache(str(tmp_path / "responses.db"), ttl=0)
+
+        with client.ClickUpClient(API_KEY, disk_cache=disk_cache) as c:
+            assert c.get_task("1").name == "Original"
+            assert c.get_task("1").name == "Original"
+
+        assert len(stub_api.calls) == 2
+        assert stub_api.calls[1]["headers"]["If-None-Match"] == '"v1"'
+        assert disk_cache.stats["revalidations"] == 1
+
+
+class TestRequestCoalescing:
+    @pytest.mark.concurrency
+    def test_identical_concurrent_gets_share_one_call(self, stub_api):
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        def slow_list(request):
+            time.sleep(0.3)
+            return 200, {"id": "124"}, {}
+
+        stub_api.route("GET", "list/124", slow_list)
+
+        with client.ClickUpClient(API_KEY) as c:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                lists = list(pool.map(lambda _: c.get_list("124"), range(8)))
+
+        assert all(fetched.id == "124" for fetched in lists)
+        assert len(stub_api.calls) < 8
+        assert c.single_flight.stats["calls"] == len(stub_api.calls)
+        assert c.single_flight.stats["collapsed"] == 8 - len(stub_api.calls)
+
+    @pytest.mark.concurrency
+    def test_coalescing_can_be_disabled(self, stub_api):
+        stub_api.route("GET", "list/124", {"id": "124"})
+
+        with client.ClickUpClient(API_KEY, coalesce_requests=False) as c:
+            c.get_list("124")
+
+        assert c.single_flight is None
+
+
+class TestBulkCreate:
+    @pytest.mark.bulk
+    def test_create_tasks_bulk(self, stub_api):
+        import json
+
+        def create(request):
+            body = json.loads(request["body"])
+            if body["name"] == "Rejected":
+                return 400, {"err": "Task name invalid"}, {}
+            return 200, {"id": body["name"], "name": body["name"]}, {}
+
+        stub_api.route("POST", "list/124/task", create)
+        specs = [
+            {"name": "First", "priority": 2},
+            {"name": "Bad priority", "priority": 9},
+            {"name": "Rejected"},
+            {"description": "No name"},
+            {"name": "Second", "tags": ["imported"]},
+        ]
+
+        with client.ClickUpClient(API_KEY) as c:
+            job = c.create_tasks_bulk("124", specs, ordered=True)
+            assert len(job.failures) == 2
+            assert not stub_api.calls
+            tasks = job.run()
+
+        assert [task.name for task in tasks] == ["First", "Second"]
+        assert sorted(failure.index for failure in job.failures) == [1, 2, 3]
+        assert job.failures[-1].item == {"name": "Rejected"}
+        assert len(stub_api.calls) == 3
+        assert all(json.loads(call["body"])["notify_all"] for call in stub_api.calls)
+
+
+class TestBulkTaskIds:
+    @pytest.mark.bulk
+    def test_tag_tasks_bulk_resumes_from_checkpoint(self, stub_api, tmp_path):
+        for task_id in "123":
+            stub_api.route("POST", f"task/{task_id}/tag/imported", {})
+        checkpoint = str(tmp_path / "tag.checkpoint")
+
+        with client.ClickUpClient(API_KEY) as c:
+            first = c.tag_tasks_bulk(iter(["1", "2"]), "imported", checkpoint=checkpoint)
+            assert sorted(first) == ["1", "2"]
+            resumed = c.tag_tasks_bulk(
+                (task_id for task_id in "123"), "imported", checkpoint=checkpoint
+            )
+            assert list(resumed) == ["3"]
+
+        assert resumed.skipped == 2
+        assert len(stub_api.calls) == 3
+
+    @pytest.mark.bulk
+    def test_update_and_delete_tasks_bulk(self, stub_api):
+        stub_api.route("PUT", "task/1", lambda request: (200, {"id": "1", "status": {"status": "done"}}, {}))
+        stub_api.route("DELETE", "task/1", {})
+
+        with client.ClickUpClient(API_KEY) as c:
+            with pytest.raises(exceptions.ClickupClientError):
+                c.update_tasks_bulk(["1"], {"priority": 9})
+            updated = c.update_tasks_bulk(["1", "2"], {"status": "done"})
+            updated.run()
+            deleted = c.delete_tasks_bulk(["1", "2"])
+            assert list(deleted) == ["1"]
+
+        assert updated.succeeded == 1
+        assert [failure.item for failure in updated.failures] == ["2"]
+        assert [failure.item for failure in deleted.failures] == ["2"]
+
+
+class TestResponseModels:
+    @pytest.mark.models
+    def test_trusted_models_match_validated(self, stub_api):
+        page = {
+            "tasks": [
+                {"id": "1", "name": "A", "status": {"status": "open"}, "assignees": [{"id": "183"}]}
+            ]
+        }
+        stub_api.route("GET", "list/124/task", page)
+
+        with client.ClickUpClient(API_KEY) as validated, client.ClickUpClient(
+            API_KEY, trusted_models=True
+        ) as trusted:
+            assert trusted.get_tasks("124") == validated.get_tasks("124")
+            assert isinstance(trusted.get_tasks("124").tasks[0].assignees[0], models.Asssignee)
+
+    @pytest.mark.models
+    def test_lazy_tasks(self, stub_api):
+        stub_api.route(
+            "GET", "list/124/task", {"tasks": [{"id": "1", "status": {"status": "open"}}]}
+        )
+
+        with client.ClickUpClient(API_KEY, lazy_tasks=True) as c:
+            tasks = c.get_tasks("124")
+
+        assert isinstance(tasks.tasks[0], models.LazyTask)
+        assert tasks.tasks[0].status.status == "open"
+
+
+class TestProjection:
+    @pytest.mark.models
+    def test_raw_and_projected_tasks(self, stub_api):
+        page = {
+            "tasks": [
+                {"id": "1", "name": "A", "status": {"status": "open"}},
+                {"id": "2", "name": "B", "status": None},
+            ]
+        }
+        stub_api.route("GET", "list/124/task", page)
+
+        with client.ClickUpClient(API_KEY) as c:
+            assert c.get_tasks("124", raw=True) == page["tasks"]
+            assert c.get_tasks("124", fields=["id", "status.status"]) == [
+                {"id": "1", "status.status": "open"},
+                {"id": "2", "status.status": None},
+            ]
+            assert list(c.iter_tasks("124", fields=["name"])) == [{"name": "A"}, {"name": "B"}]
+
+    @pytest.mark.models
+    def test_projected_comments_and_time_entries(self, stub_api):
+        stub_api.route(
+            "GET",
+            "task/1/comment",
+            {"comments": [{"id": "9", "comment_text": "Hi", "user": {"username": "zach"}}]},
+        )
+        stub_api.route(
+            "GET", "team/457/time_entries", {"data": [{"id": "5", "task": {"id": "1"}}]}
+        )
+
+        with client.ClickUpClient(API_KEY) as c:
+            assert c.get_task_comments("1", fields=["id", "user.username"]) == [
+                {"id": "9", "user.username": "zach"}
+            ]
+            assert c.get_time_entries_in_range("457", fields=["task.id"]) == [{"task.id": "1"}]
+
+
+class TestTimeEntryWindows:
+    @pytest.mark.concurrency
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_windows_are_merged_in_order_without_duplicates(self, stub_api, concurrency):
+        day = 86_400_000
+        entries = [
+            {"id": "late", "start": str(5 * day), "end": str(5 * day + 1000), "duration": "1000"},
+            {"id": "spanning", "start": str(day - 1000), "end": str(3 * day), "duration": str(2 * day + 1000)},
+            {"id": "early", "start": "0", "end": "1000", "duration": "1000"},
+            {"id": "running", "start": str(6 * day), "end": "", "duration": str(-6 * day)},
+        ]
+
+        def in_range(request):
+            query = dict(pair.split("=", 1) for pair in request["query"].split("&"))
+            start, end = int(query["start_date"]), int(query["end_date"])
+            overlapping = [
+                entry
+                for entry in entries
+                if int(entry["start"]) <= end and (not entry["end"] or int(entry["end"]) >= start)
+            ]
+            return 200, {"data": overlapping}, {}
+
+        stub_api.route("GET", "team/457/time_entries", in_range)
+
+        with client.ClickUpClient(API_KEY) as c:
+            fetched = list(
+                c.iter_time_entries_in_range(
+                    "457", 0, 7 * day - 1, window_days=1, concurrency=concurrency
+                )
+            )
+
+        assert [entry.id for entry in fetched] == ["early", "spanning", "late", "running"]
+        assert isinstance(fetched[0], models.TimeTrackingData)
+        assert len(stub_api.calls) == 7
+
+    @pytest.mark.concurrency
+    def test_invalid_range(self, stub_api):
+        with client.ClickUpClient(API_KEY) as c:
+            with pytest.raises(exceptions.ClickupClientError):
+                list(c.iter_time_entries_in_range("457", 2000, 1000))
@@ -0,0 +1,87 @@
+import copy
+import pickle
+
+import pytest
+
+from clickupython import models
+from clickupython.compact import CompactTask, CompactTasks, InternPool
+
+
+def task_payload(n):
+    return {
+        "id": str(n),
+        "name": f"Task {n}",
+        "text_content": "Notes",
+        "description": "Notes",
+        "status": {"status": "open", "color": "#d3d3d3"},
+        "orderindex": "1.0000",
+        "date_updated": str(1650000000000 + n),
+        "due_date": None,
+        "creator": {"id": 183, "username": "Jane"},
+        "assignees": [{"id": str(183 + n % 2), "username": "Jane"}],
+        "tags": [{"name": "bug"}],
+        "priority": {"id": "2", "priority": "high"},
+        "custom_fields": [{"id": "cf", "name": "Estimate", "type": "number", "value": str(n)}],
+        "list": {"id": "124"},
+        "folder": {"id": "457", "name": "Folder"},
+    }
+
+
+class TestCompactTask:
+    @pytest.mark.models
+    def test_round_trip(self):
+        tasks = models.Tasks(tasks=[task_payload(n) for n in range(3)])
+        compact = CompactTasks(tasks)
+
+        assert len(compact) == 3
+        assert compact.to_tasks() == tasks
+        assert compact[0].date_updated == 1650000000000
+        assert compact[2].custom_fields[0][1] == "2"
+
+    @pytest.mark.models
+    def test_repeated_values_are_shared(self):
+        compact = CompactTasks(models.Task(**task_payload(n)) for n in range(4))
+        first, second, third = compact[0], compact[1], compact[2]
+
+        assert first.status is second.status
+        assert first.creator is second.creator
+        assert first.list is second.list
+        assert first.task_tags[0] is second.task_tags[0]
+        assert first.assignees[0] is third.assignees[0]
+        assert first.assignees[0] is not second.assignees[0]
+        assert first.custom_fields[0][0] is second.custom_fields[0][0]
+        assert first.orderindex is second.orderindex
+        assert first.description is first.text_content
+
+    @pytest.mark.models
+    def test_rebuilt_tasks_do_not_share_with_the_pool(self):
+        pool = InternPool()
+        compact = CompactTask.from_task(models.Task(**task_payload(1)), pool)
+
+        task = compact.to_task()
+        task.status.status = "closed"
+        task.custom_fields[0].value = "9"
+
+        assert compact.status.status == "open"
+        assert compact.custom_fields[0][0].value is None
+        with pytest.raises(AttributeError):
+            compact.name = "Renamed"
+        assert not hasattr(compact, "__dict__")
+
+    @pytest.mark.models
+    def test_pickle_and_copy(self):
+        compact = CompactTasks(models.Task(**task_payload(n)) for n in range(2))
+
+        restored = pickle.loads(pickle.dumps(compact))
+        assert list(restored) == list(compact)
+        assert restored[0].status is restored[1].status
+        assert copy.copy(compact[0]) == compact[0]
+        assert copy.deepcopy(compact[0]).to_task() == compact[0].to_task()
+        with pytest.raises(AttributeError):
+            copy.copy(compact[0]).name = "Renamed"
+
+    @pytest.mark.models
+    def test_lazy_tasks(self):
+        lazy = models.LazyTask.from_raw(task_payload(1))
+
+        assert CompactTasks([lazy]).to_tasks().tasks[0] == models.Task(**task_payload(1))
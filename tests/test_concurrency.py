@@ -0,0 +1,138 @@
+import threading
+import time
+
+import pytest
+
+from clickupython import concurrency
+
+
+class TestAdaptiveConcurrencyLimiter:
+    @pytest.mark.concurrency
+    def test_grows_additively_with_headroom(self):
+        limiter = concurrency.AdaptiveConcurrencyLimiter(initial=4, maximum=8)
+        for _ in range(4):
+            limiter.observe(90)
+        assert limiter.limit == 4
+
+        for _ in range(40):
+            limiter.observe(90)
+        assert limiter.limit == 8
+
+    @pytest.mark.concurrency
+    def test_shrinks_multiplicatively_once_per_round(self):
+        limiter = concurrency.AdaptiveConcurrencyLimiter(initial=16)
+        limiter.observe(10)
+        assert limiter.limit == 8
+
+        for _ in range(7):
+            limiter.observe(10)
+        assert limiter.limit == 8
+
+        limiter.observe(10)
+        assert limiter.limit == 4
+
+    @pytest.mark.concurrency
+    def test_rate_limited_response_shrinks(self):
+        limiter = concurrency.AdaptiveConcurrencyLimiter(initial=4)
+        limiter.observe(80, 429)
+        assert limiter.limit == 2
+
+    @pytest.mark.concurrency
+    def test_holds_between_watermarks(self):
+        limiter = concurrency.AdaptiveConcurrencyLimiter(initial=4)
+        for _ in range(20):
+            limiter.observe(35)
+        assert limiter.limit == 4
+
+    @pytest.mark.concurrency
+    def test_never_exceeds_limit(self):
+        limiter = concurrency.AdaptiveConcurrencyLimiter(initial=3, maximum=3)
+        peak = []
+
+        def work():
+            with limiter:
+                peak.append(limiter.in_flight)
+                time.sleep(0.01)
+
+        threads = [threading.Thread(target=work) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) <= 3
+        assert limiter.in_flight == 0
+
+
+class TestSingleFlight:
+    @pytest.mark.concurrency
+    def test_concurrent_calls_share_one_result(self):
+        flight = concurrency.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"id": "1"}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        leader.start()
+        started.wait(5)
+        followers = [
+            threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+            for _ in range(4)
+        ]
+        for thread in followers:
+            thread.start()
+        while flight.stats["collapsed"] < 4:
+            time.sleep(0.01)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len(results) == 5
+        assert all(result is results[0] for result in results)
+        assert flight.stats == {"calls": 1, "collapsed": 4}
+
+    @pytest.mark.concurrency
+    def test_followers_can_get_copies(self):
+        flight = concurrency.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return {"id": "1"}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", slow, share=dict)))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.append(flight.do("k", slow, share=dict)))
+        follower.start()
+        while flight.stats["collapsed"] < 1:
+            time.sleep(0.01)
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+
+    @pytest.mark.concurrency
+    def test_errors_are_shared_and_keys_forgotten(self):
+        flight = concurrency.SingleFlight()
+
+        def failing():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("k", failing)
+        assert flight.do("k", lambda: 2) == 2
+        assert flight.stats["calls"] == 2
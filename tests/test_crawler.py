@@ -0,0 +1,81 @@
+import threading
+from urllib.parse import parse_qs
+
+import pytest
+
+from clickupython import client
+from clickupython.crawler import HierarchyCrawler
+
+API_KEY = "pk_crawler"
+
+
+@pytest.fixture
+def workspace(stub_api):
+    stub_api.route("GET", "team", {"teams": [{"id": "1", "name": "Team"}]})
+    stub_api.route(
+        "GET",
+        "team/1/space",
+        {"spaces": [{"id": "10", "name": "Live"}, {"id": "11", "name": "Old", "archived": True}]},
+    )
+    stub_api.route(
+        "GET",
+        "space/10/folder",
+        {"folders": [{"id": "20", "name": "Folder", "lists": [{"id": "30", "name": "In folder"}]}]},
+    )
+    stub_api.route("GET", "space/10/list", {"lists": [{"id": "31", "name": "Folderless"}]})
+    stub_api.route("GET", "space/11/folder", {"folders": []})
+    stub_api.route("GET", "space/11/list", {"lists": []})
+    stub_api.route("GET", "list/30/task", {"tasks": [{"id": "a", "name": "A"}]})
+    stub_api.route("GET", "list/31/task", {"tasks": [{"id": "b", "name": "B"}, {"id": "c", "name": "C"}]})
+    return stub_api
+
+
+class TestHierarchyCrawler:
+    @pytest.mark.crawler
+    def test_breadth_first_with_pruning(self, workspace):
+        with client.ClickUpClient(API_KEY) as c:
+            crawler = HierarchyCrawler(
+                c, max_workers=4, prune=lambda node: getattr(node.model, "archived", False) is True
+            )
+            nodes = list(crawler.crawl())
+
+        kinds = [node.kind for node in nodes]
+        assert kinds == sorted(kinds, key=["team", "space", "folder", "list", "task"].index)
+        assert {node.id for node in nodes if node.kind == "task"} == {"a", "b", "c"}
+        assert [node.id for node in nodes[-1].path][:2] == ["1", "10"]
+        assert "space/11/folder" not in [call["path"] for call in workspace.calls]
+
+        assert crawler.stats["root"].requests == 1
+        assert crawler.stats["team"].requests == 1
+        assert crawler.stats["space"].requests == 2
+        assert crawler.stats["folder"].requests == 0
+        assert crawler.stats["list"].requests == 2
+        assert crawler.stats["list"].nodes == 3
+
+    @pytest.mark.crawler
+    def test_depth_limit(self, workspace):
+        with client.ClickUpClient(API_KEY) as c:
+            nodes = list(HierarchyCrawler(c, depth="folder").crawl())
+
+        assert [node.kind for node in nodes] == ["team", "space", "space", "folder"]
+        assert not any(call["path"].startswith("list/") for call in workspace.calls)
+        assert not any(call["path"].endswith("/list") for call in workspace.calls)
+
+    @pytest.mark.crawler
+    def test_tasks_stream_page_by_page(self, workspace):
+        first_task = threading.Event()
+        streamed = []
+
+        def tasks(request):
+            if parse_qs(request["query"])["page"] == ["0"]:
+                return 200, {"tasks": [{"id": str(n), "name": "Task"} for n in range(100)]}, {}
+            streamed.append(first_task.wait(5))
+            return 200, {"tasks": []}, {}
+
+        workspace.route("GET", "list/30/task", tasks)
+        with client.ClickUpClient(API_KEY) as c:
+            for node in HierarchyCrawler(c).crawl():
+                if node.kind == "task":
+                    first_task.set()
+
+        assert streamed == [True]
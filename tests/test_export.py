@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from clickupython import client
+from clickupython import models
+
+pyarrow = pytest.importorskip("pyarrow")
+import pyarrow.parquet  # noqa: E402
+
+from clickupython.export import TaskBatches, export_tasks  # noqa: E402
+
+API_KEY = "pk_test"
+
+
+def task_payload(n):
+    return {
+        "id": str(n),
+        "name": f"Task {n}",
+        "status": {"status": "open", "type": "open"},
+        "date_created": "1650000000000",
+        "date_updated": str(1650000000000 + n),
+        "due_date": None,
+        "time_estimate": 3600000,
+        "creator": {"id": 183},
+        "assignees": [{"id": 183, "username": "Jane"}],
+        "tags": [{"name": "bug"}],
+        "priority": {"id": "2", "priority": "high"},
+        "custom_fields": [
+            {"id": "points", "name": "Points", "type": "number", "value": str(n)},
+            {"id": "done", "name": "Done", "type": "checkbox", "value": "true"},
+            {"id": "owner", "name": "Owner", "type": "users", "value": [{"id": 1}]},
+        ],
+        "list": {"id": "124"},
+        "url": f"https://app.clickup.com/t/{n}",
+    }
+
+
+class TestTaskBatches:
+    @pytest.mark.export
+    def test_columns(self):
+        batches = list(TaskBatches([task_payload(n) for n in range(5)], batch_size=2))
+        table = pyarrow.Table.from_batches(batches)
+
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
+        assert table.column("date_updated").type == pyarrow.int64()
+        assert table.column("date_updated").to_pylist()[4] == 1650000000004
+        assert table.column("due_date").to_pylist()[0] is None
+        assert table.column("status").to_pylist()[0] == "open"
+        assert table.column("assignee_ids").to_pylist()[0] == ["183"]
+        assert table.column("tags").to_pylist()[0] == ["bug"]
+        assert table.column("custom_fields.points").to_pylist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert table.column("custom_fields.done").to_pylist()[0] is True
+        assert json.loads(table.column("custom_fields.owner")[0].as_py()) == [{"id": 1}]
+        assert json.loads(table.schema.metadata[b"custom_fields"])["points"] == "Points"
+
+    @pytest.mark.export
+    def test_unreadable_custom_field_values(self):
+        rows = [
+            ({"percent_completed": 0.5}, "12.5", "1650000000000"),
+            ("n/a", "High", "soon"),
+            (None, None, None),
+        ]
+        tasks = []
+        for value, result, due in rows:
+            task = task_payload(len(tasks))
+            task["custom_fields"] = [
+                {"id": "progress", "type": "progress", "value": value},
+                {"id": "score", "type": "formula", "value": result},
+                {"id": "due", "type": "date", "value": due},
+            ]
+            tasks.append(task)
+        table = pyarrow.Table.from_batches(list(TaskBatches(tasks)))
+
+        assert table.column("custom_fields.progress").to_pylist() == [0.5, None, None]
+        assert table.column("custom_fields.score").to_pylist() == ["12.5", "High", None]
+        assert table.column("custom_fields.due").to_pylist() == [1650000000000, None, None]
+
+    @pytest.mark.export
+    def test_models_and_selected_custom_fields(self):
+        tasks = [models.Task(**task_payload(1))]
+        table = pyarrow.Table.from_batches(list(TaskBatches(tasks, custom_fields=["points"])))
+
+        assert table.column("id").to_pylist() == ["1"]
+        assert "custom_fields.done" not in table.column_names
+        assert table.column("custom_fields.points").to_pylist() == [1.0]
+
+
+class TestExportTasks:
+    @pytest.mark.export
+    @pytest.mark.parametrize("format", ["parquet", "arrow"])
+    def test_streams_pages_to_file(self, stub_api, tmp_path, format):
+        stub_api.route("GET", "list/124/task", {"tasks": [task_payload(n) for n in range(3)]})
+        path = tmp_path / f"tasks.{format}"
+
+        with client.ClickUpClient(API_KEY) as c:
+            written = export_tasks(c.iter_tasks("124", raw=True), str(path), format=format, batch_size=2)
+
+        if format == "parquet":
+            table = pyarrow.parquet.read_table(path)
+        else:
+            table = pyarrow.ipc.open_file(str(path)).read_all()
+        assert written == 3
+        assert table.column("id").to_pylist() == ["0", "1", "2"]
+
+    @pytest.mark.export
+    def test_empty_export_writes_schema(self, tmp_path):
+        path = tmp_path / "tasks.parquet"
+
+        assert export_tasks([], str(path)) == 0
+        assert "date_updated" in pyarrow.parquet.read_table(path).column_names
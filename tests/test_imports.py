@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import pytest
+
+DEFERRED = ("timefhuman", "pendulum", "word2number", "aiohttp", "pyarrow", "numpy", "sqlite3")
+
+
+def loaded_after(statement):
+    """Runs a statement in a fresh interpreter and returns the top-level modules it loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+class TestImports:
+    @pytest.mark.imports
+    def test_client_import_defers_optional_dependencies(self):
+        loaded = loaded_after("import clickupython.client")
+
+        assert "requests" in loaded
+        assert not loaded & set(DEFERRED)
+
+    @pytest.mark.imports
+    def test_fuzzy_time_dependencies_load_on_first_use(self):
+        loaded = loaded_after(
+            "from clickupython.helpers.timefuncs import fuzzy_time_to_seconds; fuzzy_time_to_seconds('two hours')"
+        )
+
+        assert "word2number" in loaded
+        assert "timefhuman" not in loaded
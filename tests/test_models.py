@@ -0,0 +1,88 @@
+import pytest
+
+from clickupython import models
+
+
+def task_payload(n):
+    return {
+        "id": str(n),
+        "name": f"Task {n}",
+        "status": {"status": "open", "color": "#d3d3d3"},
+        "date_updated": "1650000000000",
+        "creator": {"id": 183, "username": "Jane"},
+        "assignees": [{"id": "183", "username": "Jane"}],
+        "tags": [{"name": "bug"}],
+        "custom_fields": [{"id": "cf", "name": "Estimate", "type": "number", "value": "3"}],
+        "list": {"id": "124"},
+        "folder": {"id": "457", "name": "Folder"},
+        "unknown_key": True,
+    }
+
+
+class TestConstruct:
+    @pytest.mark.models
+    def test_matches_validated_models(self):
+        page = {"tasks": [task_payload(n) for n in range(3)]}
+
+        assert models.construct(models.Tasks, page) == models.Tasks(**page)
+
+    @pytest.mark.models
+    def test_nested_models_and_defaults(self):
+        task = models.construct(models.Task, task_payload(1))
+
+        assert isinstance(task.assignees[0], models.Asssignee)
+        assert isinstance(task.custom_fields[0], models.CustomField)
+        assert task.task_tags == [{"name": "bug"}]
+        assert task.url == ""
+        assert task.folder.lists == []
+        assert not hasattr(task, "unknown_key")
+
+    @pytest.mark.models
+    def test_coerces_like_validation(self):
+        payload = dict(
+            task_payload(1),
+            assignees=[{"id": 5}],
+            time_estimate=3600000,
+            status={"status": "open", "orderindex": "1"},
+        )
+        space = {"id": 10, "name": "Space", "features": {"due_dates": {"enabled": True}}}
+
+        task = models.construct(models.Task, payload)
+        assert task.assignees[0].id == "5"
+        assert task.time_estimate == "3600000"
+        assert task.status.orderindex == 1
+        assert task == models.Task(**payload)
+
+        constructed = models.construct(models.Space, space)
+        assert constructed.features.time_tracking == models.TimeTracking(enabled=False)
+        assert constructed == models.Space(**space)
+        assert constructed.features.__fields_set__ == models.Space(**space).features.__fields_set__
+
+
+class TestLazyTask:
+    @pytest.mark.models
+    def test_nested_fields_are_built_on_access(self):
+        task = models.LazyTask.from_raw(task_payload(1))
+
+        assert task.id == "1"
+        assert "assignees" not in task.__dict__
+        assert task.assignees[0].username == "Jane"
+        assert task.assignees is task.assignees
+        assert "custom_fields" not in task.__dict__
+
+    @pytest.mark.models
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_export_materializes_everything(self, trusted):
+        task = models.LazyTask.from_raw(task_payload(1), trusted=trusted)
+        validated = models.Task(**task_payload(1))
+
+        assert list(task.dict()) == list(validated.dict())
+        assert task == validated
+        assert task.json() == validated.json()
+
+    @pytest.mark.models
+    def test_validation_errors_surface_on_access(self):
+        task = models.LazyTask.from_raw({"id": "1", "assignees": "not a list"})
+
+        with pytest.raises(models.ValidationError):
+            task.assignees
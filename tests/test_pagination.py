@@ -0,0 +1,84 @@
+from clickupython.helpers import pagination
+import pytest
+
+
+def make_fetch(total, page_size, calls):
+    def fetch(page):
+        calls.append(page)
+        start = page * page_size
+        return list(range(start, min(start + page_size, total)))
+
+    return fetch
+
+
+class TestIterPages:
+    @pytest.mark.pagination
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_iter_pages_stops_on_short_page(self, prefetch):
+        calls = []
+        items = list(
+            pagination.iter_pages(
+                make_fetch(25, 10, calls), page_size=10, prefetch=prefetch
+            )
+        )
+
+        assert items == list(range(25))
+        assert calls == [0, 1, 2]
+
+    @pytest.mark.pagination
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_iter_pages_empty_last_page(self, prefetch):
+        calls = []
+        items = list(
+            pagination.iter_pages(
+                make_fetch(20, 10, calls), page_size=10, prefetch=prefetch
+            )
+        )
+
+        assert items == list(range(20))
+        assert calls == [0, 1, 2]
+
+    @pytest.mark.pagination
+    def test_iter_pages_is_lazy(self):
+        calls = []
+        pages = pagination.iter_pages(make_fetch(100, 10, calls), page_size=10)
+
+        assert next(pages) == 0
+        assert calls == [0]
+
+    @pytest.mark.pagination
+    def test_iter_pages_concurrent_keeps_page_order(self):
+        import random
+        import time
+
+        calls = []
+        fetch = make_fetch(95, 10, calls)
+
+        def slow_fetch(page):
+            time.sleep(random.random() / 100)
+            return fetch(page)
+
+        items = list(
+            pagination.iter_pages(slow_fetch, page_size=10, concurrency=4)
+        )
+
+        assert items == list(range(95))
+        assert set(range(10)) <= set(calls)
+        assert max(calls) < 10 + 4
+
+
+class TestIterWindows:
+    @pytest.mark.pagination
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_windows_cover_the_range_in_order(self, concurrency):
+        calls = []
+
+        def fetch(start, end):
+            calls.append((start, end))
+            return list(range(start, end + 1))
+
+        windows = list(pagination.iter_windows(fetch, 0, 24, 10, concurrency=concurrency))
+
+        assert [(start, end) for start, end, _ in windows] == [(0, 9), (10, 19), (20, 24)]
+        assert [item for _, _, items in windows for item in items] == list(range(25))
+        assert sorted(calls) == [(0, 9), (10, 19), (20, 24)]
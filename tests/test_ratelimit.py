@@ -0,0 +1,143 @@
+import multiprocessing
+import time
+
+import pytest
+
+from clickupython import ratelimit
+
+
+def spend(directory, count):
+    limiter = ratelimit.FileRateLimiter(directory, capacity=count * 2, period=60)
+    for _ in range(count):
+        limiter.acquire("pk_shared")
+
+
+class TestRateLimiter:
+    @pytest.mark.ratelimit
+    def test_is_abstract(self):
+        class Partial(ratelimit.RateLimiter):
+            def acquire(self, key):
+                pass
+
+        with pytest.raises(TypeError):
+            ratelimit.RateLimiter()
+        with pytest.raises(TypeError):
+            Partial()
+
+
+class TestTokenBucketRateLimiter:
+    @pytest.mark.ratelimit
+    def test_bursts_then_paces(self):
+        limiter = ratelimit.TokenBucketRateLimiter(capacity=5, period=0.5)
+
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire("pk_a")
+        burst = time.monotonic() - start
+        for _ in range(2):
+            limiter.acquire("pk_a")
+        paced = time.monotonic() - start - burst
+
+        assert burst < 0.05
+        assert paced >= 0.15
+
+    @pytest.mark.ratelimit
+    def test_tokens_are_tracked_per_key(self):
+        limiter = ratelimit.TokenBucketRateLimiter(capacity=2)
+        limiter.acquire("pk_a")
+        limiter.acquire("pk_a")
+
+        assert limiter.headroom("pk_a") < 1
+        assert limiter.headroom("pk_b") == 2
+
+    @pytest.mark.ratelimit
+    def test_server_window_blocks_until_reset(self):
+        limiter = ratelimit.TokenBucketRateLimiter(reset_buffer=0)
+        limiter.update("pk_a", 1, time.time() + 0.2)
+
+        start = time.monotonic()
+        limiter.acquire("pk_a")
+
+        assert time.monotonic() - start >= 0.15
+
+    @pytest.mark.ratelimit
+    def test_server_window_caps_headroom(self):
+        limiter = ratelimit.TokenBucketRateLimiter(reset_buffer=0)
+        limiter.update("pk_a", 10, time.time() + 30)
+
+        assert limiter.headroom("pk_a") == 10
+        limiter.acquire("pk_a")
+        assert limiter.headroom("pk_a") == 9
+
+    @pytest.mark.ratelimit
+    def test_capacity_is_learned_from_remaining(self):
+        limiter = ratelimit.TokenBucketRateLimiter(reset_buffer=0)
+        limiter.update("pk_a", 9999, time.time() + 60)
+
+        start = time.monotonic()
+        for _ in range(105):
+            limiter.acquire("pk_a")
+
+        assert time.monotonic() - start < 0.5
+        assert limiter.headroom("pk_a") == 9999 - 105
+
+    @pytest.mark.ratelimit
+    def test_capacity_is_learned_from_limit(self):
+        limiter = ratelimit.TokenBucketRateLimiter(reset_buffer=0)
+        limiter.update("pk_a", 500, time.time() - 1, limit=1000)
+
+        assert limiter.headroom("pk_a") == pytest.approx(500, abs=0.5)
+        time.sleep(0.1)
+        assert limiter.headroom("pk_a") > 501
+
+    @pytest.mark.ratelimit
+    def test_configured_capacity_is_kept(self):
+        limiter = ratelimit.TokenBucketRateLimiter(capacity=5, reset_buffer=0)
+        limiter.update("pk_a", 9999, time.time() + 60, limit=10000)
+
+        assert limiter.headroom("pk_a") == 5
+
+    @pytest.mark.ratelimit
+    def test_seed_only_sets_unknown_keys(self):
+        limiter = ratelimit.TokenBucketRateLimiter(reset_buffer=0)
+        limiter.update("pk_a", 10, time.time() + 30)
+        limiter.seed("pk_a", 90, time.time() + 30)
+        limiter.seed("pk_b", 40, time.time() + 30)
+
+        assert limiter.headroom("pk_a") == 10
+        assert limiter.headroom("pk_b") == 40
+
+
+class TestFileRateLimiter:
+    @pytest.mark.ratelimit
+    def test_budget_is_shared_between_processes(self, tmp_path):
+        processes = [
+            multiprocessing.Process(target=spend, args=(str(tmp_path), 5))
+            for _ in range(2)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        limiter = ratelimit.FileRateLimiter(str(tmp_path), capacity=10, period=60)
+        assert limiter.headroom("pk_shared") < 1
+
+    @pytest.mark.ratelimit
+    def test_update_is_visible_to_other_instances(self, tmp_path):
+        first = ratelimit.FileRateLimiter(str(tmp_path), reset_buffer=0)
+        second = ratelimit.FileRateLimiter(str(tmp_path), reset_buffer=0)
+        first.update("pk_a", 3, time.time() + 30)
+
+        assert second.headroom("pk_a") == 3
+        assert second.path("pk_a") == first.path("pk_a")
+        assert "pk_a" not in second.path("pk_a")
+
+    @pytest.mark.ratelimit
+    def test_seed_keeps_shared_state(self, tmp_path):
+        first = ratelimit.FileRateLimiter(str(tmp_path), reset_buffer=0)
+        second = ratelimit.FileRateLimiter(str(tmp_path), reset_buffer=0)
+        first.update("pk_a", 3, time.time() + 30)
+        second.seed("pk_a", 100, time.time() + 30)
+
+        assert first.headroom("pk_a") == 3
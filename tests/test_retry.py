@@ -0,0 +1,63 @@
+import pytest
+import requests
+
+from clickupython import retry
+
+
+def response(status, headers=None):
+    r = requests.Response()
+    r.status_code = status
+    r.headers.update(headers or {})
+    return r
+
+
+class TestRetryPolicy:
+    @pytest.mark.retry
+    def test_backoff_curve_is_capped(self):
+        policy = retry.RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+        assert [policy.backoff(a) for a in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    @pytest.mark.retry
+    def test_jitter_stays_within_curve(self):
+        policy = retry.RetryPolicy(backoff_factor=1, max_backoff=5)
+
+        assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
+
+    @pytest.mark.retry
+    def test_retry_after_is_honored(self):
+        policy = retry.RetryPolicy(max_backoff=1, retry_statuses={429, 503})
+
+        assert policy.retry_delay(1, True, response(503, {"Retry-After": "7"})) == 7
+        assert policy.retry_after(response(429)) is None
+        assert policy.retry_after(
+            response(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        ) == 0
+
+    @pytest.mark.retry
+    def test_post_is_only_retried_when_safe(self):
+        policy = retry.RetryPolicy()
+
+        assert policy.retry_delay(1, False, response(502)) is None
+        assert policy.retry_delay(1, False, error=requests.ReadTimeout()) is None
+        assert policy.retry_delay(1, False, error=requests.ConnectTimeout()) is not None
+        assert retry.RetryPolicy(retry_statuses={429}).retry_delay(
+            1, False, response(429)
+        ) is not None
+        assert retry.RetryPolicy(retry_non_idempotent=True).retry_delay(
+            1, False, response(502)
+        ) is not None
+
+    @pytest.mark.retry
+    def test_counters(self):
+        policy = retry.RetryPolicy(max_attempts=2)
+        policy.retry_delay(1, True, response(502))
+        policy.retry_delay(2, True, response(502))
+        policy.retry_delay(1, True, response(200))
+
+        assert policy.counters == {
+            "attempts": 3,
+            "retries": 1,
+            "status_502": 1,
+            "gave_up": 1,
+        }
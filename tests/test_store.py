@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from clickupython import models
+from clickupython.store import TaskStore
+
+
+def task(task_id, status="open", assignees=(), tags=(), list_id="1", due=None, updated=None, fields=None):
+    return models.Task.build_task(
+        {
+            "id": task_id,
+            "status": {"status": status},
+            "assignees": [{"id": assignee} for assignee in assignees],
+            "tags": [{"name": tag} for tag in tags],
+            "list": {"id": list_id},
+            "due_date": str(due) if due is not None else None,
+            "date_updated": str(updated) if updated is not None else None,
+            "custom_fields": [{"id": key, "value": value} for key, value in (fields or {}).items()],
+        }
+    )
+
+
+class TestTaskStore:
+    @pytest.mark.store
+    def test_compound_query(self):
+        store = TaskStore(
+            [
+                task("a", "open", ["u1"], ["bug"], due=100),
+                task("b", "open", ["u2"], ["bug"], due=200),
+                task("c", "closed", ["u1"], ["bug"], due=300),
+                task("d", "open", ["u1"], [], due=400),
+            ]
+        )
+
+        assert {t.id for t in store.query(status="open", tag="bug")} == {"a", "b"}
+        assert {t.id for t in store.query(assignee="u1", due_date_gt=100)} == {"c", "d"}
+        assert {t.id for t in store.query(status=["open", "closed"], due_date_lt=300)} == {"a", "b"}
+        assert store.query(status="open", tag="missing") == []
+        assert [t.id for t in store.query(assignee="u1", order_by="due_date", reverse=True)] == ["d", "c", "a"]
+
+    @pytest.mark.store
+    def test_upsert_reindexes(self):
+        store = TaskStore([task("a", "open", updated=10)])
+        store.upsert(task("a", "closed", updated=20))
+
+        assert len(store) == 1
+        assert store.query(status="open") == []
+        assert [t.id for t in store.query(status="closed", date_updated_gt=15)] == ["a"]
+        assert store.query(date_updated_lt=15) == []
+
+        store.remove("a")
+        assert store.query(status="closed") == []
+        assert store.query(date_updated_gt=0) == []
+
+    @pytest.mark.store
+    def test_custom_fields(self):
+        store = TaskStore([task("a", fields={"f": 1}), task("b", fields={"f": 2})])
+        assert [t.id for t in store.query(custom_fields={"f": 2})] == ["b"]
+
+    @pytest.mark.store
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        tasks = [
+            task(
+                str(n),
+                rng.choice(["open", "review", "closed"]),
+                rng.sample(["u1", "u2", "u3"], rng.randint(0, 2)),
+                rng.sample(["bug", "ui", "api"], rng.randint(0, 2)),
+                rng.choice(["1", "2"]),
+                due=rng.choice([None, rng.randint(0, 1000)]),
+                updated=rng.randint(0, 1000),
+            )
+            for n in range(500)
+        ]
+        store = TaskStore(tasks)
+
+        expected = {
+            t.id
+            for t in tasks
+            if t.status.status == "open"
+            and any(a.id == "u2" for a in t.assignees)
+            and t.due_date is not None
+            and 200 < int(t.due_date) < 800
+        }
+        found = store.query(status="open", assignee="u2", due_date_gt=200, due_date_lt=800)
+        assert {t.id for t in found} == expected
+
+    @pytest.mark.store
+    def test_ordering_matches_linear_sort(self):
+        rng = random.Random(11)
+        tasks = [
+            task(
+                str(n),
+                "review" if n % 50 == 0 else "open",
+                due=rng.choice([None, rng.randint(0, 100)]),
+            )
+            for n in range(1000)
+        ]
+        store = TaskStore(tasks)
+
+        for status in ("review", "open"):
+            for reverse in (False, True):
+                expected = sorted(
+                    ((int(t.due_date), t.id) for t in tasks if t.status.status == status and t.due_date is not None),
+                    reverse=reverse,
+                )
+                found = store.query(status=status, order_by="due_date", reverse=reverse)
+                assert [t.id for t in found] == [task_id for _, task_id in expected]
@@ -0,0 +1,114 @@
+from urllib.parse import parse_qs
+
+import pytest
+
+from clickupython import client
+from clickupython import sync
+from clickupython.sync import WorkspaceMirror
+
+API_KEY = "pk_sync"
+
+
+@pytest.fixture
+def workspace(stub_api):
+    state = {
+        "lists": [{"id": "100", "name": "Backlog"}, {"id": "101", "name": "Archive"}],
+        "tasks": {
+            "1": {"id": "1", "name": "First", "date_updated": "1000", "list": {"id": "100"}},
+            "2": {"id": "2", "name": "Second", "date_updated": "2000", "list": {"id": "101"}},
+        },
+    }
+
+    def team_tasks(request):
+        query = parse_qs(request["query"])
+        after = int(query.get("date_updated_gt", ["0"])[0])
+        closed = query.get("include_closed", ["false"])[0] == "true"
+        tasks = [
+            t
+            for t in state["tasks"].values()
+            if int(t["date_updated"]) > after and (closed or (t.get("status") or {}).get("type") != "closed")
+        ]
+        return 200, {"tasks": tasks}, {}
+
+    stub_api.route("GET", "team", {"teams": [{"id": "1", "name": "Team"}]})
+    stub_api.route("GET", "team/1/space", {"spaces": [{"id": "10", "name": "Space"}]})
+    stub_api.route("GET", "space/10/folder", {"folders": []})
+    stub_api.route("GET", "space/10/list", lambda request: (200, {"lists": state["lists"]}, {}))
+    stub_api.route("GET", "team/1/task", team_tasks)
+    return state
+
+
+class TestWorkspaceMirror:
+    @pytest.mark.sync
+    def test_incremental_sync(self, stub_api, workspace, tmp_path):
+        with client.ClickUpClient(API_KEY) as c, WorkspaceMirror(c, str(tmp_path / "mirror.db")) as mirror:
+            (first,) = mirror.sync()
+            assert first.full
+            assert first.upserted["tasks"] == 2
+            assert mirror.high_water("1") == 2000
+
+            workspace["tasks"]["1"] = {
+                "id": "1",
+                "name": "Renamed",
+                "date_updated": "3000",
+                "list": {"id": "100"},
+            }
+            (second,) = mirror.sync()
+
+            assert not second.full
+            assert second.upserted["tasks"] == 1
+            assert second.high_water == 3000
+            assert "date_updated_gt=0" in stub_api.calls[-1]["query"]
+            assert [task.name for task in mirror.tasks()] == ["Renamed", "Second"]
+
+    @pytest.mark.sync
+    def test_overlap_catches_tasks_updated_at_the_high_water_mark(self, stub_api, workspace, tmp_path, monkeypatch):
+        monkeypatch.setattr(sync, "TASK_CHUNK", 1)
+        with client.ClickUpClient(API_KEY) as c, WorkspaceMirror(
+            c, str(tmp_path / "mirror.db"), concurrency=4, overlap=500
+        ) as mirror:
+            mirror.sync()
+            workspace["tasks"]["3"] = {"id": "3", "name": "Late", "date_updated": "2000", "list": {"id": "100"}}
+            (report,) = mirror.sync()
+
+            assert report.upserted["tasks"] == 1
+            assert report.high_water == 2000
+            assert "date_updated_gt=1500" in stub_api.calls[-1]["query"]
+            assert {task.id for task in mirror.tasks()} == {"1", "2", "3"}
+
+    @pytest.mark.sync
+    def test_closed_tasks_are_mirrored(self, stub_api, workspace, tmp_path):
+        workspace["tasks"]["3"] = {
+            "id": "3",
+            "name": "Done",
+            "date_updated": "2500",
+            "list": {"id": "100"},
+            "status": {"status": "complete", "type": "closed"},
+        }
+        with client.ClickUpClient(API_KEY) as c, WorkspaceMirror(c, str(tmp_path / "mirror.db")) as mirror:
+            (report,) = mirror.sync()
+
+            assert report.upserted["tasks"] == 3
+            assert "include_closed=true" in stub_api.calls[-1]["query"]
+            assert [task.status.status for task in mirror.tasks() if task.id == "3"] == ["complete"]
+
+    @pytest.mark.sync
+    def test_removals(self, stub_api, workspace, tmp_path):
+        with client.ClickUpClient(API_KEY) as c, WorkspaceMirror(c, str(tmp_path / "mirror.db")) as mirror:
+            mirror.sync()
+            workspace["lists"].pop()
+            del workspace["tasks"]["2"]
+            (report,) = mirror.sync()
+
+            assert report.removed["lists"] == 1
+            assert report.removed["tasks"] == 1
+            assert [task.id for task in mirror.tasks(team_id="1")] == ["1"]
+
+            del workspace["tasks"]["1"]
+            (report,) = mirror.sync(full=True)
+            assert report.removed["tasks"] == 1
+            assert list(mirror.tasks()) == []
+            assert len(list(mirror.tasks(include_removed=True))) == 2
+
+            kinds = mirror.connection.execute("SELECT kind, id FROM deletions ORDER BY id").fetchall()
+            assert kinds == [("tasks", "1"), ("lists", "101"), ("tasks", "2")]
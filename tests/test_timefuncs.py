@@ -32,3 +32,75 @@ class TestTimeFuncs:
 
         t = timefuncs.fuzzy_time_to_seconds("1632603494")
         assert t == "1632603494"
+
+    @pytest.mark.timefuncs
+    def test_fuzzy_time_to_unix_fast_paths(self):
+        assert timefuncs.fuzzy_time_to_unix("1669852800000") == "1669852800000"
+        assert timefuncs.fuzzy_time_to_unix(1669852800000) == "1669852800000"
+        assert timefuncs.fuzzy_time_to_unix("2022-12-01") == str(int(datetime(2022, 12, 1).timestamp() * 1000))
+        assert timefuncs.fuzzy_time_to_unix("2022-12-01T10:00:00Z") == "1669888800000"
+        assert timefuncs.fuzzy_time_to_unix(datetime(2022, 12, 1)) == str(
+            int(datetime(2022, 12, 1).timestamp() * 1000)
+        )
+
+    @pytest.mark.timefuncs
+    def test_only_millisecond_lengths_take_the_timestamp_path(self, monkeypatch):
+        from types import ModuleType
+
+        calls = []
+        fake = ModuleType("timefhuman")
+
+        def parse(text, now):
+            calls.append(text)
+            return datetime(2022, 12, 1)
+
+        fake.timefhuman = parse
+        monkeypatch.setitem(__import__("sys").modules, "timefhuman", fake)
+        timefuncs._parse_fuzzy_time.cache_clear()
+
+        assert timefuncs.fuzzy_time_to_unix(" 166985280000 ") == "166985280000"
+        assert timefuncs.fuzzy_time_to_unix("20221201") == str(int(datetime(2022, 12, 1).timestamp() * 1000))
+        assert calls == ["20221201"]
+        timefuncs._parse_fuzzy_time.cache_clear()
+
+    @pytest.mark.timefuncs
+    def test_iso_dates_without_fromisoformat(self, monkeypatch):
+        monkeypatch.setattr(timefuncs, "_fromisoformat", None)
+        monkeypatch.setattr(timefuncs, "_parse_fuzzy_time", lambda text, interval, granularity: "parsed")
+
+        assert timefuncs.fuzzy_time_to_unix("2022-12-01") == "parsed"
+
+    @pytest.mark.timefuncs
+    def test_fuzzy_time_to_unix_caches_per_interval(self, monkeypatch):
+        from datetime import timedelta
+        from types import ModuleType
+
+        calls = []
+        fake = ModuleType("timefhuman")
+
+        def parse(text, now):
+            calls.append((text, now))
+            return now + timedelta(days=1)
+
+        fake.timefhuman = parse
+        monkeypatch.setitem(__import__("sys").modules, "timefhuman", fake)
+        monkeypatch.setattr(timefuncs.clock, "time", lambda: 1669852830.5)
+        timefuncs._parse_fuzzy_time.cache_clear()
+
+        first = timefuncs.fuzzy_time_to_unix("tomorrow")
+        assert timefuncs.fuzzy_time_to_unix("tomorrow") == first
+        assert first == str((1669852800 + 86400) * 1000)
+        assert len(calls) == 1
+
+        assert timefuncs.fuzzy_time_to_unix("tomorrow", granularity=1) == str((1669852830 + 86400) * 1000)
+        monkeypatch.setattr(timefuncs.clock, "time", lambda: 1669852870.0)
+        assert timefuncs.fuzzy_time_to_unix("tomorrow") == str((1669852860 + 86400) * 1000)
+        assert len(calls) == 3
+        timefuncs._parse_fuzzy_time.cache_clear()
+
+    @pytest.mark.timefuncs
+    def test_missing_parser_is_not_a_conversion_error(self, monkeypatch):
+        monkeypatch.setitem(__import__("sys").modules, "timefhuman", None)
+
+        with pytest.raises(ImportError):
+            timefuncs.fuzzy_time_to_unix("next tuesday")
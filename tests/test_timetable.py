@@ -0,0 +1,91 @@
+import pytest
+
+from clickupython import models
+
+numpy = pytest.importorskip("numpy")
+
+from clickupython.timetable import DAY_MS, TimeEntryTable  # noqa: E402
+
+DAY = 1650067200000  # 2022-04-16T00:00:00Z
+
+
+def entry(n, user, task, start, duration, tags=(), billable=False):
+    return {
+        "id": str(n),
+        "task": {"id": task, "name": f"Task {task}"},
+        "user": {"id": user, "username": f"User {user}"},
+        "billable": billable,
+        "start": str(start),
+        "end": str(start + duration),
+        "duration": str(duration),
+        "tags": [{"name": tag} for tag in tags],
+    }
+
+
+ENTRIES = [
+    entry(1, 183, "a", DAY + 1000, 600000, ["dev"], billable=True),
+    entry(2, 183, "a", DAY + 5000, 1200000, ["dev", "review"]),
+    entry(3, 184, "b", DAY + DAY_MS, 300000, billable=True),
+    entry(4, 184, "a", DAY + DAY_MS + 10, 900000, ["review"]),
+    {**entry(5, 183, "b", DAY + 2 * DAY_MS, 0), "duration": str(-(DAY + 2 * DAY_MS)), "end": ""},
+]
+
+
+class TestTimeEntryTable:
+    @pytest.mark.timetable
+    def test_columns(self):
+        table = TimeEntryTable.from_entries(ENTRIES)
+
+        assert len(table) == 5
+        assert table.start.dtype == numpy.int64
+        assert list(table.users) == ["183", "184"]
+        assert list(table.tasks[table.task_codes]) == ["a", "a", "b", "a", "b"]
+        assert list(table.running) == [False, False, False, False, True]
+        assert str(table.day[2]) == "2022-04-17"
+
+    @pytest.mark.timetable
+    def test_rollup_by_user(self):
+        totals = TimeEntryTable.from_entries(ENTRIES).rollup(
+            "user", statistics=("count", "sum", "mean", "min", "max"), percentiles=(50,)
+        )
+
+        assert list(totals["user"]) == ["183", "184"]
+        assert list(totals["count"]) == [2, 2]
+        assert list(totals["sum"]) == [1800000, 1200000]
+        assert list(totals["mean"]) == [900000, 600000]
+        assert list(totals["min"]) == [600000, 300000]
+        assert list(totals["max"]) == [1200000, 900000]
+        assert list(totals["p50"]) == [900000, 600000]
+
+    @pytest.mark.timetable
+    def test_rollup_by_several_keys(self):
+        table = TimeEntryTable.from_entries(ENTRIES)
+
+        by_day = table.rollup(["day", "billable"], statistics=("sum",))
+        assert [str(day) for day in by_day["day"]] == ["2022-04-16", "2022-04-16", "2022-04-17", "2022-04-17"]
+        assert list(by_day["billable"]) == [False, True, False, True]
+        assert list(by_day["sum"]) == [1200000, 600000, 900000, 300000]
+
+        by_tag = table.rollup("tag", statistics=("count", "sum"))
+        assert list(by_tag["tag"]) == ["dev", "review"]
+        assert list(by_tag["sum"]) == [1800000, 2100000]
+
+        by_task_tag = table.rollup(["task", "tag"], statistics=("sum",))
+        assert list(zip(by_task_tag["task"], by_task_tag["tag"])) == [("a", "dev"), ("a", "review")]
+
+    @pytest.mark.timetable
+    def test_filter_and_models(self):
+        entries = models.TimeTrackingDataList(data=ENTRIES)
+        table = TimeEntryTable.from_entries(entries)
+
+        billable = table.filter(table.billable)
+        assert len(billable) == 2
+        assert list(billable.rollup("tag")["tag"]) == ["dev"]
+        assert list(table.rollup("user")["sum"]) == [1800000, 1200000]
+
+    @pytest.mark.timetable
+    def test_empty(self):
+        totals = TimeEntryTable.from_entries([]).rollup("day", percentiles=(95,))
+
+        assert len(totals["day"]) == 0
+        assert len(totals["p95"]) == 0
@@ -0,0 +1,31 @@
+import time
+
+import pytest
+
+from clickupython import exceptions
+from clickupython import ratelimit
+from clickupython import tokens
+
+
+class TestTokenPool:
+    @pytest.mark.tokens
+    def test_selects_token_with_most_headroom(self):
+        limiter = ratelimit.TokenBucketRateLimiter(reset_buffer=0)
+        limiter.update("pk_a", 5, time.time() + 30)
+        limiter.update("pk_b", 50, time.time() + 30)
+        limiter.update("pk_c", 20, time.time() + 30)
+        pool = tokens.TokenPool(["pk_a", "pk_b", "pk_c"])
+
+        assert pool.select(limiter) == "pk_b"
+
+    @pytest.mark.tokens
+    def test_ties_rotate(self):
+        limiter = ratelimit.TokenBucketRateLimiter()
+        pool = tokens.TokenPool(["pk_a", "pk_b", "pk_c"])
+
+        assert {pool.select(limiter) for _ in range(3)} == {"pk_a", "pk_b", "pk_c"}
+
+    @pytest.mark.tokens
+    def test_empty_pool(self):
+        with pytest.raises(exceptions.ClickupClientError):
+            tokens.TokenPool([])